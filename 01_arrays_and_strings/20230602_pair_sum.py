@@ -29,7 +29,8 @@ def pair_sum(numbers, target):
 
 
 # Test variables
-test_numbers = [1,2,3,4,5,6]
-target_sum = 8
+if __name__ == "__main__":
+    test_numbers = [1,2,3,4,5,6]
+    target_sum = 8
 
-print(pair_sum(test_numbers, target_sum))
\ No newline at end of file
+    print(pair_sum(test_numbers, target_sum))
@@ -15,4 +15,5 @@ def is_prime(n: int) -> bool:
     return True # Only reaches this line if NONE of the above returns happened
 
 
-print(is_prime(100))
\ No newline at end of file
+if __name__ == "__main__":
+    print(is_prime(100))
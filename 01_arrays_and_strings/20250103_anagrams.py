@@ -48,4 +48,5 @@ def anagrams(s1: str, s2: str) -> bool:
             return False # Immediately sets the function to false on first valid comparison
     return isAnagram
 
-print(anagrams("potato", "otatop"))
\ No newline at end of file
+if __name__ == "__main__":
+    print(anagrams("potato", "otatop"))
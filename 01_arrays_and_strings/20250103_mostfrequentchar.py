@@ -43,4 +43,5 @@ def most_frequent_char(s: str) -> str:
             most_frequent_character = character
     return most_frequent_character
 
-print(most_frequent_char("satsuma"))
\ No newline at end of file
+if __name__ == "__main__":
+    print(most_frequent_char("satsuma"))
@@ -35,4 +35,5 @@ def pair_product(numbers: list, target_product: int) -> tuple:
         if element in map_of_quotient_to_indices and index != map_of_quotient_to_indices[element]:
             return index, map_of_quotient_to_indices[element]
 
-print(pair_product([4, 7, 9, 2, 5, 1], 5))
\ No newline at end of file
+if __name__ == "__main__":
+    print(pair_product([4, 7, 9, 2, 5, 1], 5))
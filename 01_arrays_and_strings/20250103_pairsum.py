@@ -41,5 +41,6 @@ def pair_sum(numbers: list, target_sum: int) -> tuple:
             return index, map_of_deltas_to_indices[element]
 
 
-numbers = [ i for i in range(1, 6001) ]
-print(pair_sum(numbers, 11999)) # -> (5998, 5999)
\ No newline at end of file
+if __name__ == "__main__":
+    numbers = [ i for i in range(1, 6001) ]
+    print(pair_sum(numbers, 11999)) # -> (5998, 5999)
@@ -30,4 +30,5 @@ def uncompress(s: str) -> str:
             temp_number = ""
     return resulting_word
 
-print(uncompress("3n12e2z")) 
+if __name__ == "__main__":
+    print(uncompress("3n12e2z"))
@@ -53,12 +53,13 @@ def compress(s: str) -> str:
     result += add_sequence(counter, previous_letter)
     return result
     
-test1 = "a"
-test2 = "abc"
-test3 = "aaaa"
-test4 = "aabcc"
+if __name__ == "__main__":
+    test1 = "a"
+    test2 = "abc"
+    test3 = "aaaa"
+    test4 = "aabcc"
 
-print(compress(test1))
-print(compress(test2)) 
-print(compress(test3)) 
-print(compress(test4))
\ No newline at end of file
+    print(compress(test1))
+    print(compress(test2)) 
+    print(compress(test3)) 
+    print(compress(test4))
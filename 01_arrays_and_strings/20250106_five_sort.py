@@ -41,20 +41,21 @@ def five_sort(list_a: list) -> list:
 
 # Testing
 
-test_case_d = five_sort([5, 5, 6, 5, 5, 5, 5]) # -> [6, 5, 5, 5, 5, 5, 5] 
-test_case_e = five_sort([5, 1, 2, 5, 5, 3, 2, 5, 1, 5, 5, 5, 4, 5]) # -> [4, 1, 2, 1, 2, 3, 5, 5, 5, 5, 5, 5, 5, 5] 
-test_case_a = five_sort([12, 5, 1, 5, 12, 7]) # -> [12, 7, 1, 12, 5, 5] 
-test_case_b = five_sort([5, 2, 5, 6, 5, 1, 10, 2, 5, 5]) # -> [2, 2, 10, 6, 1, 5, 5, 5, 5, 5] 
-test_case_c = five_sort([5, 5, 5, 1, 1, 1, 4]) # -> [4, 1, 1, 1, 5, 5, 5] 
-fours = [4] * 20000
-fives = [5] * 20000
-nums = fours + fives
-# test_case_f = five_sort(nums)
-# twenty-thousand 4s followed by twenty-thousand 5s -> [4, 4, 4, 4, ..., 5, 5, 5, 5]
-
-print(test_case_a)
-print(test_case_b)
-print(test_case_c)
-print(test_case_d)
-print(test_case_e)
-# print(test_case_f)
\ No newline at end of file
+if __name__ == "__main__":
+    test_case_d = five_sort([5, 5, 6, 5, 5, 5, 5]) # -> [6, 5, 5, 5, 5, 5, 5] 
+    test_case_e = five_sort([5, 1, 2, 5, 5, 3, 2, 5, 1, 5, 5, 5, 4, 5]) # -> [4, 1, 2, 1, 2, 3, 5, 5, 5, 5, 5, 5, 5, 5] 
+    test_case_a = five_sort([12, 5, 1, 5, 12, 7]) # -> [12, 7, 1, 12, 5, 5] 
+    test_case_b = five_sort([5, 2, 5, 6, 5, 1, 10, 2, 5, 5]) # -> [2, 2, 10, 6, 1, 5, 5, 5, 5, 5] 
+    test_case_c = five_sort([5, 5, 5, 1, 1, 1, 4]) # -> [4, 1, 1, 1, 5, 5, 5] 
+    fours = [4] * 20000
+    fives = [5] * 20000
+    nums = fours + fives
+    # test_case_f = five_sort(nums)
+    # twenty-thousand 4s followed by twenty-thousand 5s -> [4, 4, 4, 4, ..., 5, 5, 5, 5]
+
+    print(test_case_a)
+    print(test_case_b)
+    print(test_case_c)
+    print(test_case_d)
+    print(test_case_e)
+    # print(test_case_f)
@@ -53,16 +53,17 @@ def intersection(list_a: list, list_b: list) -> list:
     return results_list
 
 # Testing
-test_case_a = intersection([4,2,1,6], [3,6,9,2,10]) # -> [2,6] 
-test_case_b = intersection([2,4,6], [4,2]) # -> [2,4]
-test_case_c = intersection([4,2,1], [1,2,4,6]) # -> [1,2,4]
-test_case_d = intersection([0,1,2], [10,11]) # -> []
-a = [ i for i in range(0, 50000) ]
-b = [ i for i in range(0, 50000) ]
-# test_case_e = intersection(a, b) # -> [0,1,2,3,..., 49999]
+if __name__ == "__main__":
+    test_case_a = intersection([4,2,1,6], [3,6,9,2,10]) # -> [2,6] 
+    test_case_b = intersection([2,4,6], [4,2]) # -> [2,4]
+    test_case_c = intersection([4,2,1], [1,2,4,6]) # -> [1,2,4]
+    test_case_d = intersection([0,1,2], [10,11]) # -> []
+    a = [ i for i in range(0, 50000) ]
+    b = [ i for i in range(0, 50000) ]
+    # test_case_e = intersection(a, b) # -> [0,1,2,3,..., 49999]
 
-print(test_case_a)
-print(test_case_b)
-print(test_case_c)
-print(test_case_d)
-# print(test_case_e)
\ No newline at end of file
+    print(test_case_a)
+    print(test_case_b)
+    print(test_case_c)
+    print(test_case_d)
+    # print(test_case_e)
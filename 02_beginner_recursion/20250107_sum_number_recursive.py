@@ -43,20 +43,21 @@ def sum_numbers_recursive(numbers: list) -> int:
 
     return sum_numbers_recursive(numbers[:-1]) + numbers[len(numbers)-1]
 
-test_case_a = sum_numbers_recursive([5, 2, 9, 10]); # -> 26
-test_case_b = sum_numbers_recursive([1, -1, 1, -1, 1, -1, 1]); # -> 1
-test_case_c = sum_numbers_recursive([]); # -> 0
-test_case_d = sum_numbers_recursive([1000, 0, 0, 0, 0, 0, 1]); # -> 1001
-test_case_e = sum_numbers_recursive([700, 70, 7]); # -> 777
-test_case_f = sum_numbers_recursive([-10, -9, -8, -7, -6, -5, -4, -3, -2, -1]); # -> -55
-test_case_g = sum_numbers_recursive([0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0]); # -> 0
-test_case_h = sum_numbers_recursive([123456789, 12345678, 1234567, 123456, 12345, 1234, 123, 12, 1, 0]); # -> 137174205
-
-print(test_case_a)
-print(test_case_b)
-print(test_case_c)
-print(test_case_d)
-print(test_case_e)
-print(test_case_f)
-print(test_case_g)
-print(test_case_h)
\ No newline at end of file
+if __name__ == "__main__":
+    test_case_a = sum_numbers_recursive([5, 2, 9, 10]); # -> 26
+    test_case_b = sum_numbers_recursive([1, -1, 1, -1, 1, -1, 1]); # -> 1
+    test_case_c = sum_numbers_recursive([]); # -> 0
+    test_case_d = sum_numbers_recursive([1000, 0, 0, 0, 0, 0, 1]); # -> 1001
+    test_case_e = sum_numbers_recursive([700, 70, 7]); # -> 777
+    test_case_f = sum_numbers_recursive([-10, -9, -8, -7, -6, -5, -4, -3, -2, -1]); # -> -55
+    test_case_g = sum_numbers_recursive([0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0]); # -> 0
+    test_case_h = sum_numbers_recursive([123456789, 12345678, 1234567, 123456, 12345, 1234, 123, 12, 1, 0]); # -> 137174205
+
+    print(test_case_a)
+    print(test_case_b)
+    print(test_case_c)
+    print(test_case_d)
+    print(test_case_e)
+    print(test_case_f)
+    print(test_case_g)
+    print(test_case_h)
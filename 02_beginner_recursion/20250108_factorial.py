@@ -30,4 +30,5 @@ def factorial(number: int) -> int:
     
     return factorial(number - 1) * number
 
-print(factorial(3))
\ No newline at end of file
+if __name__ == "__main__":
+    print(factorial(3))
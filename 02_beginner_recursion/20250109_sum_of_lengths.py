@@ -34,4 +34,5 @@ def sum_of_lengths(strings: list) -> int:
     
     return len(strings[0])+ sum_of_lengths(strings[1:]) 
 
-print(sum_of_lengths(['goat','coat'])) # -> 13
+if __name__ == "__main__":
+    print(sum_of_lengths(['goat','coat'])) # -> 13
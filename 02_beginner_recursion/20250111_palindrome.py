@@ -88,8 +88,9 @@ def palindrome(string: str) -> bool:
 
 # Testing
 ## Test Cases
-test_cases = ["pop","kayak","pops","boot","rotator","abcbca",""]
+if __name__ == "__main__":
+    test_cases = ["pop","kayak","pops","boot","rotator","abcbca",""]
 
-# ## Invocation
-for string in test_cases: 
-    print(palindrome(string))
\ No newline at end of file
+    # ## Invocation
+    for string in test_cases: 
+        print(palindrome(string))
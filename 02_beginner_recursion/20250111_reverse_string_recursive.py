@@ -82,8 +82,9 @@ def reverse_string(string_a: str) -> str:
 
 # Testing
 ## Test Cases
-test_cases = ["hello","abcdefg","stopwatch",""]
+if __name__ == "__main__":
+    test_cases = ["hello","abcdefg","stopwatch",""]
 
-# ## Invocation
-for string in test_cases: 
-    print(reverse_string(string))
\ No newline at end of file
+    # ## Invocation
+    for string in test_cases: 
+        print(reverse_string(string))
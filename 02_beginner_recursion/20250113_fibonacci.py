@@ -53,8 +53,9 @@ def fibonacci(number: int) -> bool:
 
 # Testing
 ## Test Cases
-test_cases = [0,1,2,3,4,5,8]
+if __name__ == "__main__":
+    test_cases = [0,1,2,3,4,5,8]
 
-# ## Invocation
-for number in test_cases: 
-    print(fibonacci(number))
\ No newline at end of file
+    # ## Invocation
+    for number in test_cases: 
+        print(fibonacci(number))
@@ -1,7 +1,5 @@
-class Node:
-    def __init__(self, val):
-        self.val = val
-        self.next = None
+from structy.nodes import ListNode as Node
+from structy import array_list
 
 def linked_list_values (head: Node) -> list:
     """
@@ -73,8 +71,20 @@ def test_c():
 def test_d():
     return linked_list_values(None) # -> [ ]
 
-
-print(test_a())
-print(test_b())
-print(test_c())
-print(test_d())
\ No newline at end of file
+def test_e():
+    # The same walk over the Node compatible view of a structy.array_list.ArrayList
+    values = array_list.ArrayList.from_values(['a', 'b', 'c', 'd'])
+    return linked_list_values(values.head) # -> [ 'a', 'b', 'c', 'd' ]
+
+def test_f():
+    # The bulk version copies the values buffer instead of following .next
+    values = array_list.ArrayList.from_values(['x', 'y'])
+    return array_list.linked_list_values(values) # -> [ 'x', 'y' ]
+
+if __name__ == "__main__":
+    print(test_a())
+    print(test_b())
+    print(test_c())
+    print(test_d())
+    print(test_e())
+    print(test_f())
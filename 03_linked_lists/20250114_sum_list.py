@@ -1,7 +1,5 @@
-class Node:
-    def __init__(self, val):
-        self.val = val
-        self.next = None
+from structy.nodes import ListNode as Node
+from structy import array_list
 
 def sum_list (head: Node) -> list:
     """
@@ -72,7 +70,17 @@ def test_c():
 def test_d():
     return sum_list(None) # 0
 
-print(test_a())
-print(test_b())
-print(test_c())
-print(test_d())
\ No newline at end of file
+def test_e():
+    values = array_list.ArrayList.from_values([2, 8, 3, -1, 7])
+    return sum_list(values.head), array_list.sum_list(values) # -> (19, 19)
+
+def test_f():
+    return array_list.sum_list(array_list.ArrayList.from_values([])) # -> 0
+
+if __name__ == "__main__":
+    print(test_a())
+    print(test_b())
+    print(test_c())
+    print(test_d())
+    print(test_e())
+    print(test_f())
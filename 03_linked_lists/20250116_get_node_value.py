@@ -1,9 +1,7 @@
 from typing import Union
 
-class Node:
-    def __init__(self, val):
-        self.val = val
-        self.next = None
+from structy.nodes import ListNode as Node
+from structy import array_list
 
 def get_node_value (head: Node, index: int) -> Union[str, int]:
     """
@@ -106,9 +104,19 @@ def test_e():
 
     return get_node_value(node1, 1) # 'mango'
 
-
-print(test_a())
-print(test_b())
-print(test_c())
-print(test_d())
-print(test_e())
\ No newline at end of file
+def test_f():
+    values = array_list.ArrayList.from_values(['a', 'b', 'c', 'd'])
+    return get_node_value(values.head, 2), array_list.get_node_value(values, 2) # -> ('c', 'c')
+
+def test_g():
+    values = array_list.ArrayList.from_values(['a', 'b', 'c', 'd'])
+    return array_list.get_node_value(values, 7) # -> None
+
+if __name__ == "__main__":
+    print(test_a())
+    print(test_b())
+    print(test_c())
+    print(test_d())
+    print(test_e())
+    print(test_f())
+    print(test_g())
@@ -1,9 +1,7 @@
 from typing import Union
 
-class Node:
-    def __init__(self, val):
-        self.val = val
-        self.next = None
+from structy.nodes import ListNode as Node
+from structy import array_list
 
 def linked_list_find (head: Node, target: Union[str, int]) -> bool:
     """
@@ -105,10 +103,20 @@ def test_f():
 
     return linked_list_find(node1, 100) # False
 
-
-print(test_a())
-print(test_b())
-print(test_c())
-print(test_d())
-print(test_e())
-print(test_f())
\ No newline at end of file
+def test_g():
+    values = array_list.ArrayList.from_values(['a', 'b', 'c', 'd'])
+    return linked_list_find(values.head, 'c'), array_list.linked_list_find(values, 'c') # -> (True, True)
+
+def test_h():
+    values = array_list.ArrayList.from_values(['a', 'b', 'c', 'd'])
+    return linked_list_find(values.head, 'q'), array_list.linked_list_find(values, 'q') # -> (False, False)
+
+if __name__ == "__main__":
+    print(test_a())
+    print(test_b())
+    print(test_c())
+    print(test_d())
+    print(test_e())
+    print(test_f())
+    print(test_g())
+    print(test_h())
@@ -1,7 +1,5 @@
-class Node:
-    def __init__(self, val):
-        self.val = val
-        self.next = None
+from structy.nodes import ListNode as Node
+from structy import array_list
 
 def reverse_list (head: Node) -> Node:
     """
@@ -74,6 +72,22 @@ def test_c():
 
     return reverse_list(p) # p
 
-print(test_a())
-print(test_b())
-print(test_c())
\ No newline at end of file
+def test_d():
+    # reverse_list relinks the nodes of a structy.array_list.ArrayList in its next array
+    values = array_list.ArrayList.from_values(['a', 'b', 'c', 'd', 'e', 'f'])
+    values.head = reverse_list(values.head)
+    return array_list.linked_list_values(values) # -> ['f', 'e', 'd', 'c', 'b', 'a']
+
+def test_e():
+    # Once compacted, the reversed list is contiguous again
+    values = array_list.ArrayList.from_values([1, 2, 3])
+    values.head = reverse_list(values.head)
+    values.compact()
+    return list(values.vals), values.contiguous # -> ([3, 2, 1], True)
+
+if __name__ == "__main__":
+    print(test_a())
+    print(test_b())
+    print(test_c())
+    print(test_d())
+    print(test_e())
@@ -1,7 +1,5 @@
-class Node:
-    def __init__(self, val):
-        self.val = val
-        self.next = None
+from structy.nodes import ListNode as Node
+from structy import array_list
 
 def is_univalue_list (head: Node) -> Node:
     """
@@ -117,9 +115,20 @@ def test_f():
 
     return is_univalue_list(u) # False
 
-print(test_a())
-print(test_b())
-print(test_c())
-print(test_d())
-print(test_e())
-print(test_f())
\ No newline at end of file
+def test_g():
+    values = array_list.ArrayList.from_values([7, 7, 7])
+    return is_univalue_list(values.head), array_list.is_univalue_list(values) # -> (True, True)
+
+def test_h():
+    values = array_list.ArrayList.from_values([7, 7, 4])
+    return is_univalue_list(values.head), array_list.is_univalue_list(values) # -> (False, False)
+
+if __name__ == "__main__":
+    print(test_a())
+    print(test_b())
+    print(test_c())
+    print(test_d())
+    print(test_e())
+    print(test_f())
+    print(test_g())
+    print(test_h())
@@ -1,7 +1,5 @@
-class Node:
-    def __init__(self, val):
-        self.val = val
-        self.next = None
+from structy.nodes import ListNode as Node
+from structy import array_list
 
 def longest_streak (head: Node) -> int:
     """
@@ -121,10 +119,20 @@ def test_e():
 def test_f():
     return longest_streak(None) # 0
 
-
-print(test_a())
-print(test_b())
-print(test_c())
-print(test_d())
-print(test_e())
-print(test_f())
\ No newline at end of file
+def test_g():
+    values = array_list.ArrayList.from_values([5, 5, 7, 7, 7, 6])
+    return longest_streak(values.head), array_list.longest_streak(values) # -> (3, 3)
+
+def test_h():
+    values = array_list.ArrayList.from_values(['a', 'a', 'b', 'a', 'a', 'a', 'a'])
+    return longest_streak(values.head), array_list.longest_streak(values) # -> (4, 4)
+
+if __name__ == "__main__":
+    print(test_a())
+    print(test_b())
+    print(test_c())
+    print(test_d())
+    print(test_e())
+    print(test_f())
+    print(test_g())
+    print(test_h())
@@ -1,18 +1,7 @@
 from typing import Union
 
-class Node:
-    def __init__(self, val):
-        self.val = val
-        self.next = None
-
-    def __str__(self):
-        # Convert the linked list to a string representation
-        current = self
-        values = []
-        while current is not None:
-            values.append(str(current.val))
-            current = current.next
-        return ' -> '.join(values)
+from structy.nodes import ListNode as Node
+from structy import array_list
 
 def insert_node (head: Node, value: Union[str, int], target_index: int) -> Node:
     """
@@ -127,7 +116,24 @@ def test_d():
     return insert_node(a, 'z', 0)
     # z -> a -> b
 
-print(test_a())
-print(test_b())
-print(test_c())
-print(test_d())
\ No newline at end of file
+def test_e():
+    # A new Node has no slot in the arrays of a structy.array_list.ArrayList, linking it is refused
+    values = array_list.ArrayList.from_values(['a', 'b', 'c', 'd'])
+    try:
+        return insert_node(values.head, 'x', 2)
+    except TypeError as error:
+        return type(error).__name__ # -> TypeError
+
+def test_f():
+    # Converted to Nodes, edited, and converted back
+    values = array_list.ArrayList.from_values(['a', 'b', 'c', 'd'])
+    values = array_list.ArrayList.from_nodes(insert_node(values.to_nodes(), 'x', 2))
+    return array_list.linked_list_values(values) # -> ['a', 'b', 'x', 'c', 'd']
+
+if __name__ == "__main__":
+    print(test_a())
+    print(test_b())
+    print(test_c())
+    print(test_d())
+    print(test_e())
+    print(test_f())
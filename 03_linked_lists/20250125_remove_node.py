@@ -1,18 +1,7 @@
 from typing import Union
 
-class Node:
-    def __init__(self, val):
-        self.val = val
-        self.next = None
-
-    def __str__(self):
-        # Convert the linked list to a string representation
-        current = self
-        values = []
-        while current is not None:
-            values.append(str(current.val))
-            current = current.next
-        return ' -> '.join(values)
+from structy.nodes import ListNode as Node
+from structy import array_list
 
 def remove_node (head: Node, target_val: Union[str, int]) -> Node:
     """
@@ -136,8 +125,16 @@ def test_e():
     return remove_node(t, "t")
     # None
 
-print(test_a())
-print(test_b())
-print(test_c())
-print(test_d())
-print(test_e())
\ No newline at end of file
+def test_f():
+    # remove_node only relinks existing nodes, so it runs on a structy.array_list.ArrayList view
+    values = array_list.ArrayList.from_values(['a', 'b', 'c', 'd', 'e', 'f'])
+    values.head = remove_node(values.head, 'c')
+    return array_list.linked_list_values(values) # -> ['a', 'b', 'd', 'e', 'f']
+
+if __name__ == "__main__":
+    print(test_a())
+    print(test_b())
+    print(test_c())
+    print(test_d())
+    print(test_e())
+    print(test_f())
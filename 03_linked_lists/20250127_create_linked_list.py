@@ -1,16 +1,4 @@
-class Node:
-    def __init__(self, val):
-        self.val = val
-        self.next = None
-
-    def __str__(self):
-        # Convert the linked list to a string representation
-        current = self
-        values = []
-        while current is not None:
-            values.append(str(current.val))
-            current = current.next
-        return ' -> '.join(values)
+from structy.nodes import ListNode as Node
 
 def create_linked_list (values: list) -> Node:
     """
@@ -66,7 +54,8 @@ def test_d():
 # null
 
 
-print(test_a())
-print(test_b())
-print(test_c())
-print(test_d())
\ No newline at end of file
+if __name__ == "__main__":
+    print(test_a())
+    print(test_b())
+    print(test_c())
+    print(test_d())
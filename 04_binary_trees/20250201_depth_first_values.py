@@ -1,8 +1,4 @@
-class Node:
-    def __init__(self, val):
-        self.val = val
-        self.left = None
-        self.right = None
+from structy.nodes import TreeNode as Node
 
 def depth_first_values (root: Node) -> list:
     """
@@ -147,8 +143,9 @@ def test_e():
     #   -> []
 
 
-print(test_a())
-print(test_b())
-print(test_c())
-print(test_d())
-print(test_e())
\ No newline at end of file
+if __name__ == "__main__":
+    print(test_a())
+    print(test_b())
+    print(test_c())
+    print(test_d())
+    print(test_e())
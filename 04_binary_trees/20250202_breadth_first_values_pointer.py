@@ -1,8 +1,4 @@
-class Node:
-    def __init__(self, val):
-        self.val = val
-        self.left = None
-        self.right = None
+from structy.nodes import TreeNode as Node
 
 def breadth_first_values (root: Node) -> list:
     """
@@ -164,8 +160,9 @@ def test_e():
     return breadth_first_values(None) 
     #    -> []
 
-print(test_a())
-print(test_b())
-print(test_c())
-print(test_d())
-print(test_e())
\ No newline at end of file
+if __name__ == "__main__":
+    print(test_a())
+    print(test_b())
+    print(test_c())
+    print(test_d())
+    print(test_e())
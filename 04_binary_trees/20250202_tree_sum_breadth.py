@@ -1,8 +1,5 @@
-class Node:
-    def __init__(self, val):
-        self.val = val
-        self.left = None
-        self.right = None
+from structy.nodes import TreeNode as Node
+from structy import array_tree
 
 def tree_sum (root: Node) -> int:
     """
@@ -123,7 +120,48 @@ def test_b():
 def test_c ():
     return tree_sum(None) # -> 0
 
+def test_d():
+    # The same tree stored as parallel arrays by structy.array_tree
+    a = Node(3)
+    b = Node(11)
+    c = Node(4)
+    d = Node(4)
+    e = Node(-2)
+    f = Node(1)
+
+    a.left = b
+    a.right = c
+    b.left = d
+    b.right = e
+    c.right = f
+
+    return array_tree.tree_sum(array_tree.ArrayTree.from_nodes(a)) # -> 21
+
+def test_e():
+    # Float values are kept in an array('d')
+    a = Node(1.5)
+    b = Node(2.5)
+    c = Node(-1)
+    d = Node(0.25)
+    e = Node(4)
+    f = Node(0.75)
+
+    a.left = b
+    a.right = c
+    b.left = d
+    b.right = e
+    c.right = f
+
+    return array_tree.tree_sum(array_tree.ArrayTree.from_nodes(a)) # -> 8.0
+
+def test_f():
+    return array_tree.tree_sum(array_tree.ArrayTree.from_nodes(None)) # -> 0
+
 
-print(test_a())
-print(test_b())
-print(test_c())
\ No newline at end of file
+if __name__ == "__main__":
+    print(test_a())
+    print(test_b())
+    print(test_c())
+    print(test_d())
+    print(test_e())
+    print(test_f())
@@ -1,8 +1,4 @@
-class Node:
-    def __init__(self, val):
-        self.val = val
-        self.left = None
-        self.right = None
+from structy.nodes import TreeNode as Node
 
 def tree_sum (root: Node) -> int:
     """
@@ -119,6 +115,7 @@ def test_c ():
     return tree_sum(None) # -> 0
 
 
-print(test_a())
-print(test_b())
-print(test_c())
\ No newline at end of file
+if __name__ == "__main__":
+    print(test_a())
+    print(test_b())
+    print(test_c())
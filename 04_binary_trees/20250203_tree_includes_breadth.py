@@ -1,10 +1,6 @@
 from typing import Union
 
-class Node:
-    def __init__(self, val):
-        self.val = val
-        self.left = None
-        self.right = None
+from structy.nodes import TreeNode as Node
 
 def tree_includes (root: Node, target: Union[str, int]) -> bool:
     """
@@ -197,9 +193,10 @@ def test_f ():
     return tree_includes(None, "b") # -> False
 
 
-print(test_a())
-print(test_b())
-print(test_c())
-print(test_d())
-print(test_e())
-print(test_f())
\ No newline at end of file
+if __name__ == "__main__":
+    print(test_a())
+    print(test_b())
+    print(test_c())
+    print(test_d())
+    print(test_e())
+    print(test_f())
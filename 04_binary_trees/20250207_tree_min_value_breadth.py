@@ -1,8 +1,5 @@
-class Node:
-    def __init__(self, val):
-        self.val = val
-        self.left = None
-        self.right = None
+from structy.nodes import TreeNode as Node
+from structy import array_tree
 
 def tree_min_value (root: Node) -> int:
     """
@@ -146,8 +143,45 @@ def test_d ():
 
     return tree_min_value(a) # -> 42
 
+def test_e():
+    # The same scan over the values buffer of a structy.array_tree.ArrayTree
+    a = Node(3)
+    b = Node(11)
+    c = Node(4)
+    d = Node(4)
+    e = Node(-2)
+    f = Node(1)
+
+    a.left = b
+    a.right = c
+    b.left = d
+    b.right = e
+    c.right = f
+
+    return array_tree.tree_min_value(array_tree.ArrayTree.from_nodes(a)) # -> -2
+
+def test_f():
+    # Values that are not numbers stay in a list
+    a = Node('m')
+    b = Node('q')
+    c = Node('c')
+    d = Node('x')
+    e = Node('b')
+    f = Node('k')
+
+    a.left = b
+    a.right = c
+    b.left = d
+    b.right = e
+    c.right = f
+
+    return array_tree.tree_min_value(array_tree.ArrayTree.from_nodes(a)) # -> b
+
 
-print(test_a())
-print(test_b())
-print(test_c())
-print(test_d())
\ No newline at end of file
+if __name__ == "__main__":
+    print(test_a())
+    print(test_b())
+    print(test_c())
+    print(test_d())
+    print(test_e())
+    print(test_f())
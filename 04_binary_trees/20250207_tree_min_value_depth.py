@@ -1,8 +1,4 @@
-class Node:
-    def __init__(self, val):
-        self.val = val
-        self.left = None
-        self.right = None
+from structy.nodes import TreeNode as Node
 
 def tree_min_value (root: Node) -> int:
     """
@@ -143,7 +139,8 @@ def test_d ():
     return tree_min_value(a) # -> 42
 
 
-print(test_a())
-print(test_b())
-print(test_c())
-print(test_d())
\ No newline at end of file
+if __name__ == "__main__":
+    print(test_a())
+    print(test_b())
+    print(test_c())
+    print(test_d())
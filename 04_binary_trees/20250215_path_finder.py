@@ -1,10 +1,6 @@
 from typing import Union
 
-class Node:
-    def __init__(self, val):
-        self.val = val
-        self.left = None
-        self.right = None
+from structy.nodes import TreeNode as Node
 
 def path_finder (root: Node, target: Union[str, int]) -> list:
     """
@@ -215,10 +211,11 @@ def test_g():
 
     return path_finder(root, 16281) # -> [0, 1, 2, 3, ..., 16280, 16281]
 
-print(test_a())
-print(test_b())
-print(test_c())
-print(test_d())
-print(test_e())
-print(test_f())
-print(test_g())
\ No newline at end of file
+if __name__ == "__main__":
+    print(test_a())
+    print(test_b())
+    print(test_c())
+    print(test_d())
+    print(test_e())
+    print(test_f())
+    print(test_g())
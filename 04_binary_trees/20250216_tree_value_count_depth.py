@@ -1,8 +1,4 @@
-class Node:
-    def __init__(self, val):
-        self.val = val
-        self.left = None
-        self.right = None
+from structy.nodes import TreeNode as Node
 
 def tree_value_count (root: Node, target: int) -> int:
     """
@@ -172,8 +168,9 @@ def test_d ():
 def test_e():
     return tree_value_count(None, 42) # -> 0
 
-print(test_a())
-print(test_b())
-print(test_c())
-print(test_d())
-print(test_e())
+if __name__ == "__main__":
+    print(test_a())
+    print(test_b())
+    print(test_c())
+    print(test_d())
+    print(test_e())
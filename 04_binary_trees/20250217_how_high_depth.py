@@ -1,8 +1,5 @@
-class Node:
-    def __init__(self, val):
-        self.val = val
-        self.left = None
-        self.right = None
+from structy.nodes import TreeNode as Node
+from structy import array_tree
 
 def how_high (root: Node) -> int:
     """
@@ -146,9 +143,37 @@ def test_d ():
 def test_e():
     return how_high(None) # -> -1
 
+def test_f():
+    # The height of a structy.array_tree.ArrayTree is its number of levels, less one
+    a = Node('a')
+    b = Node('b')
+    c = Node('c')
+    d = Node('d')
+    e = Node('e')
+    f = Node('f')
+
+    a.left = b
+    a.right = c
+    b.left = d
+    b.right = e
+    c.right = f
+    e.left = Node('g')
+
+    return array_tree.how_high(array_tree.ArrayTree.from_nodes(a)) # -> 3
+
+def test_g():
+    return array_tree.how_high(array_tree.ArrayTree.from_nodes(Node('a'))) # -> 0
+
+def test_h():
+    return array_tree.how_high(array_tree.ArrayTree.from_nodes(None)) # -> -1
+
 
-print(test_a())
-print(test_b())
-print(test_c())
-print(test_d())
-print(test_e())
\ No newline at end of file
+if __name__ == "__main__":
+    print(test_a())
+    print(test_b())
+    print(test_c())
+    print(test_d())
+    print(test_e())
+    print(test_f())
+    print(test_g())
+    print(test_h())
@@ -1,10 +1,7 @@
 from collections import deque
 
-class Node:
-    def __init__(self, val):
-        self.val = val
-        self.left = None
-        self.right = None
+from structy.nodes import TreeNode as Node
+from structy import array_tree
 
 def level_averages (root: Node) -> list:
     """
@@ -198,9 +195,51 @@ def test_d():
 def test_e():
     return level_averages(None) # -> [ ]
 
+def test_f():
+    # Every level of a structy.array_tree.ArrayTree is one slice of its values
+    a = Node(3)
+    b = Node(11)
+    c = Node(4)
+    d = Node(4)
+    e = Node(-2)
+    f = Node(1)
+
+    a.left = b
+    a.right = c
+    b.left = d
+    b.right = e
+    c.right = f
+
+    return array_tree.level_averages(array_tree.ArrayTree.from_nodes(a)) # -> [ 3, 7.5, 1 ]
+
+def test_g():
+    # Converted to arrays and back to nodes, the tree still has the same averages
+    a = Node(5)
+    b = Node(11)
+    c = Node(54)
+    d = Node(20)
+    e = Node(15)
+    f = Node(3)
+
+    a.left = b
+    a.right = c
+    b.left = d
+    b.right = e
+    c.right = f
+
+    tree = array_tree.ArrayTree.from_nodes(a)
+    return level_averages(tree.to_nodes()) == array_tree.level_averages(tree) # -> True
+
+def test_h():
+    return array_tree.level_averages(array_tree.ArrayTree.from_nodes(None)) # -> [ ]
+
 
-print(test_a())
-print(test_b())
-print(test_c())
-print(test_d())
-print(test_e())
\ No newline at end of file
+if __name__ == "__main__":
+    print(test_a())
+    print(test_b())
+    print(test_c())
+    print(test_d())
+    print(test_e())
+    print(test_f())
+    print(test_g())
+    print(test_h())
@@ -1,11 +1,7 @@
 from typing import Union
 from collections import deque
 
-class Node:
-    def __init__(self, val):
-        self.val = val
-        self.left = None
-        self.right = None
+from structy.nodes import TreeNode as Node
 
 def tree_levels (root: Node) -> list[list[Union[int, str]]]:
     """
@@ -169,7 +165,8 @@ def test_d():
     return tree_levels(None) # -> []
 
 
-print(test_a())
-print(test_b())
-print(test_c())
-print(test_d())
\ No newline at end of file
+if __name__ == "__main__":
+    print(test_a())
+    print(test_b())
+    print(test_c())
+    print(test_d())
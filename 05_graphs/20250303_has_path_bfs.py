@@ -1,4 +1,5 @@
 from collections import deque
+import structy.graph
 
 def has_path(graph, source, destination): 
     """
@@ -26,6 +27,10 @@ def has_path(graph, source, destination):
 
     """
 
+    # A prebuilt structy.graph.Graph is searched over its CSR arrays
+    if isinstance(graph, structy.graph.Graph):
+        return structy.graph.connected(graph, source, destination)
+
     """ 
     INITIAL THOUGHTS 
     * We can use the dictionary. 
@@ -130,10 +135,25 @@ def test_e():
 
     return has_path(graph, 'v', 'z') # False
 
+def test_f():
+    # A prebuilt structy.graph.Graph is searched over its CSR arrays
+    graph = structy.graph.Graph.from_adjacency({
+    'f': ['g', 'i'],
+    'g': ['h'],
+    'h': [],
+    'i': ['g', 'k'],
+    'j': ['i'],
+    'k': []
+    })
+
+    return has_path(graph, 'f', 'k'), has_path(graph, 'f', 'j'), has_path(graph, 'f', 'x') # (True, False, False)
+
 ### EXECUTE TESTS
 
-print(test_a())
-print(test_b())
-print(test_c())
-print(test_d())
-print(test_e())
\ No newline at end of file
+if __name__ == "__main__":
+    print(test_a())
+    print(test_b())
+    print(test_c())
+    print(test_d())
+    print(test_e())
+    print(test_f())
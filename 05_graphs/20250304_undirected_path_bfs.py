@@ -1,4 +1,5 @@
 from collections import deque
+import structy.graph
 
 def has_path(graph, source, destination): 
     """
@@ -26,6 +27,10 @@ def has_path(graph, source, destination):
 
     """
 
+    # A prebuilt structy.graph.Graph is searched over its CSR arrays
+    if isinstance(graph, structy.graph.Graph):
+        return structy.graph.connected(graph, source, destination)
+
     """ 
     INITIAL THOUGHTS 
     * We can use the dictionary. 
@@ -130,10 +135,26 @@ def test_e():
 
     return has_path(graph, 'v', 'z') # False
 
+def test_f():
+    # A prebuilt undirected structy.graph.Graph, every edge listed from both of its nodes
+    graph = structy.graph.Graph.from_adjacency({
+    'i': ['j', 'k'],
+    'j': ['i'],
+    'k': ['i', 'm', 'l'],
+    'l': ['k'],
+    'm': ['k'],
+    'n': ['o'],
+    'o': ['n']
+    }, directed=False)
+
+    return has_path(graph, 'j', 'm'), has_path(graph, 'm', 'j'), has_path(graph, 'i', 'o') # (True, True, False)
+
 ### EXECUTE TESTS
 
-print(test_a())
-print(test_b())
-print(test_c())
-print(test_d())
-print(test_e())
\ No newline at end of file
+if __name__ == "__main__":
+    print(test_a())
+    print(test_b())
+    print(test_c())
+    print(test_d())
+    print(test_e())
+    print(test_f())
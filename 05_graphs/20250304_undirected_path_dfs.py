@@ -1,3 +1,4 @@
+import structy.graph
 
 def undirected_path(edges, node_a, node_b): 
     """
@@ -24,6 +25,10 @@ def undirected_path(edges, node_a, node_b):
 
     """
 
+    # A prebuilt structy.graph.Graph skips building the adjacency list, for repeated queries on the same graph
+    if isinstance(edges, structy.graph.Graph):
+        return structy.graph.connected(edges, node_a, node_b)
+
     """ 
     INITIAL THOUGHTS 
     * We need to build up a dictionary of the edges to create an adjacency list.
@@ -193,14 +198,28 @@ def test_i():
 
 
 
+def test_j():
+    # A prebuilt structy.graph.Graph built from the same edges
+    graph = structy.graph.Graph.from_edges([
+    ('i', 'j'),
+    ('k', 'i'),
+    ('m', 'k'),
+    ('k', 'l'),
+    ('o', 'n')
+    ])
+
+    return undirected_path(graph, 'j', 'm'), undirected_path(graph, 'm', 'j'), undirected_path(graph, 'i', 'o') # -> (True, True, False)
+
 ### EXECUTE TESTS
 
-print(test_a())
-print(test_b())
-print(test_c())
-print(test_d())
-print(test_e())
-print(test_f())
-print(test_g())
-print(test_h())
-print(test_i())
\ No newline at end of file
+if __name__ == "__main__":
+    print(test_a())
+    print(test_b())
+    print(test_c())
+    print(test_d())
+    print(test_e())
+    print(test_f())
+    print(test_g())
+    print(test_h())
+    print(test_i())
+    print(test_j())
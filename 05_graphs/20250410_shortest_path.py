@@ -1,4 +1,5 @@
 from collections import deque
+import structy.graph
 
 def shortest_path(edges, node_A, node_B): 
     """
@@ -27,6 +28,9 @@ def shortest_path(edges, node_A, node_B):
 
     """
 
+    # A prebuilt structy.graph.Graph skips construct_graph, for repeated queries on the same graph
+    if isinstance(edges, structy.graph.Graph):
+        return structy.graph.distance(edges, node_A, node_B)
     
     ## APPROACH
     # We don't handle an empty graph
@@ -149,9 +153,24 @@ def test_e():
 
     return shortest_path(edges, 'b', 'g') # -> -1
 
+def test_f():
+    # A prebuilt structy.graph.Graph answers every query without rebuilding, 'h' has no edges
+    graph = structy.graph.Graph.from_edges([
+  ['a', 'c'],
+  ['a', 'b'],
+  ['c', 'b'],
+  ['c', 'd'],
+  ['b', 'd'],
+  ['e', 'd'],
+  ['g', 'f']
+], nodes=['h'])
+    return shortest_path(graph, 'a', 'e'), shortest_path(graph, 'b', 'g'), shortest_path(graph, 'h', 'a') # -> (3, -1, -1)
+
 ### EXECUTE TESTS
-print(test_a())
-print(test_b())
-print(test_c())
-print(test_d())
-print(test_e())
\ No newline at end of file
+if __name__ == "__main__":
+    print(test_a())
+    print(test_b())
+    print(test_c())
+    print(test_d())
+    print(test_e())
+    print(test_f())
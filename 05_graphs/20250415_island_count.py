@@ -1,3 +1,5 @@
+from structy.grid import LAND, as_grid, label_regions
+
 def island_count(grid): 
     """
     Function Purpose: 
@@ -7,7 +9,7 @@ def island_count(grid):
         An island is a vertically or horizontally connected region of land.
     
     Parameters:
-        grid (2d array): a list made up of lists that contain 'W' or 'L'
+        grid (2d array or Grid): a list made up of lists that contain 'W' or 'L', or a structy.grid.Grid
 
     Returns:
         int: The number of islands.
@@ -23,48 +25,17 @@ def island_count(grid):
 
     """
 
+    # Accept a Grid or a list of lists, every cell is then one byte of grid.cells
+    grid = as_grid(grid)
+
     # Handle the empty gride
-    if not grid or not grid[0]:
+    if not grid.cells:
         return 0
     
-    # Construct the grid
-    rows, columns = len(grid), len(grid[0]) 
-    # As the grid is square the length of grid[0] will return the height
-    
-    # Instantiate a set to track visited cells
-    # A set has o(1) lookup and can only contain unique values
-    visited = set() 
-    
-    # Instantiate a count and initialise it to 0
-    count = 0 
-
-    # Helper function to explore an island using DFS
-    def explore_island(row, column):
-        # Check if position is out of bounds, is water, or already visited
-        if ( 
-            row < 0 or row >= rows or column < 0 or column >= columns 
-            or 
-            grid[row][column] == 'W' 
-            or 
-            (row, column) in visited):
-            return
-        
-        visited.add((row, column))
-
-        # Explore in four directions (up, down, left, right)
-        explore_island(row - 1, column) # Up
-        explore_island(row + 1, column) # Down
-        explore_island(row, column - 1) # Left
-        explore_island(row, column + 1) # Right
-        
-    # Iterate through each cell in the grid
-    for row in range(rows):
-        for column in range(columns):
-            if grid[row][column] == 'L' and (row, column) not in visited:
-                count += 1 # Found a new island
-                explore_island(row, column) # Mark all cells in this island as visited
-
-    return count
+    # label_regions splits every row into runs of land and joins the runs that touch the row
+    # above with a union-find, so no cell is explored one at a time
+    # Each island is one region: the count is the number of regions
+    return len(label_regions(grid, LAND))
 
 ### TEST CASES
 def test_a():
@@ -105,7 +76,8 @@ def test_d():
    return island_count(grid) # -> 0
 
 ### EXECUTE TESTS
-print(test_a())
-print(test_b())
-print(test_c())
-print(test_d())
\ No newline at end of file
+if __name__ == "__main__":
+    print(test_a())
+    print(test_b())
+    print(test_c())
+    print(test_d())
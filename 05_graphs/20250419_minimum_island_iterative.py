@@ -1,5 +1,5 @@
-# To test the speed of the tests
-import time
+from test_runner import test_runner
+from structy.grid import LAND, as_grid, label_regions
 
 def minimum_island(grid): 
     """
@@ -10,7 +10,7 @@ def minimum_island(grid):
         You may assume that the grid contains at least one island.
     
     Parameters:
-        grid (2d array): a list made up of lists that contain 'W' or 'L'
+        grid (2d array or Grid): a list made up of lists that contain 'W' or 'L', or a structy.grid.Grid
 
     Returns:
         int: The size of smallest island. 
@@ -26,83 +26,24 @@ def minimum_island(grid):
 
     """
 
+    # Accept a Grid or a list of lists, every cell is then one byte of grid.cells
+    grid = as_grid(grid)
+
     # Handle the empty gride
-    if not grid or not grid[0]:
+    if not grid.cells:
         return 0
     
     # Instantiate a sentinel - initialised to infinity
     minimum_size = float('inf')
     
-    # Construct the grid
-    rows, columns = len(grid), len(grid[0]) 
-    # As the grid is square the length of grid[0] will return the height
-    
-    # Instantiate a set to track visited cells
-    # A set has o(1) lookup and can only contain unique values
-    visited = set() 
-    
-    # Declare a count and initialise it to 1
-    size_counter = [0] 
-
-    # Helper function to explore an island using DFS
-    def explore_island(row, column):
-        # Check if position is out of bounds, is water, or already visited
-        if ( 
-            row < 0 or row >= rows or column < 0 or column >= columns 
-            or 
-            grid[row][column] == 'W' 
-            or 
-            (row, column) in visited):
-            return
-        
-        visited.add((row, column))
-        size_counter[0] += 1 
-
-        # Explore in four directions (up, down, left, right)
-        explore_island(row - 1, column) # Up
-        explore_island(row + 1, column) # Down
-        explore_island(row, column - 1) # Left
-        explore_island(row, column + 1) # Right
-        
-    # Iterate through each cell in the grid
-    for row in range(rows):
-        for column in range(columns):
-            if grid[row][column] == 'L' and (row, column) not in visited:
-                # As size_counter is mutable and accessible in the global namespace
-                size_counter[0] = 0 # reset the counter before exploring a new island
-                explore_island(row, column)
-                current_island_size = size_counter[0] # capture the island's size
-                minimum_size = min(current_island_size, minimum_size)
+    # label_regions splits every row into runs of land and joins the runs that touch the row
+    # above with a union-find, so no cell is explored one at a time
+    # It returns the size of every island at once
+    for current_island_size in label_regions(grid, LAND).sizes:
+        minimum_size = min(current_island_size, minimum_size)
 
     return minimum_size
 
-### TEST RUNNER
-def test_runner(test_function, expected_result):
-    """
-    Runs a test function with timing and verification
-    
-    Args:
-        test_name: Name of the test for identification
-        test_func: Function to execute (should take no arguments)
-        expected_result: The expected result
-        
-    Returns:
-        String with test result and timing information
-    """
-    test_name = test_function.__name__  # Get the function name automatically
-    start_time = time.perf_counter()
-    actual = test_function()
-    execution_time = time.perf_counter() - start_time
-    
-    # Convert to microseconds for better precision with fast tests
-    execution_time_us = execution_time * 1_000_000
-
-    try:
-        assert actual == expected_result, f"Expected {expected_result}, got {actual}"
-        return f"✓ {test_name}: PASS - Result: {actual} (executed in {execution_time_us:.2f} microseconds)"
-    except AssertionError as e:
-        return f"✗ {test_name}: FAIL - {e} (executed in {execution_time_us:.2f} microseconds)"
-
 ### TEST CASES
 def test_a():
     grid = [
@@ -146,7 +87,8 @@ def test_d():
 
 
 ### EXECUTE TESTS
-print(test_runner(test_a, 2))
-print(test_runner(test_b, 1))
-print(test_runner(test_c, 9))
-print(test_runner(test_d, 1))
\ No newline at end of file
+if __name__ == "__main__":
+    print(test_runner(test_a, 2))
+    print(test_runner(test_b, 1))
+    print(test_runner(test_c, 9))
+    print(test_runner(test_d, 1))
@@ -1,6 +1,8 @@
 from test_runner import test_runner
 from collections import deque
 
+from structy.grid import CARROT, WALL, as_grid
+
 def closest_carrot(grid, starting_row, starting_column):
     """
     Function Purpose:
@@ -10,7 +12,7 @@ def closest_carrot(grid, starting_row, starting_column):
         You may move up, down, left, or right, but cannot pass through walls (X). If there is no possible path to a carrot, then return -1.
 
     Parameters:
-        * grid (2d array): a list made up of lists that contain 'X's are walls, 'O's are open spaces, and 'C's are carrots.
+        * grid (2d array or Grid): a list made up of lists that contain 'X's are walls, 'O's are open spaces, and 'C's are carrots, or a structy.grid.Grid
         * starting_row - an integer denoting the row of the starting cell (starting from 0)
         * starting_column - an integer denoting the column of the starting cell (starting from 0)
 
@@ -26,38 +28,36 @@ def closest_carrot(grid, starting_row, starting_column):
     Space Complexity:
         O(rc) product of the number of rows and columns
     """
+    # Accept a Grid or a list of lists, every cell is then one byte of grid.cells
+    grid = as_grid(grid)
+    cells = grid.cells
+
     # Handle the empty grid
-    if not grid or not grid[0]:
+    if not cells:
         return -1
 
-    # Construct the grid
-    rows, columns = len(grid), len(grid[0])
-
-    # Initialise queue and visited set
-    queue = deque([(starting_row, starting_column, 0)])
-    visited = {(starting_row, starting_column)}
+    # Initialise queue and visited bitmap with the flat index of the start
+    start = grid.index(starting_row, starting_column)
+    queue = deque([(start, 0)])
+    visited = grid.visited()
+    visited.add(start)
 
     # Breadth first search
     while queue:
-        row, column, distance = queue.popleft()
+        index, distance = queue.popleft()
 
         # Check if a carrot has been found
-        if grid[row][column] == "C":
+        if cells[index] == CARROT:
             return distance
 
-        # Check all four directions
-        directions = [(row-1, column), (row+1, column), (row, column-1), (row, column+1)]
-
-        for neighbor_row, neighbor_col in directions:
+        # Check all four directions, grid.neighbours only returns cells inside the grid
+        for neighbour in grid.neighbours(index):
             # Check if valid neighbor
-            if (0 <= neighbor_row < rows and
-                0 <= neighbor_col < columns and
-                grid[neighbor_row][neighbor_col] != 'X' and
-                (neighbor_row, neighbor_col) not in visited):
+            if cells[neighbour] != WALL and neighbour not in visited:
 
                 # Add to queue and mark as visited
-                queue.append((neighbor_row, neighbor_col, distance + 1))
-                visited.add((neighbor_row, neighbor_col))
+                queue.append((neighbour, distance + 1))
+                visited.add(neighbour)
 
     # If no carrot found
     return -1
@@ -144,11 +144,26 @@ def test_06():
 
   return closest_carrot(grid, 2, 2) # -> 5
 
+def test_07():
+  grid = [
+    ['O', 'O', 'X', 'O', 'O'],
+    ['O', 'X', 'X', 'X', 'O'],
+    ['O', 'X', 'C', 'C', 'O'],
+  ]
+
+  # Column 5 is past the edge of the grid, not the first cell of the next row
+  try:
+    return closest_carrot(grid, 1, 5)
+  except IndexError as error:
+    return type(error).__name__ # -> IndexError
+
 ### EXECUTE TESTS
-print(test_runner(test_00, 4))
-print(test_runner(test_01, 5))
-print(test_runner(test_02, 9))
-print(test_runner(test_03, 2))
-print(test_runner(test_04, -1))
-print(test_runner(test_05, -1))
-print(test_runner(test_06, 5))
\ No newline at end of file
+if __name__ == "__main__":
+    print(test_runner(test_00, 4))
+    print(test_runner(test_01, 5))
+    print(test_runner(test_02, 9))
+    print(test_runner(test_03, 2))
+    print(test_runner(test_04, -1))
+    print(test_runner(test_05, -1))
+    print(test_runner(test_06, 5))
+    print(test_runner(test_07, "IndexError"))
@@ -1,6 +1,9 @@
 from test_runner import test_runner
+from graphlib import CycleError
 from typing import Dict, List
 
+import structy.dag
+
 def longest_path(graph: Dict[str, List[str]]) -> int:
     """
     Function Purpose:
@@ -17,12 +20,19 @@ def longest_path(graph: Dict[str, List[str]]) -> int:
     Assumptions:
         * A path may start and end at any two nodes.
 
+    Raises:
+        graphlib.CycleError: when the graph has a cycle, with the nodes of one cycle as its second argument
+
     Time complexity:
         O(e) # traversal through the entire graph
 
     Space Complexity:
         O(n) # will mark all nodes as visited
     """
+    # A structy.dag.LongestPaths keeps the distances between edits, so the answer is already known
+    if isinstance(graph, structy.dag.LongestPaths):
+        return graph.longest
+
     # Handle the empty graph
     if not graph:
         return 0
@@ -41,17 +51,33 @@ def longest_path(graph: Dict[str, List[str]]) -> int:
 
         return stack[::-1] # Reverse the order
     
-    def dfs(current_node, visited, stack, graph):
+    def dfs(start_node, visited, stack, graph):
         # Marks the current node as visited
-        # Recursively visits all the unvisited neighbours
+        # Visits all the unvisited neighbours, on an explicit branch of (node, remaining neighbours)
+        # rather than by recursion, so a long path cannot reach the recursion limit
         # After all neighbours and their subtrees are processed, adds the current node to the stack
         # This creates a post-order traversal where nodes are added to the stack when all descendants 
         # have been processed
-        visited.add(current_node)
-        for neighbour in graph[current_node]:
-            if neighbour not in visited:     
-                dfs(neighbour, visited, stack, graph)
-        stack.append(current_node)
+        visited.add(start_node)
+        branch = [(start_node, iter(graph[start_node]))]
+        on_branch = {start_node} # the grey nodes: visited but not yet finished
+        while branch:
+            current_node, neighbours = branch[-1]
+            for neighbour in neighbours:
+                # A neighbour still on the current branch leads back to itself: the graph is not acyclic
+                if neighbour in on_branch:
+                    nodes = [node for node, _ in branch]
+                    raise CycleError("nodes are in a cycle", nodes[nodes.index(neighbour):] + [neighbour])
+                if neighbour not in visited:
+                    visited.add(neighbour)
+                    on_branch.add(neighbour)
+                    branch.append((neighbour, iter(graph[neighbour])))
+                    break
+            else:
+                # Every neighbour is finished, so the current node is too
+                branch.pop()
+                on_branch.remove(current_node)
+                stack.append(current_node)
             
     # Calculate longest path
     topological_order = topological_sort(graph)
@@ -146,9 +172,84 @@ def test_04():
 
     return longest_path(graph) # -> 25
 
+def test_05():
+    graph = {
+    'a': ['b'],
+    'b': ['c'],
+    'c': ['a'],
+    'x': ['a']
+    }
+
+    try:
+        return longest_path(graph)
+    except CycleError as error:
+        return error.args[1] # -> ['a', 'b', 'c', 'a']
+
+def test_06():
+    graph = {
+    'q': ['r'],
+    'r': ['s', 'u'],
+    's': ['t'],
+    't': ['u', 'r'],
+    'u': []
+    }
+
+    try:
+        return longest_path(graph)
+    except CycleError as error:
+        return error.args[1] # -> ['r', 's', 't', 'r']
+
+def test_07():
+    graph = {
+    'a': ['c', 'b'],
+    'b': ['c'],
+    'c': [],
+    'q': ['r'],
+    'r': ['s', 'u', 't'],
+    's': ['t'],
+    't': ['u'],
+    'u': []
+    }
+    paths = structy.dag.LongestPaths(graph)
+    # Joining the two parts only lengthens the paths through c: a -> b -> c -> q -> ... -> u
+    paths.add_edge('c', 'q')
+    return longest_path(paths) # -> 7
+
+def test_08():
+    # A ring of 2,000 nodes is deeper than the recursion limit, the cycle is still reported
+    graph = {node: [(node + 1) % 2000] for node in range(2000)}
+
+    try:
+        return longest_path(graph)
+    except CycleError as error:
+        cycle = error.args[1]
+        return len(cycle), cycle[:3], cycle[-1] # -> (2001, [0, 1, 2], 0)
+
+def test_09():
+    graph = {
+    'a': ['b'],
+    'b': ['c'],
+    'c': []
+    }
+    paths = structy.dag.LongestPaths(graph)
+    # Both edges are refused before anything changes: the self-loop leaves no 'new' node behind
+    refused = []
+    for node_A, node_B in [('new', 'new'), ('c', 'a')]:
+        try:
+            paths.add_edge(node_A, node_B)
+        except CycleError as error:
+            refused.append(error.args[1])
+    return refused, 'new' in paths, len(paths), longest_path(paths) # -> ([['new', 'new'], ['c', 'a', 'b', 'c']], False, 3, 2)
+
 ### EXECUTE TESTS
-print(test_runner(test_00, 2))
-print(test_runner(test_01, 4))
-print(test_runner(test_02, 2))
-print(test_runner(test_03, 3))
-print(test_runner(test_04, 25))
\ No newline at end of file
+if __name__ == "__main__":
+    print(test_runner(test_00, 2))
+    print(test_runner(test_01, 4))
+    print(test_runner(test_02, 2))
+    print(test_runner(test_03, 3))
+    print(test_runner(test_04, 25))
+    print(test_runner(test_05, ['a', 'b', 'c', 'a']))
+    print(test_runner(test_06, ['r', 's', 't', 'r']))
+    print(test_runner(test_07, 7))
+    print(test_runner(test_08, (2001, [0, 1, 2], 0)))
+    print(test_runner(test_09, ([['new', 'new'], ['c', 'a', 'b', 'c']], False, 3, 2)))
@@ -1,6 +1,9 @@
 from test_runner import test_runner
+from graphlib import CycleError
 from typing import Dict, List
 
+import structy.dag
+
 def longest_path(graph: Dict[str, List[str]]) -> int:
     """
     Function Purpose:
@@ -17,12 +20,19 @@ def longest_path(graph: Dict[str, List[str]]) -> int:
     Assumptions:
         * A path may start and end at any two nodes.
 
+    Raises:
+        graphlib.CycleError: when the graph has a cycle, with the nodes of one cycle as its second argument
+
     Time complexity:
         O(e) # traversal through the entire graph
 
     Space Complexity:
         O(n) # will mark all nodes as visited
     """
+    # A structy.dag.LongestPaths keeps the distances between edits, so the answer is already known
+    if isinstance(graph, structy.dag.LongestPaths):
+        return graph.longest
+
     
     # Locate terminal nodes -> a dead end is a 0 edge path
     # Store these distances from terminal nodes in a dictionary. This also tells you nodes visited.
@@ -45,20 +55,40 @@ def traverse_distance(graph, node, distances):
         return distances[node] # if we already know this node's longest path, return it
 
     # Otherwise, calculate the path length
-    max_length = 0
-
-    # Ask each neighbour about their longest path
-    for neighbour in graph[node]:
-        new_length = traverse_distance(graph, neighbour, distances)
-        
-        # Keep track of the best neighbor
-        if new_length > max_length:
-            max_length = new_length
-
-    # Our longest path is the edge to our best neighbour (1) plus their longest path
-    # Save this result so we don't recalculate it
-    distances[node] = 1 + max_length # return the length at the node rather than the neighbour
-    # i.e. 1 plus the node you're
+    # The nodes waiting for their neighbours' answers are kept on an explicit branch of
+    # [node, remaining neighbours, max_length so far] rather than on the call stack,
+    # so a long path cannot reach the recursion limit
+    branch = [[node, iter(graph[node]), 0]]
+    waiting = {node} # meeting a waiting node again means it is its own descendant: a cycle
+
+    while branch:
+        entry = branch[-1]
+
+        # Ask each neighbour about their longest path
+        for neighbour in entry[1]:
+            if neighbour in distances:
+                # Keep track of the best neighbor
+                if distances[neighbour] > entry[2]:
+                    entry[2] = distances[neighbour]
+            elif neighbour in waiting:
+                nodes = [waiting_node for waiting_node, _, _ in branch]
+                raise CycleError("nodes are in a cycle", nodes[nodes.index(neighbour):] + [neighbour])
+            else:
+                # Work out the neighbour's answer first, then carry on with the rest
+                waiting.add(neighbour)
+                branch.append([neighbour, iter(graph[neighbour]), 0])
+                break
+        else:
+            branch.pop()
+            waiting.remove(entry[0])
+
+            # Our longest path is the edge to our best neighbour (1) plus their longest path
+            # Save this result so we don't recalculate it
+            distances[entry[0]] = 1 + entry[2]
+
+            # and pass it up to the node that was waiting for it
+            if branch and distances[entry[0]] > branch[-1][2]:
+                branch[-1][2] = distances[entry[0]]
 
     return distances[node]
 
@@ -145,9 +175,76 @@ def test_04():
 
     return longest_path(graph) # -> 25
 
+def test_05():
+    # A node that is its own neighbour
+    graph = {
+    'a': ['b'],
+    'b': ['b']
+    }
+
+    try:
+        return longest_path(graph)
+    except CycleError as error:
+        return error.args[1] # -> ['b', 'b']
+
+def test_06():
+    # The cycle is only met after b already has its answer saved
+    graph = {
+    'a': ['b'],
+    'b': [],
+    'c': ['d'],
+    'd': ['e'],
+    'e': ['b', 'c']
+    }
+
+    try:
+        return longest_path(graph)
+    except CycleError as error:
+        return error.args[1] # -> ['c', 'd', 'e', 'c']
+
+def test_07():
+    # A chain of 3,000 nodes is deeper than the recursion limit
+    graph = {node: [node + 1] for node in range(2999)}
+    graph[2999] = []
+
+    return longest_path(graph) # -> 2999
+
+def test_08():
+    # A chain of 3,000 nodes whose end leads back to its middle: a cycle of 1,500 nodes
+    graph = {node: [node + 1] for node in range(2999)}
+    graph[2999] = [1500]
+
+    try:
+        return longest_path(graph)
+    except CycleError as error:
+        cycle = error.args[1]
+        return len(cycle), cycle[0], cycle[-2] # -> (1501, 1500, 2999)
+
+def test_09():
+    graph = {
+    'a': ['c', 'b'],
+    'b': ['c'],
+    'c': [],
+    'q': ['r'],
+    'r': ['s', 'u', 't'],
+    's': ['t'],
+    't': ['u'],
+    'u': []
+    }
+    # A structy.dag.LongestPaths built one edge at a time agrees with the whole adjacency list
+    paths = structy.dag.LongestPaths()
+    paths.add_edges([[node, neighbour] for node in reversed(list(graph)) for neighbour in graph[node]])
+    return longest_path(paths), longest_path(graph) # -> (4, 4)
+
 ### EXECUTE TESTS
-print(test_runner(test_00, 2))
-print(test_runner(test_01, 4))
-print(test_runner(test_02, 2))
-print(test_runner(test_03, 3))
-print(test_runner(test_04, 25))
\ No newline at end of file
+if __name__ == "__main__":
+    print(test_runner(test_00, 2))
+    print(test_runner(test_01, 4))
+    print(test_runner(test_02, 2))
+    print(test_runner(test_03, 3))
+    print(test_runner(test_04, 25))
+    print(test_runner(test_05, ['b', 'b']))
+    print(test_runner(test_06, ['c', 'd', 'e', 'c']))
+    print(test_runner(test_07, 2999))
+    print(test_runner(test_08, (1501, 1500, 2999)))
+    print(test_runner(test_09, (4, 4)))
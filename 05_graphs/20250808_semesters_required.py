@@ -1,4 +1,5 @@
 from test_runner import test_runner
+from graphlib import CycleError
 
 def semesters_required(number_of_courses: int, prerequisite_map: list[tuple[int, int]]) -> int:
 
@@ -19,6 +20,9 @@ def semesters_required(number_of_courses: int, prerequisite_map: list[tuple[int,
     Returns:
         * int: the number of semesters required to complete all the courses given the prerequisite map. 
 
+    Raises:
+        * graphlib.CycleError: when the prerequisites contain a cycle, with the courses of one cycle as its second argument.
+
     Time complexity:
         O(tbd) # 
 
@@ -87,14 +91,36 @@ def semesters_required(number_of_courses: int, prerequisite_map: list[tuple[int,
             memo[course]=1
             return 1
 
-        # recursive case: 1 + max depth of all descendants
-        max_descendant_depth = 0 
-        for descendant in adjacency_list[course]:
-            max_descendant_depth = max(max_descendant_depth, dfs(descendant))
-
-        depth = 1 + max_descendant_depth
-        memo[course] = depth
-        return depth
+        # The courses waiting on their descendants are kept on an explicit branch of
+        # [course, remaining descendants, max_descendant_depth so far] rather than the call stack,
+        # so a long chain of prerequisites cannot reach the recursion limit
+        branch = [[course, iter(adjacency_list[course]), 0]]
+        waiting = {course}
+
+        while branch:
+            entry = branch[-1]
+            for descendant in entry[1]:
+                if descendant in memo:
+                    entry[2] = max(entry[2], memo[descendant])
+                # a course that is its own descendant can never be taken
+                elif descendant in waiting:
+                    courses = [waiting_course for waiting_course, _, _ in branch]
+                    raise CycleError("nodes are in a cycle", courses[courses.index(descendant):] + [descendant])
+                else:
+                    waiting.add(descendant)
+                    branch.append([descendant, iter(adjacency_list[descendant]), 0])
+                    break
+            else:
+                branch.pop()
+                waiting.remove(entry[0])
+
+                # recursive case: 1 + max depth of all descendants
+                depth = 1 + entry[2]
+                memo[entry[0]] = depth
+                if branch:
+                    branch[-1][2] = max(branch[-1][2], depth)
+
+        return memo[course]
     
     # Find tha maximum depth across all courses 
     max_semesters = 0
@@ -162,10 +188,37 @@ def test_05():
     ]
     return semesters_required(number_of_courses, prerequisite_map) # -> 2
 
+def test_06():
+    # 0 -> 1 -> 2 -> 0: none of the three can ever be taken
+    number_of_courses = 4
+    prerequisite_map = [
+    (0, 1),
+    (1, 2),
+    (2, 0),
+    (3, 0),
+    ]
+    try:
+        return semesters_required(number_of_courses, prerequisite_map)
+    except CycleError as error:
+        return error.args[1] # -> [0, 1, 2, 0]
+
+def test_07():
+    # A ring of 2,000 courses is deeper than the recursion limit, the cycle is still reported
+    number_of_courses = 2000
+    prerequisite_map = [(course, (course + 1) % 2000) for course in range(2000)]
+    try:
+        return semesters_required(number_of_courses, prerequisite_map)
+    except CycleError as error:
+        cycle = error.args[1]
+        return len(cycle), cycle[:3], cycle[-1] # -> (2001, [0, 1, 2], 0)
+
 ### EXECUTE TESTS
-print(test_runner(test_00, 3))
-print(test_runner(test_01, 5))
-print(test_runner(test_02, 2))
-print(test_runner(test_03, 1))
-print(test_runner(test_04, 3))
-print(test_runner(test_05, 2))
\ No newline at end of file
+if __name__ == "__main__":
+    print(test_runner(test_00, 3))
+    print(test_runner(test_01, 5))
+    print(test_runner(test_02, 2))
+    print(test_runner(test_03, 1))
+    print(test_runner(test_04, 3))
+    print(test_runner(test_05, 2))
+    print(test_runner(test_06, [0, 1, 2, 0]))
+    print(test_runner(test_07, (2001, [0, 1, 2], 0)))
@@ -1,4 +1,5 @@
 from test_runner import test_runner
+from graphlib import CycleError
 
 def semesters_required(number_of_courses: int, prerequisite_map: list[tuple[int, int]]) -> int:
 
@@ -19,6 +20,9 @@ def semesters_required(number_of_courses: int, prerequisite_map: list[tuple[int,
     Returns:
         * int: the number of semesters required to complete all the courses given the prerequisite map. 
 
+    Raises:
+        * graphlib.CycleError: when the prerequisites contain a cycle, with the courses of one cycle as its second argument.
+
     Time complexity:
         O(tbd) # 
 
@@ -83,15 +87,36 @@ def semesters_required(number_of_courses: int, prerequisite_map: list[tuple[int,
             return memo[course] # return the semesters required to complete if known
         
     # RECURSIVE CASE: We need to figure out this course's depth
-    # This line is doing A LOT - let's break it down:
+    # The courses waiting on their descendants go on an explicit branch of
+    # [course, remaining descendants, deepest descendant so far] instead of the call stack,
+    # so a long chain of prerequisites cannot reach the recursion limit:
     # 1. graph[course] gives us all courses that depend on this one
-    # 2. We recursively call dfs() on each descendant
-    # 3. max() finds the longest path among all descendants
-    # Note: If graph[course] is empty, max() would fail, but we pre-computed
-    # those cases, so this is safe!
+    # 2. A descendant without a memo entry is worked out first, the others count straight away
+    # 3. Once every descendant has one, the deepest of them plus one is the course's depth
+    # Note: A course whose graph[course] is empty never gets here, we pre-computed
+    # those cases
+        branch = [[course, iter(graph[course]), 0]]
+        waiting = {course} # a course met again while waiting is its own descendant: a cycle
+
+        while branch:
+            entry = branch[-1]
+            for descendant in entry[1]:
+                if descendant in memo:
+                    entry[2] = max(entry[2], memo[descendant])
+                elif descendant in waiting:
+                    courses = [waiting_course for waiting_course, _, _ in branch]
+                    raise CycleError("nodes are in a cycle", courses[courses.index(descendant):] + [descendant])
+                else:
+                    waiting.add(descendant)
+                    branch.append([descendant, iter(graph[descendant]), 0])
+                    break
+            else:
+                branch.pop()
+                waiting.remove(entry[0])
+                memo[entry[0]] = 1 + entry[2]
+                if branch:
+                    branch[-1][2] = max(branch[-1][2], memo[entry[0]])
 
-        max_descendant_depth = max(dfs(descendant) for descendant in graph[course])
-        memo[course] = 1 + max_descendant_depth
         return memo[course]
     
     return max(dfs(course) for course in range(number_of_courses))
@@ -155,10 +180,44 @@ def test_05():
     ]
     return semesters_required(number_of_courses, prerequisite_map) # -> 2
 
+def test_06():
+    # 0 -> 1 -> 2 -> 0: none of the three can ever be taken
+    number_of_courses = 4
+    prerequisite_map = [
+    (0, 1),
+    (1, 2),
+    (2, 0),
+    (3, 0),
+    ]
+    try:
+        return semesters_required(number_of_courses, prerequisite_map)
+    except CycleError as error:
+        return error.args[1] # -> [0, 1, 2, 0]
+
+def test_07():
+    # 3,000 courses in a chain, more layers than the recursion limit
+    number_of_courses = 3000
+    prerequisite_map = [(course, course + 1) for course in range(2999)]
+    return semesters_required(number_of_courses, prerequisite_map) # -> 3000
+
+def test_08():
+    # The same chain with its last course a prerequisite of course 1000: a cycle of 2,000 courses
+    number_of_courses = 3000
+    prerequisite_map = [(course, course + 1) for course in range(2999)] + [(2999, 1000)]
+    try:
+        return semesters_required(number_of_courses, prerequisite_map)
+    except CycleError as error:
+        cycle = error.args[1]
+        return len(cycle), cycle[0], cycle[-2] # -> (2001, 1000, 2999)
+
 ### EXECUTE TESTS
-print(test_runner(test_00, 3))
-print(test_runner(test_01, 5))
-print(test_runner(test_02, 2))
-print(test_runner(test_03, 1))
-print(test_runner(test_04, 3))
-print(test_runner(test_05, 2))
\ No newline at end of file
+if __name__ == "__main__":
+    print(test_runner(test_00, 3))
+    print(test_runner(test_01, 5))
+    print(test_runner(test_02, 2))
+    print(test_runner(test_03, 1))
+    print(test_runner(test_04, 3))
+    print(test_runner(test_05, 2))
+    print(test_runner(test_06, [0, 1, 2, 0]))
+    print(test_runner(test_07, 3000))
+    print(test_runner(test_08, (2001, 1000, 2999)))
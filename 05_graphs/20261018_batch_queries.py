@@ -0,0 +1,98 @@
+import structy.graph
+
+def shortest_paths(edges, queries):
+    """
+    Function Purpose:
+        A batched shortest_path: takes in a list of edges for an undirected graph and a list of (node_A, node_B) queries.
+        The function should return the length of the shortest path of every query, in order, -1 where there is no path.
+
+    Parameters:
+        edges (list of lists): a list that contains pairs of nodes each in a list, or a prebuilt structy.graph.Graph.
+        queries (list of tuples): (node_A, node_B) pairs, typically thousands sharing a few node_A.
+
+    Returns:
+        list of int: the number of edges on the shortest path of every query.
+
+    Assumptions:
+        * You can assume that every node of a query exists in the graph.
+
+    Time complexity:
+        O(e * s / 1024) for s distinct node_A, instead of O(e * q) for q separate shortest_path calls
+
+    Space Complexity:
+        O(n) one int of up to 1024 bits per node reached
+    """
+
+    ## APPROACH
+    # Every call of 20250410_shortest_path.py builds the graph and runs its own breadth first search.
+    # Here the graph is built once, the queries are grouped by node_A, and one breadth first search
+    # runs for up to 1024 sources at once: each node holds an int with a bit per source that has
+    # reached it, so a single pass over an edge carries every one of those searches across it.
+
+    ## IMPLEMENTATION
+    graph = edges if isinstance(edges, structy.graph.Graph) else structy.graph.Graph.from_edges(edges)
+    return structy.graph.batch_distance(graph, queries)
+
+def has_paths(graph, queries):
+    """
+    A batched has_path: returns whether there is a directed path for every (source, destination) query, in order.
+
+    Parameters:
+        graph (dictionary): the adjacency list of a directed graph, or a prebuilt structy.graph.Graph.
+        queries (list of tuples): (source, destination) pairs.
+
+    Returns:
+        list of bool: False where there is no path or a node is not in the graph.
+    """
+    if not isinstance(graph, structy.graph.Graph):
+        graph = structy.graph.Graph.from_adjacency(graph, directed=True)
+    return structy.graph.batch_connected(graph, queries)
+
+### TEST CASES
+
+def test_a():
+    edges = [
+  ['w', 'x'],
+  ['x', 'y'],
+  ['z', 'y'],
+  ['z', 'v'],
+  ['w', 'v']
+]
+    return shortest_paths(edges, [('w', 'z'), ('y', 'x'), ('w', 'w'), ('w', 'y')]) # -> [2, 1, 0, 2]
+
+def test_b():
+    edges = [
+  ['a', 'c'],
+  ['a', 'b'],
+  ['c', 'b'],
+  ['c', 'd'],
+  ['b', 'd'],
+  ['e', 'd'],
+  ['g', 'f']
+]
+    return shortest_paths(edges, [('a', 'e'), ('e', 'c'), ('b', 'g'), ('a', 'd'), ('g', 'f')]) # -> [3, 2, -1, 2, 1]
+
+def test_c():
+    graph = {
+    'f': ['g', 'i'],
+    'g': ['h'],
+    'h': [],
+    'i': ['g', 'k'],
+    'j': ['i'],
+    'k': []
+    }
+    return has_paths(graph, [('f', 'k'), ('f', 'j'), ('i', 'h'), ('j', 'h'), ('k', 'f'), ('f', 'x')]) # -> [True, False, True, True, False, False]
+
+def test_d():
+    # 1,100 sources in a ring of 1,100 nodes: more sources than one search carries
+    edges = [[node, (node + 1) % 1100] for node in range(1100)]
+    queries = [(node, (node + 3) % 1100) for node in range(1100)] + [(0, 550)]
+    distances = shortest_paths(edges, queries)
+    return set(distances[:-1]), distances[-1] # -> ({3}, 550)
+
+### EXECUTE TESTS
+if __name__ == "__main__":
+    print(test_a())
+    print(test_b())
+    print(test_c())
+    print(test_d())
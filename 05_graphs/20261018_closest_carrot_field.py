@@ -0,0 +1,150 @@
+from test_runner import test_runner
+
+import structy.graphs
+from structy.distance_field import DistanceField
+
+def closest_carrot(grid, starting_row, starting_column):
+    """
+    Function Purpose:
+        closest_carrot answered from a structy.distance_field.DistanceField: takes in a grid, a starting row, and a starting column.
+        In the grid, 'X's are walls, 'O's are open spaces, and 'C's are carrots.
+        The function should return a number representing the length of the shortest path from the starting position to a carrot.
+        You may move up, down, left, or right, but cannot pass through walls (X). If there is no possible path to a carrot, then return -1.
+
+    Parameters:
+        * grid (2d array, Grid or DistanceField): a list made up of lists that contain 'X's are walls, 'O's are open spaces, and 'C's are carrots, a structy.grid.Grid, or a prebuilt structy.distance_field.DistanceField of one
+        * starting_row - an integer denoting the row of the starting cell (starting from 0)
+        * starting_column - an integer denoting the column of the starting cell (starting from 0)
+
+    Returns:
+        int: the length of the shortest path from the starting position to a carrot
+
+    Assumptions:
+        * If there is no possible path to a carrot, then return -1.
+
+    Time complexity:
+        O(rc) product of the number of rows and columns to build the field from a grid, O(1) on a prebuilt DistanceField
+
+    Space Complexity:
+        O(rc) product of the number of rows and columns, O(1) on a prebuilt DistanceField
+    """
+
+    ## APPROACH
+    # 20250422_closest_carrot.py searches outwards from the start until it meets a carrot.
+    # A DistanceField searches outwards from every carrot at once and keeps the distance of every
+    # cell, so one field answers every start, and set_cell keeps it right as the grid changes.
+    # Building the field costs a whole search, so it only pays when it is passed in again.
+
+    ## IMPLEMENTATION
+    # A prebuilt DistanceField skips the search
+    if not isinstance(grid, DistanceField):
+        grid = DistanceField(grid)
+    return grid.distance(starting_row, starting_column)
+
+def field_agrees(field):
+    """
+    Returns whether the field gives the same distance as 20250422_closest_carrot.py from every cell of its grid.
+    """
+    rows = field.grid.to_rows()
+    return all(
+        field.distance(row, column) == structy.graphs.closest_carrot(rows, row, column)
+        for row in range(field.grid.rows)
+        for column in range(field.grid.columns)
+    )
+
+def build_field():
+    grid = [
+    ['O', 'O', 'O', 'O', 'O'],
+    ['O', 'X', 'O', 'O', 'O'],
+    ['O', 'X', 'X', 'O', 'O'],
+    ['O', 'X', 'C', 'O', 'O'],
+    ['O', 'X', 'X', 'O', 'O'],
+    ['C', 'O', 'O', 'O', 'O'],
+    ]
+    return DistanceField(grid)
+
+### TEST CASES
+def test_00():
+    grid = [
+    ['O', 'O', 'O', 'O', 'O'],
+    ['O', 'X', 'O', 'O', 'O'],
+    ['O', 'X', 'X', 'O', 'O'],
+    ['O', 'X', 'C', 'O', 'O'],
+    ['O', 'X', 'X', 'O', 'O'],
+    ['C', 'O', 'O', 'O', 'O'],
+    ]
+    return closest_carrot(grid, 1, 2) # -> 4
+
+def test_01():
+    grid = [
+    ['O', 'O', 'X', 'X', 'X'],
+    ['O', 'X', 'X', 'X', 'C'],
+    ['O', 'X', 'O', 'X', 'X'],
+    ['O', 'O', 'O', 'O', 'O'],
+    ['O', 'X', 'X', 'X', 'X'],
+    ['O', 'O', 'O', 'O', 'O'],
+    ['O', 'O', 'C', 'O', 'O'],
+    ['O', 'O', 'O', 'O', 'O'],
+    ]
+    return closest_carrot(grid, 3, 4) # -> 9
+
+def test_02():
+    grid = [
+    ['O', 'O', 'X', 'O', 'O'],
+    ['O', 'X', 'X', 'X', 'O'],
+    ['O', 'X', 'C', 'C', 'O'],
+    ]
+    return closest_carrot(grid, 2, 0) # -> -1
+
+def test_03():
+    # The initial field: every row of distances, -1 on the walls
+    field = build_field()
+    return [list(field.distances[row * 5:row * 5 + 5]) for row in range(6)], field_agrees(field) # -> ([[5, 6, 5, 4, 5], [4, -1, 4, 3, 4], [3, -1, -1, 2, 3], [2, -1, 0, 1, 2], [1, -1, -1, 2, 3], [0, 1, 2, 3, 4]], True)
+
+def test_04():
+    # Adding a carrot at the top left, then removing it again
+    field = build_field()
+    field.set_cell(0, 0, 'C')
+    added = field.distance(1, 2), field_agrees(field)
+    field.set_cell(0, 0, 'O')
+    return added, (field.distance(1, 2), field_agrees(field)) # -> ((3, True), (4, True))
+
+def test_05():
+    # Removing the carrot in the middle leaves the one in the corner
+    field = build_field()
+    field.set_cell(3, 2, 'O')
+    return field.distance(1, 2), field_agrees(field) # -> (8, True)
+
+def test_06():
+    # Adding walls next to both carrots sends the right hand side the long way round the top, then removing one again
+    field = build_field()
+    field.set_cell(5, 1, 'X')
+    field.set_cell(3, 3, 'X')
+    walled = field.distance(0, 4), field.distance(3, 4), field_agrees(field)
+    field.set_cell(3, 3, 'O')
+    return walled, (field.distance(0, 4), field.distance(3, 4), field_agrees(field)) # -> ((9, 12, True), (5, 2, True))
+
+def test_07():
+    # A start on a wall can still step off it, as in closest_carrot
+    field = build_field()
+    field.set_cell(1, 2, 'X')
+    return field.distance(1, 2), field.distance(0, 2), field_agrees(field) # -> (4, 5, True)
+
+def test_08():
+    # One prebuilt field answers many starts, including after an edit
+    field = build_field()
+    before = [closest_carrot(field, row, 4) for row in range(6)]
+    field.set_cell(0, 4, 'C')
+    return before, [closest_carrot(field, row, 4) for row in range(6)] # -> ([5, 4, 3, 2, 3, 4], [0, 1, 2, 2, 3, 4])
+
+### EXECUTE TESTS
+if __name__ == "__main__":
+    print(test_runner(test_00, 4))
+    print(test_runner(test_01, 9))
+    print(test_runner(test_02, -1))
+    print(test_runner(test_03, ([[5, 6, 5, 4, 5], [4, -1, 4, 3, 4], [3, -1, -1, 2, 3], [2, -1, 0, 1, 2], [1, -1, -1, 2, 3], [0, 1, 2, 3, 4]], True)))
+    print(test_runner(test_04, ((3, True), (4, True))))
+    print(test_runner(test_05, (8, True)))
+    print(test_runner(test_06, ((9, 12, True), (5, 2, True))))
+    print(test_runner(test_07, (4, 5, True)))
+    print(test_runner(test_08, ([5, 4, 3, 2, 3, 4], [0, 1, 2, 2, 3, 4])))
@@ -0,0 +1,120 @@
+from test_runner import test_runner
+from graphlib import CycleError
+from typing import Dict, List
+
+import structy.dag
+import structy.graph
+
+def critical_path(graph: Dict[str, List[str]], durations: Dict[str, float] = None, delays: Dict[tuple, float] = None) -> structy.dag.CriticalPath:
+    """
+    Function Purpose:
+        An extension of longest_path for scheduling: takes in an adjacency list for a directed acyclic graph of tasks,
+        where an edge A -> B means A must finish before B starts, with an optional duration for every task and
+        delay for every edge. The function should return the critical path, the chain of tasks that decides how long
+        the whole graph takes, and the slack of every task: how long it can slip without delaying the end.
+
+    Parameters:
+        * graph - an adjacency list for a directed acyclic graph, or a prebuilt directed structy.graph.Graph.
+        * durations - a dictionary of task -> duration, 0 for a missing task.
+        * delays - a dictionary of (task A, task B) -> the time between A finishing and B starting, 0 for a missing edge.
+
+    Returns:
+        structy.dag.CriticalPath: length (the time the whole graph takes), path (the critical tasks in order),
+        and earliest, latest and slack dictionaries of every task.
+
+    Assumptions:
+        * Without durations and delays, None or empty alike, every edge counts 1, so length is longest_path(graph) and path is a longest path.
+        * Durations and delays are not negative.
+
+    Raises:
+        graphlib.CycleError: when the graph has a cycle, with the tasks of one cycle as its second argument.
+
+    Time complexity:
+        O(n + e) # one topological order, then one sweep forwards and one backwards through it
+
+    Space Complexity:
+        O(n + e) # the CSR graph and the start times of every task
+    """
+
+    """
+    # Analysis
+    20250424_longest_path.py relaxes distances[neighbour] = max(distances[neighbour], distances[node] + 1)
+    in topological order. Putting the weights of the node and the edge in place of the + 1 gives the
+    earliest start of every task, and remembering which predecessor set it gives the path back.
+    Sweeping the same order backwards from the total length gives the latest start of every task, and
+    the difference between the two is its slack. Tasks on the critical path have none.
+    """
+
+    # A prebuilt structy.graph.Graph skips the conversion
+    if not isinstance(graph, structy.graph.Graph):
+        graph = structy.graph.Graph.from_adjacency(graph, directed=True)
+    return structy.dag.critical_path(graph, durations, delays)
+
+### TEST CASES
+def test_00():
+    graph = {
+    'a': ['c', 'b'],
+    'b': ['c'],
+    'c': [],
+    'q': ['r'],
+    'r': ['s', 'u', 't'],
+    's': ['t'],
+    't': ['u'],
+    'u': []
+    }
+
+    schedule = critical_path(graph)
+    return schedule.length, schedule.path # -> (4, ['q', 'r', 's', 't', 'u'])
+
+def build_pipeline():
+    graph = {
+    'compile': ['test', 'package'],
+    'lint': ['package'],
+    'docs': ['release'],
+    'test': ['release'],
+    'package': ['release'],
+    'release': []
+    }
+    durations = {'compile': 3, 'lint': 1, 'docs': 4, 'test': 5, 'package': 2, 'release': 1}
+    return graph, durations
+
+def test_01():
+    graph, durations = build_pipeline()
+    schedule = critical_path(graph, durations)
+    return schedule.length, schedule.path # -> (9, ['compile', 'test', 'release'])
+
+def test_02():
+    graph, durations = build_pipeline()
+    return critical_path(graph, durations).slack # -> {'compile': 0, 'lint': 5, 'docs': 4, 'test': 0, 'package': 3, 'release': 0}
+
+def test_03():
+    # Uploading the package takes 4 before the release can start: package is now on the critical path
+    graph, durations = build_pipeline()
+    schedule = critical_path(graph, durations, {('package', 'release'): 4})
+    return schedule.length, schedule.path # -> (10, ['compile', 'package', 'release'])
+
+def test_04():
+    graph = {
+    'a': ['b'],
+    'b': ['c'],
+    'c': ['a']
+    }
+
+    try:
+        return critical_path(graph)
+    except CycleError as error:
+        return error.args[1] # -> ['a', 'b', 'c', 'a']
+
+def test_05():
+    # Empty durations and delays count as none given: every edge still counts 1
+    graph, _ = build_pipeline()
+    return critical_path(graph, None, {}).length, critical_path(graph, {}, {}).length, critical_path(graph, {}).length # -> (2, 2, 2)
+
+### EXECUTE TESTS
+if __name__ == "__main__":
+    print(test_runner(test_00, (4, ['q', 'r', 's', 't', 'u'])))
+    print(test_runner(test_01, (9, ['compile', 'test', 'release'])))
+    print(test_runner(test_02, {'compile': 0, 'lint': 5, 'docs': 4, 'test': 0, 'package': 3, 'release': 0}))
+    print(test_runner(test_03, (10, ['compile', 'package', 'release'])))
+    print(test_runner(test_04, ['a', 'b', 'c', 'a']))
+    print(test_runner(test_05, (2, 2, 2)))
@@ -0,0 +1,109 @@
+from test_runner import test_runner
+from structy.grid import LAND, as_grid, flood_fill
+
+def minimum_island(grid): 
+    """
+    Function Purpose: 
+        Write a function, minimum_island, that takes in a grid containing Ws and Ls. 
+        W represents water and L represents land. The function should return the size of the smallest island. 
+
+        You may assume that the grid contains at least one island.
+    
+    Parameters:
+        grid (2d array or Grid): a list made up of lists that contain 'W' or 'L', or a structy.grid.Grid
+
+    Returns:
+        int: The size of smallest island. 
+        
+    Assumptions: 
+        * An island is a vertically or horizontally connected region of land. 
+
+    Time complexity: 
+        O(rc) product of the number of rows and columns
+
+    Space Complexity: 
+        O(rc) product of the number of rows and columns
+
+    """
+
+    # Accept a Grid or a list of lists, every cell is then one byte of grid.cells
+    grid = as_grid(grid)
+    cells = grid.cells
+
+    # Handle the empty gride
+    if not cells:
+        return 0
+    
+    # Instantiate a sentinel - initialised to infinity
+    minimum_size = float('inf')
+    
+    # Instantiate a bitmap to track visited cells by their flat index
+    # One bit per cell instead of a (row, column) tuple in a set
+    visited = grid.visited()
+
+    # Iterate through each cell in the grid
+    for index in range(len(cells)):
+        if cells[index] == LAND and index not in visited:
+            # flood_fill returns the size of the island, as explore_island does in
+            # 20250419_minimum_island_recursive.py, but keeps the cells still to explore on an
+            # explicit stack: the recursive explore_island raises RecursionError on islands of
+            # more than about 1000 cells
+            current_island_size = flood_fill(grid, index, visited)
+            minimum_size = min(current_island_size, minimum_size)
+
+    return minimum_size
+
+### TEST CASES
+def test_a():
+    grid = [
+  ['W', 'L', 'W', 'W', 'W'],
+  ['W', 'L', 'W', 'W', 'W'],
+  ['W', 'W', 'W', 'L', 'W'],
+  ['W', 'W', 'L', 'L', 'W'],
+  ['L', 'W', 'W', 'L', 'L'],
+  ['L', 'L', 'W', 'W', 'W'],
+]
+    return minimum_island(grid)
+
+def test_b():
+    grid = [
+  ['L', 'W', 'W', 'L', 'W'],
+  ['L', 'W', 'W', 'L', 'L'],
+  ['W', 'L', 'W', 'L', 'W'],
+  ['W', 'W', 'W', 'W', 'W'],
+  ['W', 'W', 'L', 'L', 'L'],
+]
+    return minimum_island(grid)
+
+
+def test_c():
+    grid = [
+  ['L', 'L', 'L'],
+  ['L', 'L', 'L'],
+  ['L', 'L', 'L'],
+]
+    return minimum_island(grid)
+
+
+def test_d():
+    grid = [
+  ['W', 'W'],
+  ['L', 'L'],
+  ['W', 'W'],
+  ['W', 'L']
+]
+    return minimum_island(grid)
+
+def test_e():
+    # One island of 3,600 cells, more than the recursive explore_island can reach
+    grid = [['L'] * 60 for _ in range(60)]
+    return minimum_island(grid)
+
+
+### EXECUTE TESTS
+if __name__ == "__main__":
+    print(test_runner(test_a, 2))
+    print(test_runner(test_b, 1))
+    print(test_runner(test_c, 9))
+    print(test_runner(test_d, 1))
+    print(test_runner(test_e, 3600))
@@ -0,0 +1,160 @@
+from test_runner import test_runner
+from graphlib import CycleError
+
+from structy.dag import course_graph, topological_layers
+
+def semesters_required(number_of_courses: int, prerequisite_map: list[tuple[int, int]]) -> int:
+
+    """
+    Function Purpose:
+        Write a function, semesters_required, that takes in a number of courses (n) and a list of prerequisites as arguments. Courses have ids ranging from 0 through n - 1. A single prerequisite of (A, B) means that course A must be taken before course B. Return the minimum number of semesters required to complete all n courses. There is no limit on how many courses you can take in a single semester, as long as the prerequisites of a course are satisfied before taking it.
+
+    Constraints: 
+        * Given prerequisite (A, B), you cannot take course A and course B concurrently in the same semester. You must take A in some semester before B.
+    
+    Assumptions:
+        * You can assume that it is possible to eventually complete all courses.
+
+    Parameters:
+        * number_of_courses - the number of courses to complete.
+        * prerequisite_map - a list of tuples where each tuple is a map defining an antecdent and its decendent. 
+
+    Returns:
+        * int: the number of semesters required to complete all the courses given the prerequisite map. 
+
+    Time complexity:
+        O(n + e) every course and prerequisite is handled once
+
+    Space Complexity:
+        O(n + e) the graph and the in-degree of every course
+    """
+
+    """
+    # Analysis
+    The dfs of 20250808_semesters_required.py and 20250809_semesters_required_v2.py works backwards
+    from every course, holding the whole chain of prerequisites below it on its stack.
+
+    Kahn's algorithm works forwards instead:
+    1. The courses without prerequisites can all be taken in the first semester.
+    2. Taking a semester's courses satisfies one prerequisite of each of their descendants. A course
+       whose prerequisites are all satisfied (its in-degree reaches 0) is taken the next semester.
+    3. The number of semesters is the number of layers, and the layers are the plan.
+    """
+
+    return len(semester_plan(number_of_courses, prerequisite_map))
+
+def semester_plan(number_of_courses: int, prerequisite_map: list[tuple[int, int]]) -> list[list[int]]:
+    """
+    Returns the courses to take in each semester, earliest first, finishing in the fewest semesters.
+
+    Raises:
+        graphlib.CycleError: when the prerequisites contain a cycle, with the courses of one cycle as its second argument
+    """
+    # BASE CASES
+    if number_of_courses == 0: 
+        return []
+
+    # Every course is a node, every prerequisite (A, B) an edge A -> B
+    graph = course_graph(number_of_courses, prerequisite_map)
+    return topological_layers(graph)
+
+### TEST CASES
+def test_00():
+    number_of_courses = 6
+    prerequisite_map = [
+    (1, 2),
+    (2, 4),
+    (3, 5),
+    (0, 5),
+    ]
+    return semesters_required(number_of_courses, prerequisite_map) # -> 3
+
+def test_01():
+    number_of_courses = 7
+    prerequisite_map = [
+    (4, 3),
+    (3, 2),
+    (2, 1),
+    (1, 0),
+    (5, 2),
+    (5, 6),
+    ]
+    return semesters_required(number_of_courses, prerequisite_map) # -> 5
+
+def test_02():
+    number_of_courses = 5
+    prerequisite_map = [
+    (1, 0),
+    (3, 4),
+    (1, 2),
+    (3, 2),
+    ]
+    return semesters_required(number_of_courses, prerequisite_map) # -> 2
+
+def test_03():
+    number_of_courses = 12
+    prerequisite_map = []
+    return semesters_required(number_of_courses, prerequisite_map) # -> 1
+
+
+def test_04():
+    number_of_courses = 3
+    prerequisite_map = [
+    (0, 2),
+    (0, 1),
+    (1, 2),
+    ]
+    return semesters_required(number_of_courses, prerequisite_map) # -> 3
+
+def test_05():
+    number_of_courses = 6
+    prerequisite_map = [
+    (3, 4),
+    (3, 0),
+    (3, 1),
+    (3, 2),
+    (3, 5),
+    ]
+    return semesters_required(number_of_courses, prerequisite_map) # -> 2
+
+def test_06():
+    number_of_courses = 6
+    prerequisite_map = [
+    (1, 2),
+    (2, 4),
+    (3, 5),
+    (0, 5),
+    ]
+    return semester_plan(number_of_courses, prerequisite_map) # -> [[0, 1, 3], [2, 5], [4]]
+
+def test_07():
+    # 10,000 courses in a line, far past the recursion limit of the dfs versions
+    number_of_courses = 10_000
+    prerequisite_map = [(course, course + 1) for course in range(number_of_courses - 1)]
+    return semesters_required(number_of_courses, prerequisite_map) # -> 10000
+
+def test_08():
+    # 0 -> 1 -> 2 -> 0: none of the three can ever be taken
+    number_of_courses = 4
+    prerequisite_map = [
+    (0, 1),
+    (1, 2),
+    (2, 0),
+    (3, 0),
+    ]
+    try:
+        return semesters_required(number_of_courses, prerequisite_map)
+    except CycleError as error:
+        return error.args[1] # -> [0, 1, 2, 0]
+
+### EXECUTE TESTS
+if __name__ == "__main__":
+    print(test_runner(test_00, 3))
+    print(test_runner(test_01, 5))
+    print(test_runner(test_02, 2))
+    print(test_runner(test_03, 1))
+    print(test_runner(test_04, 3))
+    print(test_runner(test_05, 2))
+    print(test_runner(test_06, [[0, 1, 3], [2, 5], [4]]))
+    print(test_runner(test_07, 10000))
+    print(test_runner(test_08, [0, 1, 2, 0]))
@@ -0,0 +1,209 @@
+import structy.graph
+
+def shortest_path(edges, node_A, node_B):
+    """
+    Function Purpose:
+        Write a function, shortest_path, that takes in a list of edges for an undirected graph and two nodes (node_A, node_B).
+        The function should return the length of the shortest path between node_A and node_B.
+        Consider the length as the number of edges in the path, not the number of nodes.
+        If there is no path between A and B, then return -1.
+
+    Parameters:
+        edges (list of lists): a list that contains pairs of nodes each in a list.
+        node_A (str): the source node
+        node_B (str): the destination node
+
+    Returns:
+        int: The number of edges traversed.
+
+    Assumptions:
+        * You can assume that A and B exist as nodes in the graph.
+
+    Time complexity:
+        O(e) number of edges
+
+    Space Complexity:
+        O(n) number of nodes
+
+    """
+
+    # A prebuilt structy.graph.Graph skips construct_graph, for repeated queries on the same graph
+    if isinstance(edges, structy.graph.Graph):
+        return structy.graph.distance(edges, node_A, node_B)
+
+    ## APPROACH
+    # The same breadth first search as 20250410_shortest_path.py, run from both ends at once.
+    # A one sided search at distance d has explored about b^d nodes (b the fan-out),
+    # two searches meeting in the middle explore about 2 * b^(d/2).
+
+    ## IMPLEMENTATION
+    graph = construct_graph(edges)
+    return bidirectional_search(graph, node_A, node_B)
+
+def bidirectional_search(graph, node_A, node_B):
+    """
+    Returns the number of edges on the shortest path between node_A and node_B in an adjacency list, -1 when there is none.
+    """
+    if node_A == node_B:
+        return 0
+
+    # Each side keeps the distance of every node it has reached and its current frontier
+    distances_A = {node_A: 0}
+    distances_B = {node_B: 0}
+    frontier_A = [node_A]
+    frontier_B = [node_B]
+
+    while frontier_A and frontier_B:
+        # Grow the smaller frontier by one whole level
+        if len(frontier_A) > len(frontier_B):
+            frontier_A, frontier_B = frontier_B, frontier_A
+            distances_A, distances_B = distances_B, distances_A
+
+        shortest = -1
+        next_frontier = []
+        for node in frontier_A:
+            distance = distances_A[node] + 1
+            for neighbour in graph[node]:
+                # The two searches meet: a path through this edge
+                if neighbour in distances_B:
+                    length = distance + distances_B[neighbour]
+                    if shortest == -1 or length < shortest:
+                        shortest = length
+                if neighbour not in distances_A:
+                    distances_A[neighbour] = distance
+                    next_frontier.append(neighbour)
+
+        # Every path found in this level is checked before answering, the first meeting is not always the shortest
+        if shortest != -1:
+            return shortest
+        frontier_A = next_frontier
+
+    # One side ran out of nodes without meeting the other: there is no path between A and B
+    return -1
+
+# Create adjaceny list
+def construct_graph(edges):
+    """
+    Convert a list of edges into an adjacency list representation.
+    For undirected graphs, each edge is added in both directions.
+    """
+    graph = {}
+    for start, end in edges:
+        # Ensure both nodes exist as keys in the graph
+        if start not in graph:
+            graph[start] = []
+        if end not in graph:
+            graph[end] = []
+
+        graph[start].append(end) # add both edges to the dictionary
+        graph[end].append(start)
+
+    return graph
+
+### TEST CASES
+
+def test_a():
+    edges = [
+  ['w', 'x'],
+  ['x', 'y'],
+  ['z', 'y'],
+  ['z', 'v'],
+  ['w', 'v']
+]
+    return shortest_path(edges, 'w', 'z') # -> 2
+
+def test_b():
+    edges = [
+  ['w', 'x'],
+  ['x', 'y'],
+  ['z', 'y'],
+  ['z', 'v'],
+  ['w', 'v']
+]
+
+    return shortest_path(edges, 'y', 'x') # -> 1
+
+def test_c():
+    edges = [
+  ['a', 'c'],
+  ['a', 'b'],
+  ['c', 'b'],
+  ['c', 'd'],
+  ['b', 'd'],
+  ['e', 'd'],
+  ['g', 'f']
+]
+
+    return shortest_path(edges, 'a', 'e') # -> 3
+
+def test_d():
+    edges = [
+  ['a', 'c'],
+  ['a', 'b'],
+  ['c', 'b'],
+  ['c', 'd'],
+  ['b', 'd'],
+  ['e', 'd'],
+  ['g', 'f']
+]
+    return shortest_path(edges, 'e', 'c') # -> 2
+
+def test_e():
+    edges = [
+  ['a', 'c'],
+  ['a', 'b'],
+  ['c', 'b'],
+  ['c', 'd'],
+  ['b', 'd'],
+  ['e', 'd'],
+  ['g', 'f']
+]
+
+    return shortest_path(edges, 'b', 'g') # -> -1
+
+def test_f():
+    edges = [
+  ['a', 'b'],
+  ['b', 'c'],
+  ['c', 'd'],
+  ['d', 'e'],
+  ['e', 'f']
+]
+
+    return shortest_path(edges, 'a', 'a') # -> 0
+
+def test_g():
+    edges = [
+  ['a', 'b'],
+  ['b', 'c'],
+  ['c', 'd'],
+  ['d', 'e'],
+  ['a', 'x'],
+  ['x', 'e']
+]
+
+    return shortest_path(edges, 'a', 'e') # -> 2
+
+def test_h():
+    # A prebuilt structy.graph.Graph answers every query without rebuilding, 'h' has no edges
+    graph = structy.graph.Graph.from_edges([
+  ['a', 'c'],
+  ['a', 'b'],
+  ['c', 'b'],
+  ['c', 'd'],
+  ['b', 'd'],
+  ['e', 'd'],
+  ['g', 'f']
+], nodes=['h'])
+    return shortest_path(graph, 'a', 'e'), shortest_path(graph, 'b', 'g'), shortest_path(graph, 'h', 'a') # -> (3, -1, -1)
+
+### EXECUTE TESTS
+if __name__ == "__main__":
+    print(test_a())
+    print(test_b())
+    print(test_c())
+    print(test_d())
+    print(test_e())
+    print(test_f())
+    print(test_g())
+    print(test_h())
@@ -71,5 +71,6 @@ def breadth_first_deque_print(graph, starter_node):
         for neighbour in graph[current_node]:
             queue.append(neighbour)
 
-breadth_first_deque_print(graph, "a")
-# Output visalised: https://treeconverter.com/?input=[[%22a%22,%22b%22],+[%22a%22,%22c%22],+[%22b%22,%22d%22],+[%22c%22,%22e%22],[%22d%22,+%22f%22]]
\ No newline at end of file
+if __name__ == "__main__":
+    breadth_first_deque_print(graph, "a")
+    # Output visalised: https://treeconverter.com/?input=[[%22a%22,%22b%22],+[%22a%22,%22c%22],+[%22b%22,%22d%22],+[%22c%22,%22e%22],[%22d%22,+%22f%22]]
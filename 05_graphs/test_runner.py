@@ -1,28 +1,246 @@
+import gc
+import math
+import os
+import statistics
+import sys
 import time
+import tracemalloc
+from collections import Counter
+
+### BENCHMARK SETTINGS
+# Set STRUCTY_BENCHMARK=1 to switch every test_runner call into benchmark mode without editing the scripts.
+BENCHMARK_MODE = os.environ.get("STRUCTY_BENCHMARK", "") == "1"
+WARMUP_RUNS = 3 # calls thrown away so caches, allocators and lazy imports are warm
+SAMPLES = 30 # number of timed samples used for the statistics
+MIN_SAMPLE_TIME = 0.002 # seconds; each sample loops the call until it lasts at least this long
+
+### MEMORY SETTINGS
+# Set STRUCTY_MEMORY=1 to add a memory profile to every test_runner call.
+MEMORY_MODE = os.environ.get("STRUCTY_MEMORY", "") == "1"
+TOP_OBJECT_TYPES = 5 # object types listed in the report, most numerous first
 
 ### TEST RUNNER
-def test_runner(test_function, expected_result):
+def test_runner(test_function, expected_result, benchmark=None, memory=None):
     """
     Runs a test function with timing and verification
 
     Args:
-        test_name: Name of the test for identification
-        test_func: Function to execute (should take no arguments)
+        test_function: Function to execute (should take no arguments)
         expected_result: The expected result
+        benchmark: When True, time the function with warmup runs and repeated samples
+            instead of a single call. Defaults to the STRUCTY_BENCHMARK environment variable.
+        memory: When True, add the peak memory, retained allocations and retained objects of
+            one extra call. Defaults to the STRUCTY_MEMORY environment variable.
 
     Returns:
         String with test result and timing information
     """
-    test_name = test_function.__name__  # Get the function name automatically
+    return format_record(test_record(test_function, expected_result, benchmark, memory))
+
+def test_record(test_function, expected_result, benchmark=None, memory=None):
+    """
+    Runs a test function like test_runner but returns the outcome as a dictionary instead of a string.
+
+    Returns:
+        dict: test (the function name), passed, expected, actual, time_us (the single verified
+            call in microseconds), benchmark (the run_benchmark statistics or None) and
+            memory (the measure_memory profile or None)
+    """
     start_time = time.perf_counter()
     actual = test_function()
     execution_time = time.perf_counter() - start_time
 
-    # Convert to microseconds for better precision with fast tests
-    execution_time_us = execution_time * 1_000_000
+    if benchmark is None:
+        benchmark = BENCHMARK_MODE
+    if memory is None:
+        memory = MEMORY_MODE
+
+    return {
+        "test": test_function.__name__,
+        "passed": actual == expected_result,
+        "expected": expected_result,
+        "actual": actual,
+        # Convert to microseconds for better precision with fast tests
+        "time_us": execution_time * 1_000_000,
+        "benchmark": run_benchmark(test_function) if benchmark else None,
+        # Profiled in a separate call: tracing every allocation slows the function down several times
+        "memory": measure_memory(test_function) if memory else None,
+    }
+
+def format_record(record):
+    """
+    Formats the dictionary returned by test_record as the line printed by test_runner.
+    """
+    if record["benchmark"]:
+        timing = format_statistics(record["benchmark"])
+    else:
+        timing = f"executed in {record['time_us']:.2f} microseconds"
+    if record["memory"]:
+        timing += f" | {format_memory(record['memory'])}"
+
+    if record["passed"]:
+        return f"✓ {record['test']}: PASS - Result: {record['actual']} ({timing})"
+    return f"✗ {record['test']}: FAIL - Expected {record['expected']}, got {record['actual']} ({timing})"
+
+### BENCHMARK
+def calibrate(test_function, min_sample_time=MIN_SAMPLE_TIME):
+    """
+    Finds how many calls are needed for one sample to last at least min_sample_time.
+
+    A single perf_counter() pair around a sub-microsecond call mostly measures the timer itself,
+    so every sample loops the call and divides the elapsed time by the number of loops.
+
+    Args:
+        test_function: Function to execute (should take no arguments)
+        min_sample_time: Minimum duration of one sample in seconds
+
+    Returns:
+        int: number of calls per sample
+    """
+    loops = 1
+    while True:
+        elapsed = time_loops(test_function, loops)
+        if elapsed >= min_sample_time:
+            return loops
+
+        # Jump close to the target rather than doubling from 1 for very fast functions
+        if elapsed > 0:
+            loops = max(loops * 2, math.ceil(loops * min_sample_time / elapsed))
+        else:
+            loops *= 10
+
+def time_loops(test_function, loops):
+    """
+    Returns the seconds taken to call test_function loops times in a row.
+    """
+    start_time = time.perf_counter()
+    for _ in range(loops):
+        test_function()
+    return time.perf_counter() - start_time
+
+def run_benchmark(test_function, warmup=WARMUP_RUNS, samples=SAMPLES, min_sample_time=MIN_SAMPLE_TIME):
+    """
+    Times a function statistically: warmup runs, an auto-calibrated repeat count and repeated samples.
+
+    Args:
+        test_function: Function to execute (should take no arguments)
+        warmup: Number of untimed calls made before measuring
+        samples: Number of timed samples
+        min_sample_time: Minimum duration of one sample in seconds, used to calibrate the loop count
+
+    Returns:
+        dict: per-call timings in microseconds (min, median, mean, p95, p99, stdev)
+            plus the number of samples and loops per sample
+
+    Time complexity:
+        O(s * l) calls of test_function where s is the number of samples and l the calibrated loops
+    """
+    for _ in range(warmup):
+        test_function()
+
+    loops = calibrate(test_function, min_sample_time)
+
+    # Per-call time of each sample in microseconds, sorted for the percentiles
+    timings = sorted(time_loops(test_function, loops) / loops * 1_000_000 for _ in range(samples))
+
+    return {
+        "min": timings[0],
+        "median": statistics.median(timings),
+        "mean": statistics.fmean(timings),
+        "p95": percentile(timings, 0.95),
+        "p99": percentile(timings, 0.99),
+        "stdev": statistics.stdev(timings) if len(timings) > 1 else 0.0,
+        "samples": len(timings),
+        "loops": loops,
+    }
+
+def percentile(sorted_values, fraction):
+    """
+    Returns the percentile of an already sorted list using linear interpolation between the closest ranks.
+
+    Args:
+        sorted_values: list of numbers in ascending order
+        fraction: the percentile as a fraction between 0 and 1 e.g. 0.95
+
+    Returns:
+        float: the interpolated value
+    """
+    if not sorted_values:
+        raise ValueError("percentile() requires at least one value")
+
+    position = (len(sorted_values) - 1) * fraction
+    lower = math.floor(position)
+    upper = math.ceil(position)
+    if lower == upper:
+        return sorted_values[lower]
+    weight = position - lower
+    return sorted_values[lower] * (1 - weight) + sorted_values[upper] * weight
+
+def format_statistics(stats):
+    """
+    Formats the dictionary returned by run_benchmark as a single line in microseconds.
+    """
+    return (
+        f"min {stats['min']:.3f} | median {stats['median']:.3f} | p95 {stats['p95']:.3f} "
+        f"| p99 {stats['p99']:.3f} | stdev {stats['stdev']:.3f} microseconds "
+        f"over {stats['samples']} samples x {stats['loops']} calls"
+    )
+
+### MEMORY PROFILE
+def measure_memory(test_function):
+    """
+    Profiles the memory of one call with tracemalloc and the garbage collector.
 
+    The peak covers everything the call allocated while it ran, including temporaries such as a
+    visited set or a queue that are freed before it returns. The retained figures cover what is
+    still alive afterwards, usually the result. Only container objects (lists, dicts, sets,
+    tuples, class instances such as Node) are tracked by the garbage collector, so ints and
+    strings are not in the object counts.
+
+    Args:
+        test_function: Function to execute (should take no arguments)
+
+    Returns:
+        dict: peak_bytes, retained_bytes, retained_blocks (allocated memory blocks still alive)
+            and objects, a Counter of the type names of the container objects still alive
+    """
+    gc.collect()
+    existing = {id(obj) for obj in gc.get_objects()}
+    blocks_before = sys.getallocatedblocks()
+
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    start_bytes = tracemalloc.get_traced_memory()[0]
     try:
-        assert actual == expected_result, f"Expected {expected_result}, got {actual}"
-        return f"✓ {test_name}: PASS - Result: {actual} (executed in {execution_time_us:.2f} microseconds)"
-    except AssertionError as e:
-        return f"✗ {test_name}: FAIL - {e} (executed in {execution_time_us:.2f} microseconds)"
\ No newline at end of file
+        result = test_function()
+        current_bytes, peak_bytes = tracemalloc.get_traced_memory()
+    finally:
+        if not was_tracing:
+            tracemalloc.stop()
+
+    retained_blocks = sys.getallocatedblocks() - blocks_before
+    # A plain loop rather than a generator expression, which would count its own closure
+    objects = Counter()
+    for obj in gc.get_objects():
+        if id(obj) not in existing and obj is not existing and obj is not objects:
+            objects[type(obj).__name__] += 1
+    del result
+
+    return {
+        "peak_bytes": peak_bytes - start_bytes,
+        "retained_bytes": current_bytes - start_bytes,
+        "retained_blocks": retained_blocks,
+        "objects": objects,
+    }
+
+def format_memory(stats, top=TOP_OBJECT_TYPES):
+    """
+    Formats the dictionary returned by measure_memory as a single line in KiB.
+    """
+    objects = ", ".join(f"{name} {count}" for name, count in stats["objects"].most_common(top))
+    return (
+        f"peak {stats['peak_bytes'] / 1024:.1f} KiB | retained {stats['retained_bytes'] / 1024:.1f} KiB "
+        f"in {stats['retained_blocks']} blocks | objects: {objects or 'none'}"
+    )
@@ -0,0 +1,34 @@
+"""
+Importable access to the solutions under stable names.
+
+    from structy.graphs import closest_carrot
+    import structy
+
+    structy.trees.tree_levels(root)            # the preferred variant
+    structy.trees.tree_levels_recursive(root)  # a specific one
+
+Each topic directory is a submodule: arrays (01_arrays_and_strings and 06_new_format), recursion,
+linked_lists, trees and graphs. Submodules are imported on first use, and a solution script is
+only executed the first time one of its functions is used, so importing one algorithm does not
+load the rest.
+
+The data structures shared by the solutions are plain modules: structy.nodes (ListNode, TreeNode),
+structy.array_tree (binary trees as parallel arrays), structy.array_list (linked lists as a
+values array and a next-index array), structy.grid (character grids as one bytearray),
+structy.distance_field (nearest carrot distances for every cell of a grid), structy.graph
+(graphs built once, with interned node ids and CSR adjacency), structy.union_find
+(connected components from a stream of edges) and structy.dag (topological layers of directed
+acyclic graphs).
+"""
+import importlib
+
+SUBMODULES = ("arrays", "recursion", "linked_lists", "trees", "graphs")
+
+def __getattr__(name):
+    if name in SUBMODULES:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    # A submodule already imported is also in globals()
+    return sorted(set(globals()) | set(SUBMODULES))
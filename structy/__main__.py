@@ -0,0 +1,32 @@
+"""
+Runs a solution script as `python script.py` would, with structy importable.
+
+`python script.py` only puts the script's own directory on sys.path, so a script that imports
+structy cannot find it. This entry point runs the script under the name "__main__" through
+structy._loader.execute_script, which puts the script's directory on sys.path as well, for
+test_runner, so its tests and demos print as usual.
+
+Usage (from the repository root):
+    python -m structy 05_graphs/20250415_island_count.py
+    python -m structy 03_linked_lists/20250114_sum_list.py
+"""
+import argparse
+import sys
+
+from structy._loader import execute_script
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m structy", description="Run a solution script with structy importable.")
+    parser.add_argument("script", help="path to the solution script")
+    parser.add_argument("arguments", nargs=argparse.REMAINDER, help="passed to the script in sys.argv")
+    arguments = parser.parse_args(argv)
+
+    saved_argv = sys.argv
+    sys.argv = [arguments.script] + arguments.arguments
+    try:
+        execute_script(arguments.script, sys.stdout, as_main=True)
+    finally:
+        sys.argv = saved_argv
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""
+Loads solution scripts by path and serves their functions as lazy module attributes.
+
+The topic directories start with digits and the scripts with dates, so they cannot be imported
+by name. Each structy submodule maps stable names to a script and function, and a script is only
+executed the first time one of its names is used.
+"""
+import contextlib
+import importlib.util
+import io
+import re
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+_loaded_modules = {}
+
+# Modules the scripts import from their own directory by a bare name (test_runner), by directory
+# and name. They are kept here instead of in sys.modules, where a top-level test_runner would
+# shadow any other module of that name.
+_sibling_modules = {}
+
+def execute_script(path, output, as_main=False):
+    """
+    Executes a solution script as a new module every time, without caching it.
+
+    The script's own directory is put on sys.path while it runs, as it would be when the script
+    is run directly (the graph scripts import test_runner that way). sys.path and sys.modules
+    are restored afterwards: the modules imported from the script's directory are kept privately
+    and handed to the next script of the same directory.
+
+    Args:
+        path: path to the solution script
+        output: file object receiving what the script prints
+        as_main: run it under the name "__main__", as `python script.py` would, so its demos run
+
+    Returns:
+        module: the executed module
+    """
+    path = Path(path).resolve()
+    module_name = "__main__" if as_main else "solution_" + re.sub(r"\W", "_", f"{path.parent.name}_{path.stem}")
+    spec = importlib.util.spec_from_file_location(module_name, path)
+    module = importlib.util.module_from_spec(spec)
+
+    directory = path.parent
+    siblings = {name: sibling for (folder, name), sibling in _sibling_modules.items() if folder == directory}
+    shadowed = {name: sys.modules.get(name) for name in siblings}
+    sys.modules.update(siblings)
+    imported_before = set(sys.modules)
+    saved_path = list(sys.path)
+    sys.path.insert(0, str(directory))
+    try:
+        with contextlib.redirect_stdout(output):
+            spec.loader.exec_module(module)
+    finally:
+        sys.path[:] = saved_path
+        for name in set(sys.modules) - imported_before:
+            file = getattr(sys.modules[name], "__file__", None)
+            if file is not None and Path(file).resolve().parent == directory:
+                _sibling_modules[(directory, name)] = sys.modules.pop(name)
+        for name, shadowed_module in shadowed.items():
+            if shadowed_module is None:
+                sys.modules.pop(name, None)
+            else:
+                sys.modules[name] = shadowed_module
+    return module
+
+def load_module(path):
+    """
+    Imports a solution script by path and caches it.
+
+    The demos sit behind `if __name__ == "__main__":` and do not run; anything printed while
+    loading is discarded.
+
+    Args:
+        path: path to the solution script
+
+    Returns:
+        module: the executed module
+    """
+    path = Path(path).resolve()
+    if path not in _loaded_modules:
+        _loaded_modules[path] = execute_script(path, io.StringIO())
+    return _loaded_modules[path]
+
+def lazy_solutions(module_name, directory, solutions):
+    """
+    Builds the module level __getattr__ and __dir__ of a structy submodule.
+
+    Args:
+        module_name: the submodule's __name__
+        directory: the topic directory of its scripts e.g. "05_graphs"
+        solutions: stable name -> (script file name, function name)
+
+    Returns:
+        tuple: (__getattr__, __dir__) for the submodule
+    """
+    def __getattr__(name):
+        if name not in solutions:
+            raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+        file_name, function_name = solutions[name]
+        function = getattr(load_module(REPO_ROOT / directory / file_name), function_name)
+        # Cache on the module so later lookups skip __getattr__
+        setattr(sys.modules[module_name], name, function)
+        return function
+
+    def __dir__():
+        return sorted(solutions)
+
+    return __getattr__, __dir__
@@ -0,0 +1,260 @@
+"""
+A singly linked list stored as a values array and a next-index array instead of Node objects.
+
+    import structy
+    from structy import array_list
+
+    values = array_list.ArrayList.from_values(range(1_000_000))
+    array_list.sum_list(values)
+    structy.linked_lists.linked_list_values(values.head)   # the Node solutions run on the view
+
+Node i has the value vals[i] and is followed by node next[i] (-1 at the tail). A list built from
+values is contiguous: node i + 1 follows node i, so sum_list, linked_list_find and
+is_univalue_list scan the values buffer in C instead of following next one node at a time, and
+longest_streak loops over the buffer.
+
+ArrayList.head is a Node compatible view with .val and .next, which the existing solutions can
+walk and even relink among its own nodes (reverse_list, remove_node). Linking in a new Node object
+(insert_node) raises TypeError: the arrays have no slot for it. A relinked list is no longer contiguous; the bulk functions
+then gather the values in list order first, or compact() lays the buffer out in order again.
+"""
+from array import array
+
+from structy.array_tree import compact_values
+from structy.nodes import ListNode
+
+class ListView:
+    """
+    A node of an ArrayList seen as a Node: reading and assigning .val and .next go to the arrays.
+
+    Views are created on demand, so two views of the same node are equal but not identical:
+    compare them with == rather than is.
+    """
+    __slots__ = ("owner", "index")
+
+    def __init__(self, owner, index):
+        self.owner = owner
+        self.index = index
+
+    @property
+    def val(self):
+        return self.owner.vals[self.index]
+
+    @val.setter
+    def val(self, value):
+        self.owner.vals[self.index] = value
+
+    @property
+    def next(self):
+        following = self.owner.next[self.index]
+        return None if following == -1 else ListView(self.owner, following)
+
+    @next.setter
+    def next(self, node):
+        self.owner.next[self.index] = self.owner.index_of(node)
+        self.owner.contiguous = False
+
+    def __eq__(self, other):
+        return isinstance(other, ListView) and other.owner is self.owner and other.index == self.index
+
+    def __hash__(self):
+        return hash((id(self.owner), self.index))
+
+    def __str__(self):
+        return ListNode.__str__(self)
+
+class ArrayList:
+    """
+    A linked list as a values array and a next-index array.
+
+    Attributes:
+        vals: node values, an array('q'), array('d') or list
+        next: array('q') of the index of the following node, -1 at the tail
+        head_index: index of the first node, -1 for an empty list
+        contiguous: True while the list order is vals order from index 0, which the bulk functions rely on
+    """
+    __slots__ = ("vals", "next", "head_index", "contiguous")
+
+    def __init__(self, vals, next_indexes, head_index, contiguous=False):
+        self.vals = vals
+        self.next = next_indexes
+        self.head_index = head_index
+        self.contiguous = contiguous
+
+    @classmethod
+    def from_values(cls, values):
+        """
+        Builds a contiguous list from an iterable of values, like create_linked_list.
+
+        Time complexity:
+            O(n)
+        """
+        vals = compact_values(list(values))
+        next_indexes = array("q", range(1, len(vals) + 1))
+        if vals:
+            next_indexes[-1] = -1
+        return cls(vals, next_indexes, 0 if vals else -1, contiguous=True)
+
+    @classmethod
+    def from_nodes(cls, head):
+        """
+        Converts a chain of Nodes into a contiguous list.
+        """
+        values = []
+        current = head
+        while current is not None:
+            values.append(current.val)
+            current = current.next
+        return cls.from_values(values)
+
+    @property
+    def head(self):
+        """
+        The first node as a Node compatible view, None for an empty list.
+        """
+        return None if self.head_index == -1 else ListView(self, self.head_index)
+
+    @head.setter
+    def head(self, node):
+        # e.g. values.head = reverse_list(values.head)
+        self.head_index = self.index_of(node)
+        self.contiguous = False
+
+    def index_of(self, node):
+        """
+        Returns the index of a view of one of this list's nodes, -1 for None.
+
+        Only nodes already in the arrays can be linked: a new Node object (as insert_node creates)
+        has no index to point at, so build such lists with to_nodes() and convert back with from_nodes().
+
+        Raises:
+            TypeError: when node is not a ListView, e.g. a ListNode
+            ValueError: when node is a view of another ArrayList
+        """
+        if node is None:
+            return -1
+        if not isinstance(node, ListView):
+            raise TypeError(
+                f"an ArrayList node can only link to another node of the same list, not a {type(node).__name__}; "
+                "use to_nodes() to edit it as Node objects"
+            )
+        if node.owner is not self:
+            raise ValueError("cannot link nodes of different ArrayLists")
+        return node.index
+
+    def __len__(self):
+        return len(self.ordered_values())
+
+    def ordered_values(self):
+        """
+        Returns the values in list order: the buffer itself while contiguous, otherwise gathered along next.
+        """
+        if self.contiguous:
+            return self.vals
+        values = []
+        index = self.head_index
+        while index != -1:
+            values.append(self.vals[index])
+            index = self.next[index]
+        return values
+
+    def compact(self):
+        """
+        Lays the buffer out in list order again, so the bulk functions scan it directly.
+        """
+        compacted = ArrayList.from_values(self.ordered_values())
+        self.vals, self.next, self.head_index, self.contiguous = compacted.vals, compacted.next, compacted.head_index, True
+
+    def to_nodes(self, node_class=ListNode):
+        """
+        Converts back to a chain of Nodes.
+
+        Returns:
+            the head node, or None for an empty list
+        """
+        sentinel = node_class(None)
+        tail = sentinel
+        for value in self.ordered_values():
+            tail.next = node_class(value)
+            tail = tail.next
+        return sentinel.next
+
+def linked_list_values(values):
+    """
+    Function Purpose:
+        Returns the values of the list in order, as a Python list.
+
+    Time complexity:
+        O(n), one copy of the buffer
+    """
+    return list(values.ordered_values())
+
+def sum_list(values):
+    """
+    Function Purpose:
+        Returns the sum of the values in the list, 0 for an empty list.
+
+    Time complexity:
+        O(n), one scan of the buffer
+    """
+    return sum(values.ordered_values())
+
+def linked_list_find(values, target):
+    """
+    Function Purpose:
+        Returns True when target is in the list.
+
+    Time complexity:
+        O(n), one scan of the buffer that stops at the first match
+    """
+    return target in values.ordered_values()
+
+def get_node_value(values, index):
+    """
+    Function Purpose:
+        Returns the value at position index, None when the list is shorter.
+
+    Time complexity:
+        O(1) while contiguous, O(index) otherwise
+    """
+    if values.contiguous:
+        return values.vals[index] if 0 <= index < len(values.vals) else None
+    ordered = values.ordered_values()
+    return ordered[index] if 0 <= index < len(ordered) else None
+
+def is_univalue_list(values):
+    """
+    Function Purpose:
+        Returns True when every value in the list is the same.
+
+    Assumptions:
+        The list is not empty, like the Node version
+
+    Time complexity:
+        O(n), one count over the buffer
+    """
+    ordered = values.ordered_values()
+    return ordered.count(ordered[0]) == len(ordered)
+
+def longest_streak(values):
+    """
+    Function Purpose:
+        Returns the length of the longest run of consecutive equal values, 0 for an empty list.
+
+    Time complexity:
+        O(n), one loop over the buffer (no .next hops)
+    """
+    ordered = values.ordered_values()
+    if not ordered:
+        return 0
+    longest = streak = 0
+    previous = ordered[0]
+    for value in ordered:
+        if value == previous:
+            streak += 1
+        else:
+            previous = value
+            streak = 1
+        if streak > longest:
+            longest = streak
+    return longest
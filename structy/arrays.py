@@ -0,0 +1,35 @@
+"""
+Solutions from 01_arrays_and_strings and 06_new_format.
+"""
+from structy._loader import lazy_solutions
+
+SOLUTIONS = {
+    "pair_sum": ("20250103_pairsum.py", "pair_sum"),
+    "pair_sum_2023": ("20230602_pair_sum.py", "pair_sum"),
+    "pair_product": ("20250103_pairproduct.py", "pair_product"),
+    "is_prime": ("20250102_isprime_iterative.py", "is_prime"),
+    "is_prime_iterative": ("20250102_isprime_iterative.py", "is_prime"),
+    "is_prime_recursive": ("20250102_isprime_recursive.py", "is_prime"),
+    "anagrams": ("20250103_anagrams.py", "anagrams"),
+    "most_frequent_char": ("20250103_mostfrequentchar.py", "most_frequent_char"),
+    "uncompress": ("20250103_uncompress.py", "uncompress"),
+    "compress": ("20250105_compress.py", "compress"),
+    "five_sort": ("20250106_five_sort.py", "five_sort"),
+    "intersection": ("20250106_intersection.py", "intersection"),
+}
+
+# is_subsequence is the only script in 06_new_format, a string problem
+NEW_FORMAT_SOLUTIONS = {
+    "is_subsequence": ("20250326_is_subsequence.py", "is_subsequence"),
+}
+
+_arrays_getattr, _arrays_dir = lazy_solutions(__name__, "01_arrays_and_strings", SOLUTIONS)
+_new_format_getattr, _new_format_dir = lazy_solutions(__name__, "06_new_format", NEW_FORMAT_SOLUTIONS)
+
+def __getattr__(name):
+    if name in NEW_FORMAT_SOLUTIONS:
+        return _new_format_getattr(name)
+    return _arrays_getattr(name)
+
+def __dir__():
+    return sorted(list(SOLUTIONS) + list(NEW_FORMAT_SOLUTIONS))
@@ -0,0 +1,426 @@
+"""
+Topological routines for directed acyclic graphs, without recursion.
+
+    from structy.dag import course_graph, topological_layers
+
+    graph = course_graph(6, [(1, 2), (2, 4), (3, 5), (0, 5)])
+    topological_layers(graph)                   # [[0, 1, 3], [2, 5], [4]]
+
+topological_layers is Kahn's algorithm: every node without a prerequisite forms the first
+layer, and removing a layer's edges from an array of in-degrees frees the next one. A node lands
+in the layer after its latest prerequisite, so the layers are a schedule in the fewest steps,
+e.g. the courses taken in each semester of semesters_required. Each node and edge is handled
+once: O(n + e) on the CSR arrays of a structy.graph.Graph, with no recursion depth to run out of.
+
+A graph with a cycle has no such order. find_cycle returns one cycle as a list of labels,
+[a, b, c, a] for a -> b -> c -> a, and topological_layers and check_acyclic raise it in a
+graphlib.CycleError, like graphlib.TopologicalSorter:
+
+    try:
+        topological_layers(graph)
+    except CycleError as error:
+        error.args[1]                           # ['a', 'b', 'c', 'a']
+
+critical_path weighs nodes and edges (durations of tasks and the delays between them) and
+returns the heaviest path with the slack of every node, a schedule for a pipeline of tasks.
+LongestPaths keeps the longest path from every node of a growing DAG, for longest_path queries
+between edits.
+"""
+from array import array
+from graphlib import CycleError
+
+from structy.graph import Graph
+
+def course_graph(number_of_courses, prerequisites):
+    """
+    Builds the directed Graph of courses 0..number_of_courses - 1 with an edge A -> B for every prerequisite (A, B).
+
+    The courses are interned first, so the id of every course is the course number itself.
+    """
+    return Graph.from_edges(prerequisites, nodes=range(number_of_courses), directed=True)
+
+def in_degrees(graph):
+    """
+    Returns an array('q') of the number of edges into every node id.
+    """
+    degrees = array("q", bytes(8 * len(graph)))
+    for neighbour in graph.neighbours:
+        degrees[neighbour] += 1
+    return degrees
+
+def topological_layers(graph):
+    """
+    Splits a directed acyclic Graph into layers: every node comes one layer after the latest of
+    the nodes with an edge into it.
+
+    Args:
+        graph: a directed structy.graph.Graph
+
+    Returns:
+        list[list]: the node labels of every layer, in order
+
+    Raises:
+        graphlib.CycleError: when the graph has a cycle, with one cycle as its second argument
+
+    Time complexity:
+        O(n + e)
+    """
+    return [[graph.labels[node] for node in layer] for layer in _id_layers(graph)]
+
+def _id_layers(graph):
+    # topological_layers over node ids
+    offsets, neighbours = graph.offsets, graph.neighbours
+    degrees = in_degrees(graph)
+    layer = [node for node in range(len(graph)) if degrees[node] == 0]
+    layers = []
+    placed = 0
+
+    while layer:
+        layers.append(layer)
+        placed += len(layer)
+        next_layer = []
+        for node in layer:
+            for neighbour in neighbours[offsets[node]:offsets[node + 1]]:
+                degrees[neighbour] -= 1
+                # The last prerequisite of neighbour has been placed
+                if degrees[neighbour] == 0:
+                    next_layer.append(neighbour)
+        layer = next_layer
+
+    # Nodes that never reached in-degree 0 sit on a cycle or behind one
+    if placed < len(graph):
+        check_acyclic(graph)
+    return layers
+
+class CriticalPath:
+    """
+    The schedule of a weighted DAG of tasks, as computed by critical_path.
+
+    Attributes:
+        length: the total weight of the heaviest path, the time the whole graph takes
+        path: the labels of one heaviest path, in order; every node on it has no slack
+        earliest: dict of node label -> earliest start, once all its predecessors are done
+        latest: dict of node label -> latest start that does not delay the whole graph
+        slack: dict of node label -> latest - earliest, how long the node can slip
+    """
+    __slots__ = ("length", "path", "earliest", "latest", "slack")
+
+    def __init__(self, length, path, earliest, latest, slack):
+        self.length = length
+        self.path = path
+        self.earliest = earliest
+        self.latest = latest
+        self.slack = slack
+
+def critical_path(graph, node_weights=None, edge_weights=None):
+    """
+    Finds the heaviest path of a directed acyclic Graph and the slack of every node, the critical path method.
+
+    The weight of a path is the sum of the weights of its nodes (e.g. task durations) and of its
+    edges (e.g. delays between tasks). Without any weights, None or empty alike, every edge weighs 1,
+    so length is the number of edges on the longest path, as longest_path returns.
+
+    The Graph is ordered once with Kahn's algorithm. One sweep forwards through that order gives
+    the earliest start of every node and the predecessor it waits for longest; one sweep backwards
+    gives the latest start.
+
+    Args:
+        graph: a directed structy.graph.Graph
+        node_weights: dict of node label -> weight, 0 for a missing node
+        edge_weights: dict of (label A, label B) -> weight of the edge A -> B, 0 for a missing
+            edge when either dict has weights, 1 when neither has
+
+    Returns:
+        CriticalPath
+
+    Raises:
+        graphlib.CycleError: when the graph has a cycle, with one cycle as its second argument
+
+    Time complexity:
+        O(n + e)
+    """
+    offsets, neighbours, labels = graph.offsets, graph.neighbours, graph.labels
+    order = [node for layer in _id_layers(graph) for node in layer]
+    if not order:
+        return CriticalPath(0, [], {}, {}, {})
+
+    default_edge_weight = 1 if not node_weights and not edge_weights else 0
+    node_weights = node_weights or {}
+    edge_weights = edge_weights or {}
+    weights = [node_weights.get(label, 0) for label in labels]
+
+    def edge_weight(node, neighbour):
+        if edge_weights:
+            return edge_weights.get((labels[node], labels[neighbour]), default_edge_weight)
+        return default_edge_weight
+
+    # Forwards: a node starts once its slowest predecessor and the edge from it are done
+    earliest = [0] * len(graph)
+    waits_for = [-1] * len(graph)
+    for node in order:
+        finish = earliest[node] + weights[node]
+        for neighbour in neighbours[offsets[node]:offsets[node + 1]]:
+            start = finish + edge_weight(node, neighbour)
+            if start > earliest[neighbour] or waits_for[neighbour] == -1:
+                earliest[neighbour] = start
+                waits_for[neighbour] = node
+
+    # The critical path ends at the node that finishes last and runs back through what it waits for
+    end = max(order, key=lambda node: earliest[node] + weights[node])
+    length = earliest[end] + weights[end]
+    path = []
+    node = end
+    while node != -1:
+        path.append(labels[node])
+        node = waits_for[node]
+    path.reverse()
+
+    # Backwards: a node finishes before the earliest of its successors' latest starts allows
+    latest = [0] * len(graph)
+    for node in reversed(order):
+        finish = length
+        for neighbour in neighbours[offsets[node]:offsets[node + 1]]:
+            finish = min(finish, latest[neighbour] - edge_weight(node, neighbour))
+        latest[node] = finish - weights[node]
+
+    return CriticalPath(
+        length,
+        path,
+        {labels[node]: earliest[node] for node in order},
+        {labels[node]: latest[node] for node in order},
+        {labels[node]: latest[node] - earliest[node] for node in order},
+    )
+
+# Three colour marking of find_cycle: not reached yet, on the current path, finished
+WHITE, GREY, BLACK = 0, 1, 2
+
+def find_cycle(graph):
+    """
+    Returns the labels of one cycle of a directed Graph, first label repeated last, None when there is none.
+
+    A depth first search marks every node on its current path GREY; an edge to a GREY node
+    closes a cycle, which is the path from that node on. Finished nodes are BLACK and never
+    searched again.
+
+    Time complexity:
+        O(n + e) on an explicit stack, so a path of any length is searched without recursion
+    """
+    offsets, neighbours, labels = graph.offsets, graph.neighbours, graph.labels
+    colours = bytearray(len(graph))
+    # The search stack: the node ids of the current path and the position of the next edge of each
+    path = array("q")
+    positions = array("q")
+
+    start = colours.find(WHITE)
+    while start != -1:
+        colours[start] = GREY
+        path.append(start)
+        positions.append(offsets[start])
+        while path:
+            node = path[-1]
+            position = positions[-1]
+            if position == offsets[node + 1]:
+                # Every edge of node is searched
+                colours[node] = BLACK
+                path.pop()
+                positions.pop()
+                continue
+            positions[-1] = position + 1
+            neighbour = neighbours[position]
+            if colours[neighbour] == GREY:
+                cycle = path[path.index(neighbour):]
+                return [labels[node] for node in cycle] + [labels[neighbour]]
+            if colours[neighbour] == WHITE:
+                colours[neighbour] = GREY
+                path.append(neighbour)
+                positions.append(offsets[neighbour])
+        start = colours.find(WHITE, start + 1)
+    return None
+
+def check_acyclic(graph):
+    """
+    Raises graphlib.CycleError with one cycle of a directed Graph as its second argument, when there is one.
+
+    Time complexity:
+        O(n + e)
+    """
+    cycle = find_cycle(graph)
+    if cycle is not None:
+        raise CycleError("nodes are in a cycle", cycle)
+
+class LongestPaths:
+    """
+    A directed acyclic graph that keeps the longest path from every node up to date as nodes and edges are added.
+
+    distances[node] is the number of edges on the longest path starting at node, as filled by
+    traverse_distance in 20250424_longest_path_memoization.py: 0 for a node without neighbours,
+    otherwise 1 plus the largest distance of its neighbours. An edge A -> B can only lengthen
+    the paths through A, so add_edge raises the distance of A and of the ancestors of A whose
+    longest path now runs through the new edge, and leaves every other node alone.
+
+        paths = LongestPaths(graph)             # O(n + e), once
+        paths.add_edge('c', 'q')                # O(a) for the a ancestors it lengthens
+        paths.longest                           # O(1), what longest_path returns
+
+    Nodes and edges are only ever added, so distances only grow and the longest is a running maximum.
+
+    Attributes:
+        successors: dict of node label -> set of the labels it has an edge to
+        predecessors: dict of node label -> set of the labels with an edge to it
+        distances: dict of node label -> the number of edges on its longest path
+        longest: the number of edges on the longest path of the graph, 0 when empty
+    """
+    __slots__ = ("successors", "predecessors", "distances", "longest")
+
+    def __init__(self, graph=None):
+        """
+        Args:
+            graph: an adjacency list, a dict of node label -> neighbour labels, as longest_path takes
+
+        Raises:
+            graphlib.CycleError: when graph has a cycle, with one cycle as its second argument
+
+        Time complexity:
+            O(n + e) Kahn's algorithm run backwards from the nodes without neighbours
+        """
+        self.successors = {}
+        self.predecessors = {}
+        self.distances = {}
+        self.longest = 0
+        if not graph:
+            return
+
+        for node, neighbours in graph.items():
+            self.add_node(node)
+            for neighbour in neighbours:
+                self.add_node(neighbour)
+                self.successors[node].add(neighbour)
+                self.predecessors[neighbour].add(node)
+
+        # A node is final once every one of its successors is
+        pending = {node: len(successors) for node, successors in self.successors.items()}
+        stack = [node for node, count in pending.items() if count == 0]
+        distances = self.distances
+        finished = 0
+        while stack:
+            node = stack.pop()
+            finished += 1
+            for predecessor in self.predecessors[node]:
+                distances[predecessor] = max(distances[predecessor], distances[node] + 1)
+                pending[predecessor] -= 1
+                if pending[predecessor] == 0:
+                    stack.append(predecessor)
+        if finished < len(distances):
+            check_acyclic(Graph.from_adjacency(self.successors))
+        self.longest = max(distances.values())
+
+    def __len__(self):
+        return len(self.distances)
+
+    def __contains__(self, label):
+        return label in self.distances
+
+    def distance(self, label):
+        """
+        Returns the number of edges on the longest path starting at label.
+
+        Time complexity:
+            O(1)
+        """
+        return self.distances[label]
+
+    def add_node(self, label):
+        """
+        Adds label as a node without edges, unless it is already in the graph.
+        """
+        if label not in self.distances:
+            self.successors[label] = set()
+            self.predecessors[label] = set()
+            self.distances[label] = 0
+
+    def add_edges(self, edges):
+        """
+        Adds an edge A -> B for every [A, B] pair.
+        """
+        for node_A, node_B in edges:
+            self.add_edge(node_A, node_B)
+
+    def add_edge(self, node_A, node_B):
+        """
+        Adds an edge node_A -> node_B, adding either node when it is new, and lengthens the paths it extends.
+
+        Raises:
+            graphlib.CycleError: when node_A is node_B or node_B already leads to node_A, with the
+                cycle the edge would close as its second argument; neither the edge nor a new
+                node is added
+
+        Time complexity:
+            O(1) when the edge lengthens no path, otherwise linear in the ancestors of node_A
+            it could lengthen and their edges
+        """
+        distances = self.distances
+        if node_A == node_B:
+            raise CycleError("nodes are in a cycle", [node_A, node_B])
+        # A new node has no edges yet, so only an edge between two known nodes can close a cycle
+        if node_A in distances and node_B in distances:
+            if node_B in self.successors[node_A]:
+                return
+            # On a path B -> ... -> A every node is further from the end than A: when B is not, there is no such path
+            if distances[node_B] >= distances[node_A]:
+                self._check_path(node_A, node_B)
+        self.add_node(node_A)
+        self.add_node(node_B)
+        self.successors[node_A].add(node_B)
+        self.predecessors[node_B].add(node_A)
+
+        gain = distances[node_B] + 1 - distances[node_A]
+        if gain <= 0:
+            return
+
+        # The ancestors that may be lengthened: no distance grows by more than the gain at A
+        affected = {node_A}
+        stack = [node_A]
+        while stack:
+            node = stack.pop()
+            for predecessor in self.predecessors[node]:
+                if predecessor not in affected and distances[predecessor] < distances[node] + gain + 1:
+                    affected.add(predecessor)
+                    stack.append(predecessor)
+
+        # Settle them in reverse topological order: a node once all of its affected successors are final.
+        # Distances only grow, so the old distance still covers the successors outside affected.
+        pending = {node: 0 for node in affected}
+        for node in affected:
+            for predecessor in self.predecessors[node]:
+                if predecessor in affected:
+                    pending[predecessor] += 1
+        distances[node_A] = distances[node_B] + 1
+        stack = [node_A]
+        while stack:
+            node = stack.pop()
+            self.longest = max(self.longest, distances[node])
+            for predecessor in self.predecessors[node]:
+                if predecessor in affected:
+                    distances[predecessor] = max(distances[predecessor], distances[node] + 1)
+                    pending[predecessor] -= 1
+                    if pending[predecessor] == 0:
+                        stack.append(predecessor)
+
+    def _check_path(self, node_A, node_B):
+        # Search forwards from node_B for node_A, only through nodes further from the end than node_A
+        distances, successors = self.distances, self.successors
+        floor = distances[node_A]
+        parents = {node_B: None}
+        stack = [node_B]
+        while stack:
+            node = stack.pop()
+            if node == node_A:
+                path = []
+                while node is not None:
+                    path.append(node)
+                    node = parents[node]
+                raise CycleError("nodes are in a cycle", [node_A] + path[::-1])
+            for successor in successors[node]:
+                if successor not in parents and (successor == node_A or distances[successor] > floor):
+                    parents[successor] = node
+                    stack.append(successor)
@@ -0,0 +1,168 @@
+"""
+The distance from every cell of a grid to its nearest carrot, kept up to date as cells change.
+
+closest_carrot answers one start position with its own breadth first search. When the same grid
+is asked about many start positions, one breadth first search from every carrot at once gives
+the answer for all of them:
+
+    from structy.distance_field import DistanceField
+
+    field = DistanceField(grid)                 # O(rc), once
+    field.distance(3, 4)                        # O(1) per start, same answer as closest_carrot
+    field.set_cell(2, 2, 'X')                   # repairs only the distances that change
+
+set_cell changes the grid and repairs the field in place. A new carrot or a removed wall can
+only shorten distances, so a search from the changed cell lowers them. A removed carrot or a
+new wall can only lengthen the distances of the cells whose shortest paths ran through the
+changed cell; only those cells are cleared and searched again from their neighbours.
+"""
+from array import array
+from collections import deque
+import heapq
+
+from structy.grid import CARROT, WALL, as_grid
+
+UNREACHABLE = -1
+
+class DistanceField:
+    """
+    The number of steps from every cell to its nearest target cell, moving up, down, left and right
+    through cells that are not walls.
+
+    Attributes:
+        grid: the Grid, changed through set_cell
+        distances: array('q') of the distance of every cell by flat index, UNREACHABLE for walls
+            and for cells no target can reach
+        target: the cell byte searched for
+        wall: the cell byte that blocks a path
+    """
+    __slots__ = ("grid", "distances", "target", "wall")
+
+    def __init__(self, grid, target=CARROT, wall=WALL):
+        """
+        Args:
+            grid: a Grid or a list of lists, converted with as_grid
+            target: the cell searched for, e.g. CARROT
+            wall: the cell that blocks a path, e.g. WALL
+
+        Time complexity:
+            O(rc) one breadth first search from every target at once
+        """
+        self.grid = as_grid(grid)
+        self.target = target
+        self.wall = wall
+        cells = self.grid.cells
+        self.distances = array("q", [UNREACHABLE]) * len(cells)
+
+        # Every target starts the search at distance 0
+        queue = deque()
+        index = cells.find(target)
+        while index != -1:
+            self.distances[index] = 0
+            queue.append(index)
+            index = cells.find(target, index + 1)
+        self._lower(queue)
+
+    def _open_neighbours(self, index):
+        cells = self.grid.cells
+        return [neighbour for neighbour in self.grid.neighbours(index) if cells[neighbour] != self.wall]
+
+    def _lower(self, queue):
+        # Breadth first search lowering the distance of every cell it reaches through a shorter path
+        distances = self.distances
+        while queue:
+            index = queue.popleft()
+            distance = distances[index] + 1
+            for neighbour in self._open_neighbours(index):
+                if distances[neighbour] == UNREACHABLE or distances[neighbour] > distance:
+                    distances[neighbour] = distance
+                    queue.append(neighbour)
+
+    def distance(self, row, column):
+        """
+        Returns the length of the shortest path from (row, column) to a target, -1 when there is none.
+
+        Like closest_carrot, a start on a wall can still step off it.
+
+        Time complexity:
+            O(1)
+        """
+        index = self.grid.index(row, column)
+        if self.grid.cells[index] != self.wall:
+            return self.distances[index]
+        reachable = [self.distances[neighbour] for neighbour in self._open_neighbours(index) if self.distances[neighbour] != UNREACHABLE]
+        return min(reachable) + 1 if reachable else UNREACHABLE
+
+    def set_cell(self, row, column, value):
+        """
+        Changes the cell at (row, column) and repairs the distances it affects.
+
+        Time complexity:
+            O(a) where a is the number of cells whose distance changes, plus a log a when
+            distances grow
+        """
+        index = self.grid.index(row, column)
+        old = self.grid.cells[index]
+        new = ord(value)
+        if old == new:
+            return
+        self.grid.cells[index] = new
+
+        # Losing a target or gaining a wall can only lengthen paths
+        if old == self.target or new == self.wall:
+            self._raise(index)
+        # Gaining a target or losing a wall can only shorten them
+        if new == self.target or old == self.wall:
+            self._shorten(index)
+
+    def _shorten(self, index):
+        distances = self.distances
+        if self.grid.cells[index] == self.target:
+            distances[index] = 0
+        else:
+            reachable = [distances[neighbour] for neighbour in self._open_neighbours(index) if distances[neighbour] != UNREACHABLE]
+            distances[index] = min(reachable) + 1 if reachable else UNREACHABLE
+        if distances[index] != UNREACHABLE:
+            self._lower(deque([index]))
+
+    def _raise(self, index):
+        distances = self.distances
+        cells = self.grid.cells
+
+        # The cells whose shortest paths may run through index: reached from it by steps that
+        # each add one to the distance
+        affected = {index}
+        if distances[index] != UNREACHABLE:
+            stack = [index]
+            while stack:
+                current = stack.pop()
+                following = distances[current] + 1
+                for neighbour in self._open_neighbours(current):
+                    if distances[neighbour] == following and neighbour not in affected:
+                        affected.add(neighbour)
+                        stack.append(neighbour)
+        for cell in affected:
+            distances[cell] = UNREACHABLE
+
+        # Every affected cell starts from its nearest unaffected neighbour (or 0 on a target),
+        # then the shortest of those starts spread through the affected cells first
+        heap = []
+        for cell in affected:
+            if cells[cell] == self.wall:
+                continue
+            if cells[cell] == self.target:
+                heap.append((0, cell))
+                continue
+            reachable = [distances[neighbour] for neighbour in self._open_neighbours(cell) if distances[neighbour] != UNREACHABLE]
+            if reachable:
+                heap.append((min(reachable) + 1, cell))
+        heapq.heapify(heap)
+
+        while heap:
+            distance, cell = heapq.heappop(heap)
+            if distances[cell] != UNREACHABLE and distances[cell] <= distance:
+                continue
+            distances[cell] = distance
+            for neighbour in self._open_neighbours(cell):
+                if neighbour in affected and (distances[neighbour] == UNREACHABLE or distances[neighbour] > distance + 1):
+                    heapq.heappush(heap, (distance + 1, neighbour))
@@ -0,0 +1,435 @@
+"""
+A graph built once from its edges and queried many times, with integer node ids and CSR adjacency.
+
+    from structy.graph import Graph
+
+    graph = Graph.from_edges(edges)             # O(n + e), once
+    shortest_path(graph, 'w', 'z')              # the scripts take a Graph in place of edges
+    largest_component(graph)
+
+Every node label is interned to an id 0..n-1 (labels[id] is the label, ids[label] the id). The
+neighbours of node i are neighbours[offsets[i]:offsets[i + 1]]: two array('q') buffers
+(compressed sparse row) instead of a dict of lists, 8 bytes per edge end and no Python object
+per edge.
+
+Graph.from_edges takes any iterable of edges in one pass, e.g. read_edges over a file, and
+Graph.from_adjacency converts the dict adjacency lists the scripts take.
+
+shortest_path, undirected_path, connected_components_count, largest_component and the has_path
+scripts take a Graph in place of their edges or adjacency list and run on the CSR arrays. The
+component sizes are computed on the first component query and kept with the graph. A Graph
+also reads like a dict adjacency list (graph[label], iteration, in), so any other traversal
+over a dict, such as the prints of graph_dfs_dfs-recursive_bfs.py, runs on it unchanged;
+breadth_first and depth_first traverse the arrays directly, visiting each node once.
+
+batch_distance and batch_connected answer thousands of (node_A, node_B) queries in one call,
+searching from up to BATCH_WIDTH sources at once with one bit per source.
+"""
+from array import array
+from collections import deque
+
+class Graph:
+    """
+    A graph as compressed sparse row adjacency over interned integer node ids.
+
+    Attributes:
+        labels: list of the node labels by id
+        ids: dict of node label -> id
+        offsets: array('q') of n + 1 positions, the neighbours of node i start at offsets[i]
+        neighbours: array('q') of neighbour ids, grouped by node
+        directed: False when every edge was stored in both directions
+    """
+    __slots__ = ("labels", "ids", "offsets", "neighbours", "directed", "_component_sizes")
+
+    def __init__(self, labels, ids, offsets, neighbours, directed=False):
+        self.labels = labels
+        self.ids = ids
+        self.offsets = offsets
+        self.neighbours = neighbours
+        self.directed = directed
+        self._component_sizes = None
+
+    @classmethod
+    def from_edges(cls, edges, nodes=(), directed=False):
+        """
+        Builds a graph from [a, b] pairs, in one pass over edges.
+
+        edges can be any iterable, e.g. read_edges over an open file, so the edge list never has
+        to exist as Python lists: while building, each edge costs the 16 bytes of its two ids
+        plus its place in the CSR arrays.
+
+        Args:
+            edges: iterable of [a, b] pairs of node labels
+            nodes: labels of nodes to include even without edges
+            directed: store a -> b only, instead of both directions
+
+        Time complexity:
+            O(n + e) a counting sort of the edges by their first node
+        """
+        ids = {}
+        labels = []
+        # degrees[i + 1] counts the neighbours of node i, offsets are built from it in place
+        degrees = array("q", [0])
+
+        for label in nodes:
+            if ids.setdefault(label, len(labels)) == len(labels):
+                labels.append(label)
+                degrees.append(0)
+        endpoints = array("q")
+        for label_a, label_b in edges:
+            # Intern both labels: setdefault hands the next id to a label seen for the first time
+            a = ids.setdefault(label_a, len(labels))
+            if a == len(labels):
+                labels.append(label_a)
+                degrees.append(0)
+            b = ids.setdefault(label_b, len(labels))
+            if b == len(labels):
+                labels.append(label_b)
+                degrees.append(0)
+            endpoints.append(a)
+            endpoints.append(b)
+            degrees[a + 1] += 1
+            if not directed:
+                degrees[b + 1] += 1
+
+        # Count the neighbours of every node, then place each edge in its node's slice
+        offsets = degrees
+        for node in range(len(labels)):
+            offsets[node + 1] += offsets[node]
+        positions = offsets[:-1]
+        neighbours = array("q", bytes(8 * offsets[-1]))
+        pairs = iter(endpoints)
+        for a, b in zip(pairs, pairs):
+            neighbours[positions[a]] = b
+            positions[a] += 1
+            if not directed:
+                neighbours[positions[b]] = a
+                positions[b] += 1
+
+        return cls(labels, ids, offsets, neighbours, directed)
+
+    @classmethod
+    def from_adjacency(cls, adjacency, directed=True):
+        """
+        Builds a graph from an adjacency list, a dict of node -> neighbours as the scripts take.
+
+        The neighbours are stored as listed, in their order. Neighbours that are not keys become
+        nodes without neighbours of their own.
+
+        Args:
+            adjacency: dict of node label -> iterable of neighbour labels
+            directed: False when every edge is listed from both of its nodes, as in
+                largest_component, which lets searches run from both ends
+
+        Time complexity:
+            O(n + e)
+        """
+        ids = {label: node for node, label in enumerate(adjacency)}
+        labels = list(adjacency)
+        offsets = array("q", [0])
+        neighbours = array("q")
+        for label in adjacency:
+            for neighbour in adjacency[label]:
+                node = ids.get(neighbour)
+                if node is None:
+                    node = ids[neighbour] = len(labels)
+                    labels.append(neighbour)
+                neighbours.append(node)
+            offsets.append(len(neighbours))
+        # The nodes met only as neighbours come last and have none
+        offsets.extend([len(neighbours)] * (len(labels) - len(adjacency)))
+        return cls(labels, ids, offsets, neighbours, directed)
+
+    def __len__(self):
+        return len(self.labels)
+
+    def __contains__(self, label):
+        return label in self.ids
+
+    # graph[label] and iteration read like the dict adjacency lists, so the scripts that take
+    # one (graph_dfs_dfs-recursive_bfs.py, largest_component, ...) also run on a Graph
+    def __iter__(self):
+        return iter(self.labels)
+
+    def __getitem__(self, label):
+        node = self.ids[label]
+        return [self.labels[neighbour] for neighbour in self.neighbours[self.offsets[node]:self.offsets[node + 1]]]
+
+    def get(self, label, default=None):
+        return self[label] if label in self.ids else default
+
+    def edge_count(self):
+        """
+        Returns the number of edges, each undirected edge counted once.
+        """
+        return len(self.neighbours) if self.directed else len(self.neighbours) // 2
+
+    def neighbour_ids(self, node):
+        """
+        Returns the ids of the neighbours of the node with id node, as an array('q').
+        """
+        return self.neighbours[self.offsets[node]:self.offsets[node + 1]]
+
+    def component_sizes(self):
+        """
+        Returns the number of nodes in every connected component, computed once and kept.
+
+        Raises:
+            ValueError: when the graph is directed
+
+        Time complexity:
+            O(n + e) on the first call, O(1) afterwards
+        """
+        if self._component_sizes is None:
+            self._component_sizes = component_sizes(self)
+        return self._component_sizes
+
+def component_sizes(graph):
+    """
+    Returns the size of every connected component of an undirected Graph, in the order of their lowest id.
+
+    A search only follows edges forwards, so on a directed Graph it would count the nodes reachable
+    from each start rather than its component.
+
+    Raises:
+        ValueError: when the graph is directed
+
+    Time complexity:
+        O(n + e) one breadth first search per component, on an explicit queue
+    """
+    if graph.directed:
+        raise ValueError("component sizes need an undirected graph, build it with directed=False")
+    offsets, neighbours = graph.offsets, graph.neighbours
+    visited = bytearray(len(graph))
+    sizes = []
+    # bytearray.find jumps to the next node no search has reached
+    start = visited.find(0)
+    while start != -1:
+        visited[start] = 1
+        queue = deque([start])
+        size = 0
+        while queue:
+            node = queue.popleft()
+            size += 1
+            for neighbour in neighbours[offsets[node]:offsets[node + 1]]:
+                if not visited[neighbour]:
+                    visited[neighbour] = 1
+                    queue.append(neighbour)
+        sizes.append(size)
+        start = visited.find(0, start + 1)
+    return sizes
+
+def distance(graph, node_A, node_B):
+    """
+    Returns the number of edges on the shortest path between the labels node_A and node_B, -1 when there is none.
+
+    Undirected graphs are searched from both ends at once, like 20261018_shortest_path_bidirectional.py;
+    directed graphs from node_A only.
+
+    Raises:
+        KeyError: when node_A or node_B is not in the graph
+    """
+    start, goal = graph.ids[node_A], graph.ids[node_B]
+    if start == goal:
+        return 0
+    offsets, neighbours = graph.offsets, graph.neighbours
+
+    if graph.directed:
+        distances = {start: 0}
+        queue = deque([start])
+        while queue:
+            node = queue.popleft()
+            for neighbour in neighbours[offsets[node]:offsets[node + 1]]:
+                if neighbour not in distances:
+                    if neighbour == goal:
+                        return distances[node] + 1
+                    distances[neighbour] = distances[node] + 1
+                    queue.append(neighbour)
+        return -1
+
+    distances_A, distances_B = {start: 0}, {goal: 0}
+    frontier_A, frontier_B = [start], [goal]
+    while frontier_A and frontier_B:
+        # Grow the smaller frontier by one whole level
+        if len(frontier_A) > len(frontier_B):
+            frontier_A, frontier_B = frontier_B, frontier_A
+            distances_A, distances_B = distances_B, distances_A
+        shortest = -1
+        next_frontier = []
+        for node in frontier_A:
+            step = distances_A[node] + 1
+            for neighbour in neighbours[offsets[node]:offsets[node + 1]]:
+                if neighbour in distances_B and (shortest == -1 or step + distances_B[neighbour] < shortest):
+                    shortest = step + distances_B[neighbour]
+                if neighbour not in distances_A:
+                    distances_A[neighbour] = step
+                    next_frontier.append(neighbour)
+        if shortest != -1:
+            return shortest
+        frontier_A = next_frontier
+    return -1
+
+def connected(graph, node_A, node_B):
+    """
+    Returns True when there is a path from the label node_A to the label node_B, False when
+    there is none or either is not in the graph.
+    """
+    if node_A not in graph.ids or node_B not in graph.ids:
+        return False
+    return distance(graph, node_A, node_B) != -1
+
+# Sources searched together by batch_distance: one bit of every Python int per source
+BATCH_WIDTH = 1024
+
+def batch_distance(graph, pairs, width=BATCH_WIDTH):
+    """
+    Returns the distance of every (node_A, node_B) label pair in pairs, in order, -1 where there is no path.
+
+    The pairs are grouped by node_A and up to width sources are searched at once: a multi-source
+    breadth first search where every node keeps one int whose bit i is set once source i has
+    reached it. A level expands each frontier node once for all the sources that reached it, with
+    one & and | per edge instead of one search per pair. A source stops spreading once all of its
+    pairs are answered, and the search stops once every pair is.
+
+    Args:
+        graph: a Graph, directed or undirected
+        pairs: iterable of (node_A, node_B) label pairs, many sharing node_A
+        width: the number of sources per search; wider ints take fewer searches but more memory
+
+    Raises:
+        KeyError: when a label is not in the graph
+
+    Time complexity:
+        O((n + e) * k / width) for k distinct sources in the worst case, each & and | costing
+        O(width / 64)
+    """
+    ids = graph.ids
+    answers = []
+    by_source = {}
+    for index, (node_A, node_B) in enumerate(pairs):
+        start, goal = ids[node_A], ids[node_B]
+        answers.append(0 if start == goal else -1)
+        if start != goal:
+            by_source.setdefault(start, []).append((goal, index))
+
+    sources = list(by_source)
+    for first in range(0, len(sources), width):
+        _search_sources(graph, {source: by_source[source] for source in sources[first:first + width]}, answers)
+    return answers
+
+def _search_sources(graph, by_source, answers):
+    # One multi-source breadth first search, writing the level every goal is reached at into answers
+    offsets, neighbours = graph.offsets, graph.neighbours
+    seen = {}
+    frontier = {}
+    waiting = {}
+    remaining = {}
+    for position, (source, goals) in enumerate(by_source.items()):
+        bit = 1 << position
+        seen[source] = frontier[source] = bit
+        remaining[bit] = len(goals)
+        for goal, index in goals:
+            waiting.setdefault(goal, []).append((bit, index))
+    # The bits of the sources that still have unanswered pairs
+    active = (1 << len(by_source)) - 1
+
+    level = 0
+    while frontier and active:
+        level += 1
+        reached = {}
+        for node, bits in frontier.items():
+            bits &= active
+            if not bits:
+                continue
+            for neighbour in neighbours[offsets[node]:offsets[node + 1]]:
+                known = seen.get(neighbour, 0)
+                new = bits & ~known
+                if new:
+                    seen[neighbour] = known | new
+                    reached[neighbour] = reached.get(neighbour, 0) | new
+
+        for node in reached.keys() & waiting.keys():
+            bits = reached[node]
+            unanswered = []
+            for bit, index in waiting[node]:
+                if bits & bit:
+                    answers[index] = level
+                    remaining[bit] -= 1
+                    if remaining[bit] == 0:
+                        active &= ~bit
+                else:
+                    unanswered.append((bit, index))
+            waiting[node] = unanswered
+        frontier = reached
+
+def batch_connected(graph, pairs, width=BATCH_WIDTH):
+    """
+    Returns True for every (node_A, node_B) label pair in pairs with a path from node_A to node_B,
+    False when there is none or either is not in the graph, like connected.
+
+    Time complexity:
+        that of batch_distance
+    """
+    pairs = list(pairs)
+    known = [node_A in graph.ids and node_B in graph.ids for node_A, node_B in pairs]
+    distances = iter(batch_distance(graph, [pair for pair, ok in zip(pairs, known) if ok], width))
+    return [ok and next(distances) != -1 for ok in known]
+
+def breadth_first(graph, start):
+    """
+    Yields the labels of every node reachable from the label start, nearest first, each once.
+
+    Time complexity:
+        O(n + e) over the CSR arrays, with one byte per node to mark visits
+    """
+    offsets, neighbours, labels = graph.offsets, graph.neighbours, graph.labels
+    visited = bytearray(len(graph))
+    node = graph.ids[start]
+    visited[node] = 1
+    queue = deque([node])
+    while queue:
+        node = queue.popleft()
+        yield labels[node]
+        for neighbour in neighbours[offsets[node]:offsets[node + 1]]:
+            if not visited[neighbour]:
+                visited[neighbour] = 1
+                queue.append(neighbour)
+
+def depth_first(graph, start):
+    """
+    Yields the labels of every node reachable from the label start in depth first order, each once.
+
+    The order is that of depth_first_print in graph_dfs_dfs-recursive_bfs.py: the last neighbour
+    pushed is explored first.
+
+    Time complexity:
+        O(n + e) over the CSR arrays, on an explicit stack
+    """
+    offsets, neighbours, labels = graph.offsets, graph.neighbours, graph.labels
+    visited = bytearray(len(graph))
+    stack = array("q", [graph.ids[start]])
+    while stack:
+        node = stack.pop()
+        if visited[node]:
+            continue
+        visited[node] = 1
+        yield labels[node]
+        for neighbour in neighbours[offsets[node]:offsets[node + 1]]:
+            if not visited[neighbour]:
+                stack.append(neighbour)
+
+def read_edges(lines, separator=None):
+    """
+    Yields [a, b] label pairs from lines of text such as an open file, one edge per line.
+
+    Blank lines and lines starting with '#' are skipped. Pass it straight to Graph.from_edges
+    to build a graph without holding the edge list in memory:
+
+        with open("edges.txt") as file:
+            graph = Graph.from_edges(read_edges(file))
+    """
+    for line in lines:
+        line = line.strip()
+        if line and not line.startswith("#"):
+            a, b = line.split(separator)
+            yield [a, b]
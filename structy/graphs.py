@@ -0,0 +1,47 @@
+"""
+Solutions from 05_graphs.
+
+Where a problem was solved several ways, the plain name is the preferred iterative variant and
+every variant is also available under its own name.
+"""
+from structy._loader import lazy_solutions
+
+SOLUTIONS = {
+    "has_path": ("20250303_has_path_bfs.py", "has_path"),
+    "has_path_bfs": ("20250303_has_path_bfs.py", "has_path"),
+    "has_path_dfs": ("20250303_has_path_dfs.py", "has_path"),
+    "has_path_dfs_recursive": ("20250303_has_path_dfs_recursive.py", "has_path"),
+    # Breadth first has_path over an undirected adjacency list, unlike undirected_path which takes edges
+    "undirected_path_bfs": ("20250304_undirected_path_bfs.py", "has_path"),
+    "undirected_path": ("20250304_undirected_path_dfs.py", "undirected_path"),
+    "undirected_path_dfs": ("20250304_undirected_path_dfs.py", "undirected_path"),
+    "connected_components_count": ("20250331_connnected_components_count.py", "connected_components_count"),
+    "component_counts": ("20250331_connnected_components_count.py", "component_counts"),
+    "largest_component": ("20250402_largest_component.py", "largest_component"),
+    "largest_component_sizes": ("20250402_largest_component.py", "largest_component_sizes"),
+    "shortest_path": ("20250410_shortest_path.py", "shortest_path"),
+    "shortest_path_bidirectional": ("20261018_shortest_path_bidirectional.py", "shortest_path"),
+    "shortest_paths": ("20261018_batch_queries.py", "shortest_paths"),
+    "has_paths": ("20261018_batch_queries.py", "has_paths"),
+    "island_count": ("20250415_island_count.py", "island_count"),
+    "minimum_island": ("20250419_minimum_island_iterative.py", "minimum_island"),
+    "minimum_island_iterative": ("20250419_minimum_island_iterative.py", "minimum_island"),
+    "minimum_island_recursive": ("20250419_minimum_island_recursive.py", "minimum_island"),
+    "minimum_island_flood_fill": ("20261018_minimum_island_flood_fill.py", "minimum_island"),
+    "closest_carrot": ("20250422_closest_carrot.py", "closest_carrot"),
+    "closest_carrot_field": ("20261018_closest_carrot_field.py", "closest_carrot"),
+    "longest_path": ("20250424_longest_path.py", "longest_path"),
+    "longest_path_memoization": ("20250424_longest_path_memoization.py", "longest_path"),
+    "critical_path": ("20261018_critical_path.py", "critical_path"),
+    "semesters_required": ("20261018_semesters_required_kahn.py", "semesters_required"),
+    "semesters_required_v1": ("20250808_semesters_required.py", "semesters_required"),
+    "semesters_required_v2": ("20250809_semesters_required_v2.py", "semesters_required"),
+    "semesters_required_kahn": ("20261018_semesters_required_kahn.py", "semesters_required"),
+    "semester_plan": ("20261018_semesters_required_kahn.py", "semester_plan"),
+    "depth_first_print": ("graph_dfs_dfs-recursive_bfs.py", "depth_first_print"),
+    "depth_first_recursive_print": ("graph_dfs_dfs-recursive_bfs.py", "depth_first_recursive_print"),
+    "breadth_first_print": ("graph_dfs_dfs-recursive_bfs.py", "breadth_first_print"),
+    "breadth_first_deque_print": ("graph_dfs_dfs-recursive_bfs.py", "breadth_first_deque_print"),
+}
+
+__getattr__, __dir__ = lazy_solutions(__name__, "05_graphs", SOLUTIONS)
@@ -0,0 +1,363 @@
+"""
+A character grid stored as one bytearray, with a bitmap of visited cells.
+
+    from structy.grid import Grid
+
+    grid = Grid.from_rows([['W', 'L'], ['L', 'L']])
+    grid.cell(1, 0)                          # 'L'
+    grid[1][0]                               # 'L', rows read like the list of lists
+    island_count(grid)
+
+Cell (row, column) is the byte cells[row * columns + column], its ASCII character ('L', 'W',
+'O', 'X', 'C'). A 10,000 x 10,000 grid takes 100 MB as bytes instead of about 900 MB as lists
+of one character strings, and the grid solutions mark visits in a VisitedBitmap of one bit per
+cell (12.5 MB) instead of a set of (row, column) tuples (several GB).
+
+island_count, minimum_island and closest_carrot take either a Grid or a list of lists and
+convert the latter with as_grid. island_count and minimum_island label every island at once with
+label_regions. minimum_island_flood_fill fills one island at a time with flood_fill, which keeps
+the cells still to explore on an explicit stack, so islands of any size stay below the recursion
+limit; minimum_island_recursive keeps the recursive explore_island it replaces (see
+python -m tools.flood_fill_benchmark).
+
+Run the graph scripts through structy from the repository root; they import test_runner from
+their own directory and structy from the root:
+    python -m structy 05_graphs/20250415_island_count.py
+"""
+from array import array
+import re
+
+# The cell bytes
+LAND = ord("L")
+WATER = ord("W")
+OPEN = ord("O")
+WALL = ord("X")
+CARROT = ord("C")
+
+class Grid:
+    """
+    A rows x columns grid of one character cells in a bytearray, row after row.
+
+    Attributes:
+        rows: number of rows
+        columns: number of columns
+        cells: bytearray of rows * columns ASCII characters
+    """
+    __slots__ = ("rows", "columns", "cells")
+
+    def __init__(self, rows, columns, cells=None, fill="W"):
+        if cells is None:
+            cells = bytearray(fill.encode("ascii")) * (rows * columns)
+        if len(cells) != rows * columns:
+            raise ValueError(f"{len(cells)} cells do not make a {rows} x {columns} grid")
+        self.rows = rows
+        self.columns = columns
+        self.cells = cells
+
+    @classmethod
+    def from_rows(cls, rows):
+        """
+        Converts a list of rows, each a list of one character strings or a string.
+
+        Raises:
+            ValueError: when the rows differ in length
+
+        Time complexity:
+            O(rc) product of the number of rows and columns
+        """
+        columns = len(rows[0]) if rows else 0
+        if any(len(row) != columns for row in rows):
+            raise ValueError("every row of a grid must have the same length")
+        return cls(len(rows), columns, bytearray("".join(map("".join, rows)), "ascii"))
+
+    def to_rows(self):
+        """
+        Converts back to a list of lists of one character strings.
+        """
+        return [list(self[row]) for row in range(self.rows)]
+
+    def __len__(self):
+        return self.rows
+
+    def __getitem__(self, row):
+        # A copy of the row as a string, so grid[row][column] reads like the list of lists
+        if not 0 <= row < self.rows:
+            raise IndexError("grid row out of range")
+        start = row * self.columns
+        return self.cells[start:start + self.columns].decode("ascii")
+
+    def index(self, row, column):
+        """
+        Returns the flat index of (row, column).
+
+        Raises:
+            IndexError: when (row, column) is outside the grid; row * columns + column alone would
+                wrap a column past the edge into the next row
+        """
+        if not (0 <= row < self.rows and 0 <= column < self.columns):
+            raise IndexError(f"cell ({row}, {column}) is outside the {self.rows} x {self.columns} grid")
+        return row * self.columns + column
+
+    def position(self, index):
+        """
+        Returns the (row, column) of a flat index.
+        """
+        return divmod(index, self.columns)
+
+    def cell(self, row, column):
+        """
+        Returns the character at (row, column).
+        """
+        return chr(self.cells[self.index(row, column)])
+
+    def set_cell(self, row, column, value):
+        """
+        Sets the character at (row, column).
+        """
+        self.cells[self.index(row, column)] = ord(value)
+
+    def neighbours(self, index):
+        """
+        Returns the flat indexes of the cells up, down, left and right of index that are inside the grid.
+        """
+        columns = self.columns
+        neighbours = []
+        if index >= columns:
+            neighbours.append(index - columns) # Up
+        if index + columns < len(self.cells):
+            neighbours.append(index + columns) # Down
+        if index % columns:
+            neighbours.append(index - 1) # Left
+        if (index + 1) % columns:
+            neighbours.append(index + 1) # Right
+        return neighbours
+
+    def visited(self):
+        """
+        Returns an empty VisitedBitmap with one bit per cell.
+        """
+        return VisitedBitmap(len(self.cells))
+
+def as_grid(grid):
+    """
+    Returns grid itself when it is a Grid, otherwise a Grid built from its rows.
+    """
+    return grid if isinstance(grid, Grid) else Grid.from_rows(grid)
+
+class VisitedBitmap:
+    """
+    A set of flat cell indexes as one bit per cell, used in place of a set of (row, column) tuples.
+
+        visited = grid.visited()
+        visited.add(index)
+        index in visited
+    """
+    __slots__ = ("bits",)
+
+    def __init__(self, size):
+        self.bits = bytearray((size + 7) >> 3)
+
+    def __contains__(self, index):
+        return self.bits[index >> 3] >> (index & 7) & 1 == 1
+
+    def add(self, index):
+        self.bits[index >> 3] |= 1 << (index & 7)
+
+    def __len__(self):
+        # The number of visited cells
+        return sum(map(int.bit_count, self.bits))
+
+def flood_fill(grid, start, visited, barrier=WATER):
+    """
+    Marks the region of cells connected to start up, down, left and right as visited.
+
+    An explicit stack replaces the recursion the island scripts used, so a region of any size
+    is filled without reaching the recursion limit. Cells are marked when they are pushed, so
+    the stack never holds more than the cells of the region.
+
+    Args:
+        grid: a Grid
+        start: flat index of the first cell
+        visited: the VisitedBitmap of the search, updated in place
+        barrier: cell byte that is not part of any region, e.g. WATER or WALL
+
+    Returns:
+        int: the number of cells in the region, 0 when start is a barrier or already visited
+
+    Time complexity:
+        O(s) where s is the number of cells in the region
+    """
+    cells = grid.cells
+    columns = grid.columns
+    last_row = len(cells) - columns
+    bits = visited.bits
+
+    if cells[start] == barrier or bits[start >> 3] >> (start & 7) & 1:
+        return 0
+    bits[start >> 3] |= 1 << (start & 7)
+    # An array of 64-bit indexes: 8 bytes per waiting cell instead of a pointer and an int object
+    stack = array("q", [start])
+    size = 0
+
+    while stack:
+        index = stack.pop()
+        size += 1
+        column = index % columns
+        # The bounds checks of Grid.neighbours and the bitmap operations, inlined
+        if index >= columns:
+            neighbour = index - columns # Up
+            if cells[neighbour] != barrier and not bits[neighbour >> 3] >> (neighbour & 7) & 1:
+                bits[neighbour >> 3] |= 1 << (neighbour & 7)
+                stack.append(neighbour)
+        if index < last_row:
+            neighbour = index + columns # Down
+            if cells[neighbour] != barrier and not bits[neighbour >> 3] >> (neighbour & 7) & 1:
+                bits[neighbour >> 3] |= 1 << (neighbour & 7)
+                stack.append(neighbour)
+        if column:
+            neighbour = index - 1 # Left
+            if cells[neighbour] != barrier and not bits[neighbour >> 3] >> (neighbour & 7) & 1:
+                bits[neighbour >> 3] |= 1 << (neighbour & 7)
+                stack.append(neighbour)
+        if column + 1 < columns:
+            neighbour = index + 1 # Right
+            if cells[neighbour] != barrier and not bits[neighbour >> 3] >> (neighbour & 7) & 1:
+                bits[neighbour >> 3] |= 1 << (neighbour & 7)
+                stack.append(neighbour)
+
+    return size
+
+def region_sizes(grid, seed=LAND, barrier=WATER):
+    """
+    Yields the size of every region that contains a seed cell, in the order of their first cell.
+
+    Time complexity:
+        O(rc) product of the number of rows and columns
+    """
+    cells = grid.cells
+    visited = grid.visited()
+    # bytearray.find jumps to the next seed cell in C
+    index = cells.find(seed)
+    while index != -1:
+        size = flood_fill(grid, index, visited, barrier)
+        if size:
+            yield size
+        index = cells.find(seed, index + 1)
+
+class Regions:
+    """
+    The regions of a grid labelled by label_regions, as horizontal runs of cells.
+
+    Attributes:
+        starts: array('q') of the flat index where each run starts, in row major order
+        ends: array('q') of the flat index just past each run
+        run_labels: array('q') of the region number of each run
+        sizes: list of the number of cells in each region, numbered in the order of their first cell
+    """
+    __slots__ = ("starts", "ends", "run_labels", "sizes")
+
+    def __init__(self, starts, ends, run_labels, sizes):
+        self.starts = starts
+        self.ends = ends
+        self.run_labels = run_labels
+        self.sizes = sizes
+
+    def __len__(self):
+        return len(self.sizes)
+
+    def label_array(self, size):
+        """
+        Returns an array('q') of size cells holding the region number of every cell, -1 outside every region.
+        """
+        labels = array("q", [-1]) * size
+        for start, end, label in zip(self.starts, self.ends, self.run_labels):
+            labels[start:end] = array("q", [label]) * (end - start)
+        return labels
+
+def label_regions(grid, seed=LAND):
+    """
+    Labels the connected regions of seed cells with a union-find over horizontal runs.
+
+    Each row is split into runs of seed cells by a regular expression, in C. A run joins every
+    run of the row above it overlaps, so the Python work is per run and per overlap rather than
+    per cell, and no search is made from any cell.
+
+    Args:
+        grid: a Grid
+        seed: the cell byte the regions are made of, e.g. LAND
+
+    Returns:
+        Regions: the runs, their region numbers and the size of every region
+
+    Time complexity:
+        O(rc) for the run search in C, then O(k α(k)) in Python where k is the number of runs
+    """
+    cells = grid.cells
+    columns = grid.columns
+    run = re.compile(re.escape(bytes([seed])) + b"+")
+    starts = array("q")
+    ends = array("q")
+    parent = []
+    # Number of runs under every root, so union hangs the smaller tree under the larger
+    tree_size = []
+
+    def find(node):
+        # Path halving: every node visited now points to its grandparent
+        while parent[node] != node:
+            parent[node] = parent[parent[node]]
+            node = parent[node]
+        return node
+
+    above_first = 0
+    for row_start in range(0, len(cells), max(columns, 1)):
+        first = len(starts)
+        for match in run.finditer(cells, row_start, row_start + columns):
+            starts.append(match.start())
+            ends.append(match.end())
+            parent.append(len(parent))
+            tree_size.append(1)
+
+        # Walk the runs of the row above and of this row together, joining the ones that overlap
+        above, current = above_first, first
+        while above < first and current < len(starts):
+            above_start, above_end = starts[above] + columns, ends[above] + columns
+            if above_end <= starts[current]:
+                above += 1
+            elif ends[current] <= above_start:
+                current += 1
+            else:
+                root_current, root_above = find(current), find(above)
+                if root_current != root_above:
+                    # Union by size, as in structy.union_find
+                    if tree_size[root_current] > tree_size[root_above]:
+                        root_current, root_above = root_above, root_current
+                    parent[root_current] = root_above
+                    tree_size[root_above] += tree_size[root_current]
+                if above_end < ends[current]:
+                    above += 1
+                else:
+                    current += 1
+        above_first = first
+
+    # Number the regions in the order of their first run, which holds their first cell
+    root_labels = [-1] * len(parent)
+    run_labels = array("q")
+    sizes = []
+    for index in range(len(parent)):
+        root = find(index)
+        if root_labels[root] == -1:
+            root_labels[root] = len(sizes)
+            sizes.append(0)
+        run_labels.append(root_labels[root])
+        sizes[root_labels[root]] += ends[index] - starts[index]
+
+    return Regions(starts, ends, run_labels, sizes)
+
+def island_sizes(grid):
+    """
+    Returns the size of every island of 'L' cells, in the order of their first cell.
+
+    Args:
+        grid: a Grid or a list of lists of 'W' and 'L'
+    """
+    return label_regions(as_grid(grid), LAND).sizes
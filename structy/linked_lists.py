@@ -0,0 +1,22 @@
+"""
+Solutions from 03_linked_lists.
+"""
+from structy._loader import lazy_solutions
+
+SOLUTIONS = {
+    "linked_list_values": ("20250114_linked_list_values.py", "linked_list_values"),
+    "sum_list": ("20250114_sum_list.py", "sum_list"),
+    "get_node_value": ("20250116_get_node_value.py", "get_node_value"),
+    "linked_list_find": ("20250116_linked_list_find.py", "linked_list_find"),
+    "reverse_list": ("20250116_reverse_list.py", "reverse_list"),
+    "merge_lists": ("20250119_merge_lists.py", "merge_lists"),
+    "zipper_lists": ("20250119_zipper_lists.py", "zipper_lists"),
+    "is_univalue_list": ("20250124_is_univalue_list.py", "is_univalue_list"),
+    "longest_streak": ("20250124_longest_streak.py", "longest_streak"),
+    "insert_node": ("20250125_insert_node.py", "insert_node"),
+    "remove_node": ("20250125_remove_node.py", "remove_node"),
+    "create_linked_list": ("20250127_create_linked_list.py", "create_linked_list"),
+    "add_lists": ("20250131_add_lists.py", "add_lists"),
+}
+
+__getattr__, __dir__ = lazy_solutions(__name__, "03_linked_lists", SOLUTIONS)
@@ -0,0 +1,38 @@
+"""
+The node types shared by the linked list and binary tree solutions.
+
+Both use __slots__, so an instance stores its attributes in fixed slots instead of a per-instance
+__dict__. That roughly halves the memory of a node (see python -m tools.node_memory) and means a
+node only takes the attributes below.
+
+The scripts import them under the name they always used:
+
+    from structy.nodes import ListNode as Node
+
+Run a script through structy from the repository root, so structy can be imported:
+    python -m structy 03_linked_lists/20250114_linked_list_values.py
+"""
+
+class ListNode:
+    __slots__ = ("val", "next")
+
+    def __init__(self, val):
+        self.val = val
+        self.next = None
+
+    def __str__(self):
+        # Convert the linked list to a string representation
+        current = self
+        values = []
+        while current is not None:
+            values.append(str(current.val))
+            current = current.next
+        return ' -> '.join(values)
+
+class TreeNode:
+    __slots__ = ("val", "left", "right")
+
+    def __init__(self, val):
+        self.val = val
+        self.left = None
+        self.right = None
@@ -0,0 +1,15 @@
+"""
+Solutions from 02_beginner_recursion.
+"""
+from structy._loader import lazy_solutions
+
+SOLUTIONS = {
+    "sum_numbers_recursive": ("20250107_sum_number_recursive.py", "sum_numbers_recursive"),
+    "factorial": ("20250108_factorial.py", "factorial"),
+    "sum_of_lengths": ("20250109_sum_of_lengths.py", "sum_of_lengths"),
+    "palindrome": ("20250111_palindrome.py", "palindrome"),
+    "reverse_string": ("20250111_reverse_string_recursive.py", "reverse_string"),
+    "fibonacci": ("20250113_fibonacci.py", "fibonacci"),
+}
+
+__getattr__, __dir__ = lazy_solutions(__name__, "02_beginner_recursion", SOLUTIONS)
@@ -0,0 +1,56 @@
+"""
+Solutions from 04_binary_trees.
+
+Where a problem was solved several ways, the plain name is the preferred iterative variant and
+every variant is also available under its own name.
+"""
+from structy._loader import lazy_solutions
+
+SOLUTIONS = {
+    "depth_first_values": ("20250201_depth_first_values.py", "depth_first_values"),
+    "depth_first_values_recursive": ("20250201_depth_first_values_recursive.py", "depth_first_values"),
+    "breadth_first_values": ("20250202_breadth_first_values.py", "breadth_first_values"),
+    "breadth_first_values_pointer": ("20250202_breadth_first_values_pointer.py", "breadth_first_values"),
+    "tree_sum": ("20250202_tree_sum_breadth.py", "tree_sum"),
+    "tree_sum_breadth": ("20250202_tree_sum_breadth.py", "tree_sum"),
+    "tree_sum_depth": ("20250202_tree_sum_depth.py", "tree_sum"),
+    "tree_sum_depth_recursive": ("20250203_tree_sum_depth_recursive.py", "tree_sum"),
+    "tree_includes": ("20250203_tree_includes_breadth.py", "tree_includes"),
+    "tree_includes_breadth": ("20250203_tree_includes_breadth.py", "tree_includes"),
+    "tree_includes_depth": ("20250203_tree_includes_depth.py", "tree_includes"),
+    "tree_includes_depth_recursive": ("20250203_tree_includes_depth_recursive.py", "tree_includes"),
+    "tree_min_value": ("20250207_tree_min_value_breadth.py", "tree_min_value"),
+    "tree_min_value_breadth": ("20250207_tree_min_value_breadth.py", "tree_min_value"),
+    "tree_min_value_depth": ("20250207_tree_min_value_depth.py", "tree_min_value"),
+    "tree_min_value_depth_recursive": ("20250207_tree_min_value_depth_recursive.py", "tree_min_value"),
+    "max_path_sum": ("20250208_max_path_sum.py", "max_path_sum"),
+    "max_path_sum_recursive": ("20250208_max_path_sum_recursive.py", "max_path_sum"),
+    "path_finder": ("20250215_path_finder.py", "path_finder"),
+    "path_finder_efficient": ("20250215_path_finder_efficient.py", "path_finder"),
+    "tree_value_count": ("20250216_tree_value_count_breadth.py", "tree_value_count"),
+    "tree_value_count_breadth": ("20250216_tree_value_count_breadth.py", "tree_value_count"),
+    "tree_value_count_depth": ("20250216_tree_value_count_depth.py", "tree_value_count"),
+    "tree_value_count_recursive": ("20250216_tree_value_count_recursive.py", "tree_value_count"),
+    "how_high": ("20250217_how_high_depth.py", "how_high"),
+    "how_high_depth": ("20250217_how_high_depth.py", "how_high"),
+    "how_high_recursive": ("20250217_how_high_recursive.py", "how_high"),
+    "bottom_right_value": ("20250222_bottom_right_value_breadth.py", "bottom_right_value"),
+    "bottom_right_value_breadth": ("20250222_bottom_right_value_breadth.py", "bottom_right_value"),
+    "bottom_right_value_recursive": ("20250222_bottom_right_value_recursive.py", "bottom_right_value"),
+    "all_tree_paths": ("20250223_all_tree_paths_depth.py", "all_tree_paths"),
+    "all_tree_paths_depth": ("20250223_all_tree_paths_depth.py", "all_tree_paths"),
+    "all_tree_paths_recursive": ("20250223_all_tree_paths_recursive.py", "all_tree_paths"),
+    "leaf_list": ("20250223_leaf_list_stack.py", "leaf_list"),
+    "leaf_list_stack": ("20250223_leaf_list_stack.py", "leaf_list"),
+    "leaf_list_recursive": ("20250223_leaf_list_recursive.py", "leaf_list"),
+    "level_averages": ("20250223_level_averages_queue.py", "level_averages"),
+    "level_averages_queue": ("20250223_level_averages_queue.py", "level_averages"),
+    "level_averages_queue_pointer": ("20250223_level_averages_queue_pointer.py", "level_averages"),
+    "level_averages_stack": ("20250223_level_averages_stack.py", "level_averages"),
+    "tree_levels": ("20250223_tree_levels_queue.py", "tree_levels"),
+    "tree_levels_queue": ("20250223_tree_levels_queue.py", "tree_levels"),
+    "tree_levels_recursive": ("20250223_tree_levels_recursive.py", "tree_levels"),
+    "tree_levels_stack": ("20250223_tree_levels_stack.py", "tree_levels"),
+}
+
+__getattr__, __dir__ = lazy_solutions(__name__, "04_binary_trees", SOLUTIONS)
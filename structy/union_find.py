@@ -0,0 +1,152 @@
+"""
+A union-find (disjoint set) engine that tracks the connected components of a graph as its edges arrive.
+
+    from structy.union_find import UnionFind
+
+    components = UnionFind()
+    for a, b in edges:                          # any edge stream, no adjacency list needed
+        components.union(a, b)
+    components.count, components.largest        # number of components, size of the largest
+
+Every node label is interned to an id 0..n-1. parent[id] leads towards the root of the node's
+component and size[root] is the component's size. find compresses every path it walks and
+union hangs the smaller tree under the larger, so any sequence of m operations on n nodes takes
+O(m α(n)), near linear, with no recursion. The component count and the largest size are kept
+up to date by every union, so both are O(1) to read.
+"""
+
+class UnionFind:
+    """
+    Disjoint sets of node labels with path compression and union by size.
+
+    Attributes:
+        ids: dict of node label -> id
+        parent: list of the parent id of every id, roots are their own parent
+        size: list of the component size of every root id
+        count: number of components
+        largest: size of the largest component, 0 when empty
+    """
+    __slots__ = ("ids", "parent", "size", "count", "largest")
+
+    def __init__(self, nodes=()):
+        self.ids = {}
+        self.parent = []
+        self.size = []
+        self.count = 0
+        self.largest = 0
+        for label in nodes:
+            self.add(label)
+
+    @classmethod
+    def from_edges(cls, edges, nodes=()):
+        """
+        Builds the components of an undirected graph from [a, b] pairs, e.g. a stream read from a file.
+
+        Time complexity:
+            O(n + e α(n))
+        """
+        components = cls(nodes)
+        components.add_edges(edges)
+        return components
+
+    def __len__(self):
+        return len(self.parent)
+
+    def __contains__(self, label):
+        return label in self.ids
+
+    def add(self, label):
+        """
+        Adds label as a component of its own, unless it is already known.
+
+        Returns:
+            int: the id of label
+        """
+        node = self.ids.get(label)
+        if node is None:
+            node = self.ids[label] = len(self.parent)
+            self.parent.append(node)
+            self.size.append(1)
+            self.count += 1
+            self.largest = max(self.largest, 1)
+        return node
+
+    def find_root(self, node):
+        """
+        Returns the root id of the component of the id node, pointing every id on the way straight at it.
+        """
+        parent = self.parent
+        root = node
+        while parent[root] != root:
+            root = parent[root]
+        # Path compression, in a second pass instead of recursion
+        while parent[node] != root:
+            parent[node], node = root, parent[node]
+        return root
+
+    def find(self, label):
+        """
+        Returns the root id of the component of label, which is the same for every label of that component.
+
+        Raises:
+            KeyError: when label was never added
+        """
+        return self.find_root(self.ids[label])
+
+    def union(self, label_a, label_b):
+        """
+        Joins the components of label_a and label_b, adding either label when it is new.
+
+        Returns:
+            bool: True when two components were joined, False when they were already one
+        """
+        ids = self.ids
+        node_a = ids.get(label_a)
+        if node_a is None:
+            node_a = self.add(label_a)
+        node_b = ids.get(label_b)
+        if node_b is None:
+            node_b = self.add(label_b)
+        # Nodes with the same parent are already in one component, common once paths are compressed
+        parent = self.parent
+        if parent[node_a] == parent[node_b]:
+            return False
+        root_a = self.find_root(node_a)
+        root_b = self.find_root(node_b)
+        if root_a == root_b:
+            return False
+        # Union by size: the smaller tree goes under the larger, so trees stay O(log n) deep
+        if self.size[root_a] < self.size[root_b]:
+            root_a, root_b = root_b, root_a
+        self.parent[root_b] = root_a
+        self.size[root_a] += self.size[root_b]
+        self.count -= 1
+        self.largest = max(self.largest, self.size[root_a])
+        return True
+
+    def add_edges(self, edges):
+        """
+        Joins the components of both ends of every [a, b] pair.
+        """
+        for label_a, label_b in edges:
+            self.union(label_a, label_b)
+
+    def connected(self, label_a, label_b):
+        """
+        Returns True when label_a and label_b are in the same component, False when not or when either is unknown.
+        """
+        if label_a not in self.ids or label_b not in self.ids:
+            return False
+        return self.find(label_a) == self.find(label_b)
+
+    def component_size(self, label):
+        """
+        Returns the number of nodes in the component of label.
+        """
+        return self.size[self.find(label)]
+
+    def component_sizes(self):
+        """
+        Returns the size of every component, in the order of their root ids.
+        """
+        return [self.size[node] for node, parent in enumerate(self.parent) if node == parent]
@@ -0,0 +1,90 @@
+"""
+Races one structy.graph.distance call per query against structy.graph.batch_distance.
+
+Both run on the same prebuilt Graph. The queries are random pairs whose first node is one of a
+few sources, as bulk reachability checks tend to be. One call per query is timed on the first
+--sample queries only and scaled up to all of them, since on a directed graph each call may
+search the whole graph.
+
+The bit-parallel batch gains the most where the searches of different sources overlap, as on
+these random graphs: a level costs one pass over the frontier for every source in it. On graphs
+with a long diameter and little overlap, such as a ring, the frontiers barely share nodes and
+the batch is no faster.
+
+Usage (from the repository root):
+    python -m tools.batch_query_benchmark                           # 100k nodes, directed and undirected
+    python -m tools.batch_query_benchmark --nodes 10000 --sources 1000 --queries 50000
+"""
+import argparse
+import random
+import time
+
+from structy.graph import Graph, batch_distance, distance
+from tools import generators
+
+def compare(nodes, degree, directed, sources, queries, sample, seed=0):
+    """
+    Times both ways of answering the same queries on one random graph.
+
+    Returns:
+        dict: the seconds of each, the one call per query time scaled from the sample, and
+            whether the sampled answers agreed
+    """
+    rng = random.Random(f"{nodes}:{degree}:{directed}:{seed}")
+    edges = generators.random_edges(nodes, nodes * degree // (1 if directed else 2), seed=rng)
+    graph = Graph.from_edges(edges, directed=directed)
+    starts = [rng.choice(graph.labels) for _ in range(sources)]
+    pairs = [(rng.choice(starts), rng.choice(graph.labels)) for _ in range(queries)]
+    sample = min(sample, queries)
+
+    start_time = time.perf_counter()
+    one_by_one = [distance(graph, node_A, node_B) for node_A, node_B in pairs[:sample]]
+    per_query_s = (time.perf_counter() - start_time) / max(sample, 1) * queries
+
+    start_time = time.perf_counter()
+    batched = batch_distance(graph, pairs)
+    batch_s = time.perf_counter() - start_time
+
+    return {
+        "nodes": nodes,
+        "degree": degree,
+        "directed": directed,
+        "sources": sources,
+        "queries": queries,
+        "per_query_s": per_query_s,
+        "batch_s": batch_s,
+        "agrees": one_by_one == batched[:sample],
+    }
+
+def format_table(records):
+    header = (
+        f"{'nodes':>9} {'degree':>6} {'directed':>8} {'sources':>7} {'queries':>7} "
+        f"{'per query s':>12} {'batch s':>8} {'speedup':>8}  agrees"
+    )
+    lines = [header, "-" * len(header)]
+    for record in records:
+        lines.append(
+            f"{record['nodes']:>9} {record['degree']:>6} {'yes' if record['directed'] else 'no':>8} "
+            f"{record['sources']:>7} {record['queries']:>7} {record['per_query_s']:>12.2f} {record['batch_s']:>8.2f} "
+            f"{record['per_query_s'] / record['batch_s']:>7.1f}x  {'yes' if record['agrees'] else 'NO'}"
+        )
+    return "\n".join(lines)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Race one distance call per query against batch_distance.")
+    parser.add_argument("--nodes", nargs="+", type=int, default=[100_000], help="numbers of nodes")
+    parser.add_argument("--degree", type=int, default=4, help="average degree")
+    parser.add_argument("--sources", type=int, default=100, help="distinct first nodes of the queries")
+    parser.add_argument("--queries", type=int, default=10_000, help="query pairs per graph")
+    parser.add_argument("--sample", type=int, default=200, help="queries timed one call at a time")
+    parser.add_argument("--seed", type=int, default=0, help="seed for the graphs and queries")
+    arguments = parser.parse_args(argv)
+    records = [
+        compare(nodes, arguments.degree, directed, arguments.sources, arguments.queries, arguments.sample, arguments.seed)
+        for nodes in arguments.nodes
+        for directed in (True, False)
+    ]
+    print(format_table(records))
+
+if __name__ == "__main__":
+    main()
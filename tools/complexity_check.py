@@ -0,0 +1,265 @@
+"""
+Checks the "Time complexity" claim of every solution docstring against measured scaling.
+
+Each solution with an input builder in tools/problems.py is timed over a doubling series of
+generated inputs. The growth exponent is fitted on a log-log scale and compared to the degree of
+the Big-O in the docstring, e.g. O(n) -> 1, O(n^2) -> 2, O(rc) on a square grid of n cells -> 1.
+
+Usage (from the repository root):
+    python -m tools.complexity_check                       # every solution with an input builder
+    python -m tools.complexity_check compress uncompress --start 4000 --steps 6
+"""
+import argparse
+import ast
+import math
+import random
+import re
+import time
+
+from tools.discovery import solution_files, solution_function_name, load_function, variant_name
+from tools.problems import PROBLEMS
+from tools.race_variants import load_test_runner
+
+# Letters that name a growing quantity in the docstrings: n, m (lengths), e (edges),
+# r, c (rows, columns), h, w (tree height, width), v (vertices), k
+VARIABLES = set("nmerchwvk")
+
+# How far the fitted exponent may stray from the claimed degree before it is flagged. Halfway
+# between whole degrees: pointer-chasing solutions measure up to ~1.4 on linear work as their
+# inputs outgrow the CPU caches, while an accidental quadratic measures close to 2.
+TOLERANCE = 0.5
+
+def claimed_complexity(docstring):
+    """
+    Returns the first Big-O expression of the "Time complexity" section of a docstring, e.g. "O(n * m)".
+
+    Args:
+        docstring: the solution's docstring
+
+    Returns:
+        str or None: the expression including O( and the closing bracket, None when there is no claim
+    """
+    if not docstring:
+        return None
+    section = re.search(r"time complexity\s*:?(.*?)(space complexity|$)", docstring, re.IGNORECASE | re.DOTALL)
+    if not section:
+        return None
+    text = section.group(1)
+    start = text.find("O(")
+    if start == -1:
+        return None
+
+    # Walk to the matching bracket so nested calls like O(min(n,m)) stay whole
+    depth = 0
+    for index in range(start + 1, len(text)):
+        if text[index] == "(":
+            depth += 1
+        elif text[index] == ")":
+            depth -= 1
+            if depth == 0:
+                return text[start:index + 1]
+    return None
+
+def split_top_level(expression, separator):
+    """
+    Splits an expression on separator, ignoring separators inside brackets.
+    """
+    parts = []
+    depth = 0
+    current = ""
+    for character in expression:
+        if character == "(":
+            depth += 1
+        elif character == ")":
+            depth -= 1
+        if character == separator and depth == 0:
+            parts.append(current)
+            current = ""
+        else:
+            current += character
+    parts.append(current)
+    return parts
+
+def growth_degree(claim, scaling=None):
+    """
+    Returns the polynomial degree of a Big-O claim in terms of the generated input size.
+
+    Args:
+        claim: a Big-O expression such as "O(n + m)", "O(n²)", "O(rc)" or "O(2^n)"
+        scaling: exponent of each variable relative to the input size, defaulting to 1
+
+    Returns:
+        float: the degree, math.inf for an exponential claim, or None when the claim cannot be read
+    """
+    expression = claim[2:-1].lower().replace(" ", "").replace("²", "^2")
+    return expression_degree(expression, scaling or {})
+
+def expression_degree(expression, scaling):
+    if not expression:
+        return None
+
+    for function, combine in (("min(", min), ("max(", max)):
+        if expression.startswith(function) and expression.endswith(")"):
+            degrees = [expression_degree(part, scaling) for part in split_top_level(expression[4:-1], ",")]
+            return None if None in degrees else combine(degrees)
+
+    terms = split_top_level(expression, "+")
+    if len(terms) > 1:
+        degrees = [expression_degree(term, scaling) for term in terms]
+        return None if None in degrees else max(degrees)
+
+    factors = split_top_level(expression, "*")
+    if len(factors) > 1:
+        degrees = [expression_degree(factor, scaling) for factor in factors]
+        return None if None in degrees else sum(degrees)
+
+    if expression.startswith("(") and expression.endswith(")"):
+        return expression_degree(expression[1:-1], scaling)
+    if expression.isdigit():
+        return 0
+
+    exponential = re.fullmatch(r"\d+\^(.+)", expression)
+    if exponential:
+        degree = expression_degree(exponential.group(1), scaling)
+        return None if degree is None else (math.inf if degree > 0 else 0)
+
+    power = re.fullmatch(r"(.+)\^(\d+(?:\.\d+)?)", expression)
+    if power:
+        degree = expression_degree(power.group(1), scaling)
+        return None if degree is None else degree * float(power.group(2))
+
+    if expression.startswith("sqrt(") and expression.endswith(")"):
+        degree = expression_degree(expression[5:-1], scaling)
+        return None if degree is None else degree / 2
+
+    # Logarithms grow slower than any power: n log n counts as degree 1
+    if "log" in expression:
+        before = expression[:expression.index("log")]
+        return expression_degree(before, scaling) if before else 0
+
+    # Juxtaposed variables multiply, e.g. rc
+    if all(character in VARIABLES for character in expression):
+        return sum(scaling.get(character, 1) for character in expression)
+    return None
+
+def fit_exponent(sizes, timings):
+    """
+    Returns the slope of the least squares line through (log size, log time).
+    """
+    xs = [math.log(size) for size in sizes]
+    ys = [math.log(timing) for timing in timings]
+    mean_x = sum(xs) / len(xs)
+    mean_y = sum(ys) / len(ys)
+    numerator = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys))
+    denominator = sum((x - mean_x) ** 2 for x in xs)
+    return numerator / denominator
+
+def verdict(degree, exponent, tolerance=TOLERANCE):
+    """
+    Compares the claimed degree with the measured exponent.
+    """
+    if degree is None:
+        return "claim not understood"
+    if exponent > degree + tolerance:
+        return "SLOWER than claimed"
+    if exponent < degree - tolerance:
+        return "faster than claimed"
+    return "ok"
+
+def doubling_sizes(start, steps, max_size=None):
+    """
+    Returns steps sizes doubling from start, shifted down so the largest does not exceed max_size.
+    """
+    top = start * 2 ** (steps - 1)
+    if max_size is not None:
+        top = min(top, max_size)
+    return [max(1, top // 2 ** step) for step in reversed(range(steps))]
+
+def measure(function, problem, size, seed, samples):
+    """
+    Returns the median time in microseconds of one call on a generated input of the given size.
+    """
+    rng = random.Random(f"{seed}:{size}")
+    if not problem.mutates:
+        args = problem.build(size, rng)
+        return load_test_runner().run_benchmark(
+            lambda: function(*args), warmup=1, samples=samples, min_sample_time=0.005
+        )["median"]
+
+    # Solutions that change their input get a fresh input for every timed call
+    timings = []
+    for _ in range(samples):
+        args = problem.build(size, rng)
+        start_time = time.perf_counter()
+        function(*args)
+        timings.append((time.perf_counter() - start_time) * 1_000_000)
+    timings.sort()
+    return timings[len(timings) // 2]
+
+def check(path, start=2_000, steps=5, seed=0, samples=5):
+    """
+    Measures one solution's scaling and compares it with its docstring.
+
+    Returns:
+        dict: the record for the report, with the claim, claimed degree, fitted exponent and verdict
+    """
+    function_name = solution_function_name(path)
+    problem = PROBLEMS[function_name]
+    tree = ast.parse(path.read_text())
+    definition = next(node for node in tree.body if isinstance(node, ast.FunctionDef) and node.name == function_name)
+    claim = claimed_complexity(ast.get_docstring(definition))
+
+    record = {"function": function_name, "variant": variant_name(path), "claim": claim}
+    if claim is None:
+        record["verdict"] = "no claim"
+        return record
+    degree = growth_degree(claim, problem.scaling)
+    record["degree"] = degree
+
+    sizes = doubling_sizes(start, steps, problem.max_size)
+    function = load_function(path, function_name)
+    try:
+        timings = [measure(function, problem, size, seed, samples) for size in sizes]
+    except Exception as error:
+        # Report the failure (usually RecursionError) in the table rather than stopping the run
+        record["verdict"] = type(error).__name__
+        return record
+
+    record["sizes"] = sizes
+    record["timings"] = timings
+    record["exponent"] = fit_exponent(sizes, timings)
+    record["verdict"] = verdict(degree, record["exponent"])
+    return record
+
+def format_report(records):
+    header = f"{'variant':<34} {'claim':<18} {'degree':>7} {'measured':>9}  verdict"
+    lines = [header, "-" * len(header)]
+    for record in records:
+        degree = record.get("degree")
+        degree_text = "-" if degree is None else ("exp" if degree == math.inf else f"{degree:g}")
+        exponent = record.get("exponent")
+        exponent_text = "-" if exponent is None else f"{exponent:.2f}"
+        lines.append(
+            f"{record['variant']:<34} {record['claim'] or '-':<18} {degree_text:>7} {exponent_text:>9}  {record['verdict']}"
+        )
+    return "\n".join(lines)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Check docstring time complexity claims empirically.")
+    parser.add_argument("functions", nargs="*", help="function names to check (default: all with input builders)")
+    parser.add_argument("--start", type=int, default=2_000, help="smallest input size")
+    parser.add_argument("--steps", type=int, default=5, help="number of doublings")
+    parser.add_argument("--seed", type=int, default=0, help="seed for the input generators")
+    parser.add_argument("--samples", type=int, default=5, help="timed samples per size")
+    arguments = parser.parse_args(argv)
+
+    records = []
+    for path in solution_files():
+        function_name = solution_function_name(path)
+        if function_name not in PROBLEMS or (arguments.functions and function_name not in arguments.functions):
+            continue
+        records.append(check(path, arguments.start, arguments.steps, arguments.seed, arguments.samples))
+    print(format_report(records))
+
+if __name__ == "__main__":
+    main()
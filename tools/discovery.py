@@ -0,0 +1,259 @@
+import ast
+import io
+import re
+import tokenize
+from collections import defaultdict
+from pathlib import Path
+
+# The loader lives with the structy package; tools import it from here
+from structy._loader import REPO_ROOT, execute_script, load_module
+
+# Topic directories are numbered e.g. 01_arrays_and_strings, 05_graphs
+SOLUTION_DIRECTORY_PATTERN = re.compile(r"^\d\d_")
+
+# Modules that support the solutions rather than solve a problem
+HELPER_MODULES = {"test_runner.py"}
+
+DATE_PREFIX = re.compile(r"^\d{8}_")
+
+def solution_directories():
+    """
+    Returns the numbered topic directories in order.
+    """
+    return sorted(
+        path for path in REPO_ROOT.iterdir()
+        if path.is_dir() and SOLUTION_DIRECTORY_PATTERN.match(path.name)
+    )
+
+def solution_files():
+    """
+    Returns every solution script in every topic directory, in order.
+    """
+    files = []
+    for directory in solution_directories():
+        files.extend(
+            path for path in sorted(directory.glob("*.py"))
+            if path.name not in HELPER_MODULES
+        )
+    return files
+
+def variant_name(path):
+    """
+    Returns the file name without the date prefix e.g. 20250303_has_path_bfs.py -> has_path_bfs
+    """
+    return DATE_PREFIX.sub("", Path(path).stem)
+
+def solution_function_name(path):
+    """
+    Returns the name of the function a script solves, read from its source without importing it.
+
+    Every script defines its solution first, followed by helpers (explore, construct_graph)
+    and the test_* functions, so the solution is the first top-level function that is not a test.
+
+    Args:
+        path: path to the solution script
+
+    Returns:
+        str or None: the function name, or None when the script defines no function
+    """
+    tree = ast.parse(Path(path).read_text())
+    for node in tree.body:
+        if isinstance(node, ast.FunctionDef) and not node.name.startswith("test"):
+            return node.name
+    return None
+
+def find_variants(names=None, min_variants=2):
+    """
+    Groups solution scripts by the function they implement.
+
+    Args:
+        names: optional iterable of function names to keep
+        min_variants: only keep functions implemented by at least this many scripts
+
+    Returns:
+        dict: function name -> list of script paths
+    """
+    variants = defaultdict(list)
+    for path in solution_files():
+        function_name = solution_function_name(path)
+        if function_name is not None:
+            variants[function_name].append(path)
+
+    wanted = set(names) if names else None
+    return {
+        function_name: paths for function_name, paths in variants.items()
+        if len(paths) >= min_variants and (wanted is None or function_name in wanted)
+    }
+
+def load_function(path, function_name=None):
+    """
+    Returns the solution function defined by a script.
+    """
+    if function_name is None:
+        function_name = solution_function_name(path)
+    return getattr(load_module(path), function_name)
+
+### TEST CASES
+class TestCase:
+    """
+    One test found in a solution script, without running it.
+
+    Args:
+        name: the test function, or for a module level demo the assigned name or "line <n>"
+        line: line number in the script
+        expression: None for a test_* function, otherwise the source of the module level
+            expression whose value is checked, e.g. "five_sort([5, 5, 6])"
+        expected: the expected value when one was found
+        has_expected: False when the script gives no expected value, or gives one that is not a
+            Python literal (expected_text then holds the comment, e.g. "f -> e -> d")
+        expected_text: the expected value as written
+    """
+    def __init__(self, name, line, expression=None, expected=None, has_expected=False, expected_text=None):
+        self.name = name
+        self.line = line
+        self.expression = expression
+        self.expected = expected
+        self.has_expected = has_expected
+        self.expected_text = expected_text
+
+def line_comments(source):
+    """
+    Returns {line number: comment text without the #} for every comment in the source.
+    """
+    comments = {}
+    for token in tokenize.generate_tokens(io.StringIO(source).readline):
+        if token.type == tokenize.COMMENT:
+            comments[token.start[0]] = token.string[1:].strip()
+    return comments
+
+def comment_expectation(comments, source_lines, line, require_arrow):
+    """
+    Reads the expected value written in the comment at the end of a line.
+
+    The scripts write it as "# -> value" or, in some graph scripts, "# value". A bare "# ->"
+    continues on the comment-only lines below it, as in the all_tree_paths tests, and a test
+    whose last line has no comment may give its result on the comment lines right below it,
+    as in the linked list tests.
+
+    Returns:
+        str or None: the expected value as written
+    """
+    comment = comments.get(line)
+    if comment is None and require_arrow:
+        return None
+    if comment is not None and comment.startswith("->"):
+        text = comment[2:].strip()
+    elif require_arrow:
+        return None
+    else:
+        text = comment
+
+    if not text:
+        following = []
+        line += 1
+        while line <= len(source_lines) and source_lines[line - 1].strip().startswith("#"):
+            following.append(comments[line])
+            line += 1
+        text = " ".join(following)
+        if text.startswith("->"):
+            text = text[2:]
+    return text.rstrip(";").strip() or None
+
+def contains_ellipsis(value):
+    if value is Ellipsis:
+        return True
+    if isinstance(value, (list, tuple, set)):
+        return any(contains_ellipsis(item) for item in value)
+    if isinstance(value, dict):
+        return any(contains_ellipsis(item) for item in value.values())
+    return False
+
+def make_case(name, line, expression, expected_text):
+    case = TestCase(name, line, expression, expected_text=expected_text)
+    if expected_text == "null":
+        # Structy's name for None, as in the empty linked list tests
+        case.has_expected = True
+        return case
+    if expected_text is not None:
+        try:
+            expected = ast.literal_eval(expected_text)
+        except (ValueError, SyntaxError):
+            return case
+        # An elided value such as [0, 1, ..., 16281] only describes the result
+        if not contains_ellipsis(expected):
+            case.expected = expected
+            case.has_expected = True
+    return case
+
+def is_main_guard(node):
+    """
+    Returns True for an `if __name__ == "__main__":` statement.
+    """
+    return (
+        isinstance(node, ast.If) and isinstance(node.test, ast.Compare)
+        and isinstance(node.test.left, ast.Name) and node.test.left.id == "__name__"
+        and len(node.test.comparators) == 1 and isinstance(node.test.comparators[0], ast.Constant)
+        and node.test.comparators[0].value == "__main__"
+    )
+
+def module_statements(tree):
+    """
+    Returns the top level statements of a parsed script with the main guard replaced by its body.
+    """
+    statements = []
+    for node in tree.body:
+        statements.extend(node.body if is_main_guard(node) else [node])
+    return statements
+
+def discover_tests(path):
+    """
+    Finds every test in a solution script and its expected value, reading the source only.
+
+    Tests are the test_* functions, with the expected value taken from a module level
+    test_runner(test_x, expected) call or else from the comment on the function's last line.
+    Demos in the main guard such as `test_case_a = five_sort([...]) # -> [...]` or
+    `print(pair_sum(numbers, 11999)) # -> (5998, 5999)` are tests too, when they have an arrow comment.
+
+    Args:
+        path: path to the solution script
+
+    Returns:
+        list[TestCase]: in source order
+    """
+    source = Path(path).read_text()
+    source_lines = source.splitlines()
+    tree = ast.parse(source)
+    comments = line_comments(source)
+
+    runner_expectations = {}
+    for node in ast.walk(tree):
+        if (
+            isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and node.func.id == "test_runner"
+            and len(node.args) >= 2 and isinstance(node.args[0], ast.Name)
+        ):
+            runner_expectations[node.args[0].id] = ast.get_source_segment(source, node.args[1])
+
+    cases = []
+    for node in module_statements(tree):
+        if isinstance(node, ast.FunctionDef) and node.name.startswith("test"):
+            if node.name in runner_expectations:
+                expected_text = runner_expectations[node.name]
+            else:
+                expected_text = comment_expectation(comments, source_lines, node.body[-1].end_lineno, require_arrow=False)
+            cases.append(make_case(node.name, node.lineno, None, expected_text))
+            continue
+
+        expected_text = comment_expectation(comments, source_lines, getattr(node, "end_lineno", 0), require_arrow=True)
+        if expected_text is None:
+            continue
+        if isinstance(node, ast.Assign) and len(node.targets) == 1 and isinstance(node.targets[0], ast.Name):
+            name, expression = node.targets[0].id, node.value
+        elif (
+            isinstance(node, ast.Expr) and isinstance(node.value, ast.Call) and isinstance(node.value.func, ast.Name)
+            and node.value.func.id == "print" and len(node.value.args) == 1
+        ):
+            name, expression = f"line {node.lineno}", node.value.args[0]
+        else:
+            continue
+        cases.append(make_case(name, node.lineno, ast.get_source_segment(source, expression), expected_text))
+    return cases
@@ -0,0 +1,113 @@
+"""
+Races the ways of finding every island of a grid: the recursive explore_island the scripts used
+first, structy.grid.flood_fill on an explicit stack, and label_regions, a union-find over
+horizontal runs of land.
+
+The recursive reference works on the same Grid and VisitedBitmap as flood_fill, so that pair
+compares only recursion against the explicit stack. Each grid is searched for every island;
+the table shows the median time, the peak memory traced while searching and "RecursionError"
+where the recursive version reaches the recursion limit.
+
+Usage (from the repository root):
+    python -m tools.flood_fill_benchmark                       # 100, 300 and 1000 sided grids
+    python -m tools.flood_fill_benchmark --sides 2000 --land-ratios 0.4 0.7 1.0
+"""
+import argparse
+import tracemalloc
+
+from structy.grid import LAND, WATER, Grid, label_regions, region_sizes
+from tools import generators
+from tools.race_variants import load_test_runner
+
+DEFAULT_SIDES = [100, 300, 1000]
+# Below about 0.59 the islands stay small, above it one island spans the grid
+DEFAULT_LAND_RATIOS = [0.4, 0.7, 1.0]
+
+def recursive_region_sizes(grid):
+    """
+    The island sizes found by the recursive explore_island of the island scripts, for reference.
+    """
+    cells = grid.cells
+    visited = grid.visited()
+
+    def explore_island(index):
+        if cells[index] == WATER or index in visited:
+            return 0
+        visited.add(index)
+        size = 1
+        for neighbour in grid.neighbours(index):
+            size += explore_island(neighbour)
+        return size
+
+    for index in range(len(cells)):
+        if cells[index] == LAND and index not in visited:
+            yield explore_island(index)
+
+SEARCHES = {
+    "recursive": recursive_region_sizes,
+    "flood_fill": region_sizes,
+    "row_runs": lambda grid: label_regions(grid).sizes,
+}
+
+def peak_bytes(function):
+    """
+    Returns (result of function(), peak bytes traced while it ran).
+    """
+    tracemalloc.start()
+    try:
+        result = function()
+        return result, tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+def compare(sides, land_ratios, seed=0, samples=5):
+    """
+    Times every search on every grid.
+
+    Returns:
+        list[dict]: per grid and search the median microseconds, peak bytes and island count,
+            or the error name when the search fails
+    """
+    test_runner = load_test_runner()
+    records = []
+    for side in sides:
+        for land_ratio in land_ratios:
+            grid = Grid.from_rows(generators.island_grid(side, side, land_ratio=land_ratio, seed=seed))
+            for name, search in SEARCHES.items():
+                record = {"search": name, "side": side, "land_ratio": land_ratio}
+                try:
+                    sizes, record["peak_bytes"] = peak_bytes(lambda: list(search(grid)))
+                except RecursionError as error:
+                    record["error"] = type(error).__name__
+                else:
+                    record["islands"] = len(sizes)
+                    record["largest"] = max(sizes, default=0)
+                    record["median_us"] = test_runner.run_benchmark(lambda: list(search(grid)), warmup=1, samples=samples)["median"]
+                records.append(record)
+    return records
+
+def format_table(records):
+    header = f"{'search':<11} {'side':>6} {'land':>5} {'islands':>8} {'largest':>9} {'median ms':>10} {'peak MiB':>9}"
+    lines = [header, "-" * len(header)]
+    for record in records:
+        start = f"{record['search']:<11} {record['side']:>6} {record['land_ratio']:>5.2f}"
+        if "error" in record:
+            lines.append(f"{start} {record['error']:>38}")
+        else:
+            lines.append(
+                f"{start} {record['islands']:>8} {record['largest']:>9} "
+                f"{record['median_us'] / 1000:>10.2f} {record['peak_bytes'] / 2 ** 20:>9.2f}"
+            )
+    return "\n".join(lines)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Race the recursive, explicit stack and row run island searches.")
+    parser.add_argument("--sides", nargs="+", type=int, default=DEFAULT_SIDES, help="grid side lengths")
+    parser.add_argument("--land-ratios", nargs="+", type=float, default=DEFAULT_LAND_RATIOS, help="share of land cells")
+    parser.add_argument("--seed", type=int, default=0, help="seed for the grid generator")
+    parser.add_argument("--samples", type=int, default=5, help="timed samples per search and grid")
+    arguments = parser.parse_args(argv)
+    print(format_table(compare(arguments.sides, arguments.land_ratios, arguments.seed, arguments.samples)))
+
+if __name__ == "__main__":
+    main()
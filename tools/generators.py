@@ -0,0 +1,359 @@
+"""
+Seeded, reproducible input generators at production size for every problem family.
+
+Every generator takes a seed, which may be an int (or any hashable) or a random.Random instance
+shared between calls, so the same seed always produces the same input.
+
+    from tools import generators
+
+    root = generators.random_tree(1_000_000, seed=1)
+    head = generators.linked_list(range(5_000_000))
+    graph = generators.layered_dag(100_000, depth=500, fan_out=3, seed=2)
+    grid = generators.island_grid(10_000, 10_000, land_ratio=0.4, seed=3)
+"""
+import random
+import string
+
+from structy.nodes import ListNode, TreeNode
+
+def as_random(seed):
+    """
+    Returns seed when it is already a random.Random, otherwise a new random.Random seeded with it.
+    """
+    return seed if isinstance(seed, random.Random) else random.Random(seed)
+
+### ARRAYS AND STRINGS
+def number_list(size, low=-1_000, high=1_000, seed=0):
+    """
+    Returns size random integers between low and high inclusive.
+    """
+    rng = as_random(seed)
+    return [rng.randint(low, high) for _ in range(size)]
+
+def distinct_numbers(size, low=0, seed=0):
+    """
+    Returns size distinct integers in random order, drawn from range(low, low + 10 * size).
+    """
+    return as_random(seed).sample(range(low, low + 10 * size), size)
+
+def run_length_string(size, alphabet=string.ascii_lowercase, max_run=5, seed=0):
+    """
+    Returns a string of size characters made of runs of the same character, the input shape of compress.
+
+    Consecutive runs always use different characters, so every run is a maximal run.
+    """
+    rng = as_random(seed)
+    parts = []
+    length = 0
+    previous = None
+    while length < size:
+        character = rng.choice(alphabet)
+        if character == previous:
+            continue
+        run = min(rng.randint(1, max_run), size - length)
+        parts.append(character * run)
+        length += run
+        previous = character
+    return "".join(parts)
+
+def compressed_string(groups, max_count=20, alphabet=string.ascii_lowercase, seed=0):
+    """
+    Returns a string of groups count-character pairs such as '3n12e2z', the input shape of uncompress.
+    """
+    rng = as_random(seed)
+    return "".join(f"{rng.randint(1, max_count)}{rng.choice(alphabet)}" for _ in range(groups))
+
+### LINKED LISTS
+def linked_list(values, node_class=ListNode):
+    """
+    Builds a linked list from an iterable of values without recursion, so millions of nodes are fine.
+
+    Returns:
+        the head node, or None for no values
+    """
+    sentinel = node_class(None)
+    tail = sentinel
+    for value in values:
+        node = node_class(value)
+        tail.next = node
+        tail = node
+    return sentinel.next
+
+def random_linked_list(size, low=0, high=9, seed=0, node_class=ListNode):
+    """
+    Builds a linked list of size random integers between low and high inclusive.
+    """
+    return linked_list(number_list(size, low, high, seed), node_class)
+
+def streaky_linked_list(size, max_streak=10, seed=0, node_class=ListNode):
+    """
+    Builds a linked list made of runs of repeated values, the input shape of longest_streak and is_univalue_list.
+    """
+    rng = as_random(seed)
+    values = []
+    while len(values) < size:
+        values.extend([rng.randint(0, 9)] * min(rng.randint(1, max_streak), size - len(values)))
+    return linked_list(values, node_class)
+
+### BINARY TREES
+def tree_values(size, values, seed):
+    # Default to random integers so sums, minimums and averages have something to work with
+    if values is None:
+        return number_list(size, seed=seed)
+    values = list(values)
+    if len(values) < size:
+        raise ValueError(f"need {size} values, got {len(values)}")
+    return values
+
+def random_tree(size, values=None, seed=0, node_class=TreeNode):
+    """
+    Builds a binary tree of size nodes by attaching each new node to a random free child slot.
+
+    The expected height is O(log n) but unbalanced, like a tree grown from random insertions.
+
+    Args:
+        size: number of nodes
+        values: optional iterable of at least size node values, defaults to random integers
+        seed: int seed or random.Random
+        node_class: class with val, left and right attributes
+
+    Returns:
+        the root node, or None for size 0
+    """
+    if size == 0:
+        return None
+    rng = as_random(seed)
+    values = tree_values(size, values, rng)
+
+    root = node_class(values[0])
+    open_slots = [(root, "left"), (root, "right")]
+    for value in values[1:size]:
+        # Swap the chosen slot to the end so it can be popped in O(1)
+        index = rng.randrange(len(open_slots))
+        open_slots[index], open_slots[-1] = open_slots[-1], open_slots[index]
+        parent, side = open_slots.pop()
+
+        node = node_class(value)
+        setattr(parent, side, node)
+        open_slots.append((node, "left"))
+        open_slots.append((node, "right"))
+    return root
+
+def balanced_tree(size, values=None, seed=0, node_class=TreeNode):
+    """
+    Builds a complete binary tree of size nodes, filled level by level from the left (height log2 n).
+    """
+    if size == 0:
+        return None
+    values = tree_values(size, values, as_random(seed))
+    nodes = [node_class(value) for value in values[:size]]
+    for index in range(1, size):
+        parent = nodes[(index - 1) // 2]
+        if index % 2:
+            parent.left = nodes[index]
+        else:
+            parent.right = nodes[index]
+    return nodes[0]
+
+def degenerate_tree(size, side="left", values=None, seed=0, node_class=TreeNode):
+    """
+    Builds a tree of height size - 1 where every node has one child, the worst case for recursion.
+
+    Args:
+        side: "left", "right" or "zigzag" (alternating sides)
+    """
+    if side not in ("left", "right", "zigzag"):
+        raise ValueError(f"side must be 'left', 'right' or 'zigzag', got {side!r}")
+    if size == 0:
+        return None
+    values = tree_values(size, values, as_random(seed))
+
+    root = current = node_class(values[0])
+    for index, value in enumerate(values[1:size]):
+        node = node_class(value)
+        if side == "left" or (side == "zigzag" and index % 2 == 0):
+            current.left = node
+        else:
+            current.right = node
+        current = node
+    return root
+
+def unique_values(size, seed=0):
+    """
+    Returns 0 .. size - 1 shuffled, for trees where every value must be unique.
+    """
+    values = list(range(size))
+    as_random(seed).shuffle(values)
+    return values
+
+### GRAPHS
+def node_labels(size, prefix="n"):
+    """
+    Returns size string node labels n0, n1, ...
+    """
+    return [f"{prefix}{index}" for index in range(size)]
+
+def random_forest_dag(size, seed=0, labels=None):
+    """
+    Builds a directed acyclic adjacency list in which every node but the first has one random earlier parent.
+    """
+    rng = as_random(seed)
+    labels = labels or node_labels(size)
+    graph = {label: [] for label in labels}
+    for index in range(1, size):
+        graph[labels[rng.randrange(index)]].append(labels[index])
+    return graph
+
+def layered_dag(size, depth, fan_out=2, seed=0, labels=None):
+    """
+    Builds a directed acyclic adjacency list whose longest path has exactly depth - 1 edges.
+
+    The nodes are split evenly into depth layers. Every node outside the first layer gets one
+    parent in the previous layer, which fixes the longest path, and every node outside the last
+    layer gets fan_out - 1 further edges into later layers (mostly the next one), so the average
+    out-degree is about fan_out.
+
+    Args:
+        size: number of nodes
+        depth: number of layers, between 1 and size
+        fan_out: outgoing edges per node
+        seed: int seed or random.Random
+        labels: optional node labels, defaults to n0, n1, ...
+
+    Returns:
+        dict: node -> list of neighbours, keys in layer order
+    """
+    if not 1 <= depth <= max(1, size):
+        raise ValueError(f"depth must be between 1 and {size}, got {depth}")
+    rng = as_random(seed)
+    labels = labels or node_labels(size)
+    graph = {label: [] for label in labels}
+    if size == 0:
+        return graph
+
+    # layer_start[l] is the index of the first node in layer l
+    layer_start = [layer * size // depth for layer in range(depth + 1)]
+    edges = set()
+    for layer in range(1, depth):
+        for index in range(layer_start[layer], layer_start[layer + 1]):
+            parent = rng.randrange(layer_start[layer - 1], layer_start[layer])
+            edges.add((parent, index))
+
+    for layer in range(depth - 1):
+        for index in range(layer_start[layer], layer_start[layer + 1]):
+            for _ in range(fan_out - 1):
+                # Skip ahead one layer most of the time and further occasionally
+                target_layer = min(depth - 1, layer + 1 + int(rng.expovariate(1.5)))
+                target = rng.randrange(layer_start[target_layer], layer_start[target_layer + 1])
+                edges.add((index, target))
+
+    for source, target in sorted(edges):
+        graph[labels[source]].append(labels[target])
+    return graph
+
+def prerequisites(courses, depth, fan_out=2, seed=0):
+    """
+    Returns (courses, prerequisites) for semesters_required, with depth semesters needed.
+
+    Course ids are shuffled so the answer does not follow from the ids.
+    """
+    ids = list(range(courses))
+    rng = as_random(seed)
+    rng.shuffle(ids)
+    graph = layered_dag(courses, depth, fan_out, rng, labels=ids)
+    return courses, [(course, after) for course, afters in graph.items() for after in afters]
+
+def random_edges(nodes, edges, seed=0, labels=None):
+    """
+    Returns edges random undirected [a, b] pairs between nodes labelled nodes, with no self loops.
+    """
+    if nodes < 2 and edges:
+        raise ValueError("need at least two nodes to make an edge")
+    rng = as_random(seed)
+    labels = labels or node_labels(nodes)
+    result = []
+    while len(result) < edges:
+        a, b = rng.randrange(nodes), rng.randrange(nodes)
+        if a != b:
+            result.append([labels[a], labels[b]])
+    return result
+
+def component_graph(nodes, components, extra_edges=0, seed=0):
+    """
+    Builds an undirected adjacency list of integer nodes with exactly components connected components.
+
+    Each component is a random spanning tree over its nodes plus a share of extra_edges.
+    """
+    if not 0 < components <= max(1, nodes):
+        raise ValueError(f"components must be between 1 and {nodes}, got {components}")
+    rng = as_random(seed)
+    ids = list(range(nodes))
+    rng.shuffle(ids)
+    graph = {node: [] for node in range(nodes)}
+
+    def connect(a, b):
+        graph[a].append(b)
+        graph[b].append(a)
+
+    bounds = [component * nodes // components for component in range(components + 1)]
+    for component in range(components):
+        members = ids[bounds[component]:bounds[component + 1]]
+        for index in range(1, len(members)):
+            connect(members[rng.randrange(index)], members[index])
+        for _ in range(extra_edges // components):
+            if len(members) > 1:
+                a, b = rng.sample(members, 2)
+                connect(a, b)
+    return graph
+
+def adjacency_list(edges, directed=False):
+    """
+    Builds a dict adjacency list from [a, b] pairs, adding both directions unless directed.
+    """
+    graph = {}
+    for a, b in edges:
+        graph.setdefault(a, []).append(b)
+        neighbours = graph.setdefault(b, [])
+        if not directed:
+            neighbours.append(a)
+    return graph
+
+### GRIDS
+def island_grid(rows, columns, land_ratio=0.4, seed=0):
+    """
+    Builds a rows x columns grid of 'L' (land) and 'W' (water) cells for island_count and minimum_island.
+
+    Below a land ratio of about 0.59 the islands stay small; above it one island spans the grid.
+    The top left cell is always land so there is at least one island.
+    """
+    rng = as_random(seed)
+    grid = [rng.choices("LW", weights=(land_ratio, 1 - land_ratio), k=columns) for _ in range(rows)]
+    if rows and columns:
+        grid[0][0] = 'L'
+    return grid
+
+def carrot_grid(rows, columns, wall_ratio=0.25, carrot_ratio=0.001, seed=0):
+    """
+    Builds a rows x columns grid of 'O' (open), 'X' (wall) and 'C' (carrot) cells for closest_carrot.
+    """
+    rng = as_random(seed)
+    weights = (1 - wall_ratio - carrot_ratio, wall_ratio, carrot_ratio)
+    return [rng.choices("OXC", weights=weights, k=columns) for _ in range(rows)]
+
+def open_cell(grid, seed=0):
+    """
+    Returns a random (row, column) of grid that is not a wall, e.g. a closest_carrot start position.
+    """
+    rng = as_random(seed)
+    rows, columns = len(grid), len(grid[0])
+    for _ in range(1_000):
+        row, column = rng.randrange(rows), rng.randrange(columns)
+        if grid[row][column] != 'X':
+            return row, column
+
+    # Almost every cell is a wall, fall back to the first open one
+    for row in range(rows):
+        for column in range(columns):
+            if grid[row][column] != 'X':
+                return row, column
+    raise ValueError("grid has no open cell")
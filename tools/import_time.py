@@ -0,0 +1,83 @@
+"""
+Measures what importing each solution script costs, against running it as a script.
+
+Importing a script should only define its functions and classes: the demos and test calls sit
+behind `if __name__ == "__main__":`. Each script is executed as a fresh module several times,
+once under its own name (an import) and once as "__main__" (python script.py), and the fastest
+run of each is reported. A script that prints anything when imported still runs code at import
+time and is flagged.
+
+Usage (from the repository root):
+    python -m tools.import_time                    # every script, slowest import first
+    python -m tools.import_time 04_binary_trees --repeat 20
+"""
+import argparse
+import io
+import time
+
+from tools.discovery import REPO_ROOT, execute_script
+from tools.run_all import select_scripts
+
+def best_time(path, repeat, as_main):
+    """
+    Returns the fastest of repeat executions of a script in seconds and what the last one printed.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        output = io.StringIO()
+        start_time = time.perf_counter()
+        execute_script(path, output, as_main)
+        best = min(best, time.perf_counter() - start_time)
+    return best, output.getvalue()
+
+def measure(paths, repeat=5):
+    """
+    Times the import and the script run of every path.
+
+    Returns:
+        list[dict]: path, import_us, main_us and import_output (what the import printed) per script
+    """
+    records = []
+    for path in paths:
+        import_seconds, import_output = best_time(path, repeat, as_main=False)
+        try:
+            main_seconds = best_time(path, repeat, as_main=True)[0]
+        except Exception:
+            # The script's own tests fail when run, which is the test runner's business
+            main_seconds = None
+        records.append({
+            "path": str(path.relative_to(REPO_ROOT)),
+            "import_us": import_seconds * 1_000_000,
+            "main_us": None if main_seconds is None else main_seconds * 1_000_000,
+            "import_output": import_output,
+        })
+    return records
+
+def format_report(records):
+    header = f"{'script':<62} {'import us':>11} {'as script us':>13}  prints on import"
+    lines = [header, "-" * len(header)]
+    for record in sorted(records, key=lambda record: record["import_us"], reverse=True):
+        main = "-" if record["main_us"] is None else f"{record['main_us']:.1f}"
+        prints = "YES" if record["import_output"] else "no"
+        lines.append(f"{record['path']:<62} {record['import_us']:>11.1f} {main:>13}  {prints}")
+
+    total_import = sum(record["import_us"] for record in records)
+    total_main = sum(record["main_us"] or 0 for record in records)
+    lines.append(
+        f"\nimporting all {len(records)} scripts: {total_import / 1000:.2f} ms, "
+        f"running them as scripts: {total_main / 1000:.2f} ms"
+    )
+    return "\n".join(lines)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure the import time of every solution script.")
+    parser.add_argument("patterns", nargs="*", help="only measure scripts whose path contains one of these")
+    parser.add_argument("--repeat", type=int, default=5, help="executions per script, the fastest is reported")
+    arguments = parser.parse_args(argv)
+
+    records = measure(select_scripts(arguments.patterns), arguments.repeat)
+    print(format_report(records))
+    return 1 if any(record["import_output"] for record in records) else 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
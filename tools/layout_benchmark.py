@@ -0,0 +1,135 @@
+"""
+Races solutions over Node objects against the same functions over an array-backed layout.
+
+Each comparison generates its input with the problem builder in tools/problems.py, converts the
+structure once (the conversion is timed separately, not per call), then times both functions
+on the same data and checks they agree. The retained memory of both structures is measured
+with tracemalloc.
+
+Usage (from the repository root):
+    python -m tools.layout_benchmark                              # every comparison
+    python -m tools.layout_benchmark tree_sum level_averages --sizes 10000 1000000
+"""
+import argparse
+import math
+import random
+import time
+import tracemalloc
+
+import structy
+from structy import array_list, array_tree
+from tools.problems import PROBLEMS
+from tools.race_variants import load_test_runner, results_agree
+
+DEFAULT_SIZES = [1_000, 100_000]
+
+class Comparison:
+    """
+    One function available over Node objects and over an array layout.
+
+    Args:
+        node_function: function name in a structy submodule e.g. "trees.tree_sum"
+        convert: function turning the Node structure (the first argument) into the array layout
+        array_function: the array version, taking the converted structure and the other arguments
+    """
+    def __init__(self, node_function, convert, array_function):
+        self.node_function = node_function
+        self.convert = convert
+        self.array_function = array_function
+
+    def load_node_function(self):
+        submodule, name = self.node_function.split(".")
+        return getattr(getattr(structy, submodule), name)
+
+COMPARISONS = {
+    "tree_sum": Comparison("trees.tree_sum", array_tree.ArrayTree.from_nodes, array_tree.tree_sum),
+    "tree_min_value": Comparison("trees.tree_min_value", array_tree.ArrayTree.from_nodes, array_tree.tree_min_value),
+    "tree_value_count": Comparison("trees.tree_value_count", array_tree.ArrayTree.from_nodes, array_tree.tree_value_count),
+    "how_high": Comparison("trees.how_high", array_tree.ArrayTree.from_nodes, array_tree.how_high),
+    "level_averages": Comparison("trees.level_averages", array_tree.ArrayTree.from_nodes, array_tree.level_averages),
+    "linked_list_values": Comparison("linked_lists.linked_list_values", array_list.ArrayList.from_nodes, array_list.linked_list_values),
+    "sum_list": Comparison("linked_lists.sum_list", array_list.ArrayList.from_nodes, array_list.sum_list),
+    "get_node_value": Comparison("linked_lists.get_node_value", array_list.ArrayList.from_nodes, array_list.get_node_value),
+    "linked_list_find": Comparison("linked_lists.linked_list_find", array_list.ArrayList.from_nodes, array_list.linked_list_find),
+    "is_univalue_list": Comparison("linked_lists.is_univalue_list", array_list.ArrayList.from_nodes, array_list.is_univalue_list),
+    "longest_streak": Comparison("linked_lists.longest_streak", array_list.ArrayList.from_nodes, array_list.longest_streak),
+}
+
+def traced(build):
+    """
+    Returns (result of build(), bytes it left allocated).
+    """
+    tracemalloc.start()
+    try:
+        start_bytes = tracemalloc.get_traced_memory()[0]
+        result = build()
+        return result, tracemalloc.get_traced_memory()[0] - start_bytes
+    finally:
+        tracemalloc.stop()
+
+def compare(name, sizes, seed=0, samples=10):
+    """
+    Times one comparison at every size.
+
+    Returns:
+        list[dict]: per size the node and array medians in microseconds, the conversion time,
+            the bytes of both structures and whether the results agree
+    """
+    test_runner = load_test_runner()
+    comparison = COMPARISONS[name]
+    problem = PROBLEMS[name]
+    node_function = comparison.load_node_function()
+    records = []
+
+    for size in sizes:
+        args, node_bytes = traced(lambda: problem.build(size, random.Random(f"{name}:{seed}:{size}")))
+        converted, array_bytes = traced(lambda: comparison.convert(args[0]))
+        # Timed again untraced, tracemalloc slows every allocation down
+        start_time = time.perf_counter()
+        comparison.convert(args[0])
+        convert_us = (time.perf_counter() - start_time) * 1_000_000
+        array_args = (converted,) + tuple(args[1:])
+
+        record = {"function": name, "size": size, "convert_us": convert_us, "node_bytes": node_bytes, "array_bytes": array_bytes}
+        try:
+            expected = node_function(*args)
+            record["node_us"] = test_runner.run_benchmark(lambda: node_function(*args), warmup=1, samples=samples)["median"]
+        except RecursionError:
+            expected = None
+            record["node_us"] = math.nan
+        actual = comparison.array_function(*array_args)
+        record["array_us"] = test_runner.run_benchmark(lambda: comparison.array_function(*array_args), warmup=1, samples=samples)["median"]
+        record["agrees"] = expected is None or results_agree(expected, actual)
+        records.append(record)
+    return records
+
+def format_table(records):
+    header = (
+        f"{'function':<18} {'size':>9} {'node us':>12} {'array us':>12} {'speedup':>8} "
+        f"{'convert us':>12} {'node MiB':>9} {'array MiB':>9}  agrees"
+    )
+    lines = [header, "-" * len(header)]
+    for record in records:
+        speedup = record["node_us"] / record["array_us"] if record["array_us"] else math.inf
+        lines.append(
+            f"{record['function']:<18} {record['size']:>9} {record['node_us']:>12.2f} {record['array_us']:>12.2f} "
+            f"{speedup:>7.1f}x {record['convert_us']:>12.0f} {record['node_bytes'] / 2 ** 20:>9.2f} "
+            f"{record['array_bytes'] / 2 ** 20:>9.2f}  {'yes' if record['agrees'] else 'NO'}"
+        )
+    return "\n".join(lines)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Race Node based solutions against array layouts.")
+    parser.add_argument("functions", nargs="*", help=f"comparisons to run (default: all of {', '.join(COMPARISONS)})")
+    parser.add_argument("--sizes", nargs="+", type=int, default=DEFAULT_SIZES, help="input sizes to generate")
+    parser.add_argument("--seed", type=int, default=0, help="seed for the input generators")
+    parser.add_argument("--samples", type=int, default=10, help="timed samples per function and size")
+    arguments = parser.parse_args(argv)
+
+    records = []
+    for name in arguments.functions or COMPARISONS:
+        records.extend(compare(name, arguments.sizes, arguments.seed, arguments.samples))
+    print(format_table(records))
+
+if __name__ == "__main__":
+    main()
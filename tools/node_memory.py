@@ -0,0 +1,86 @@
+"""
+Compares the memory of the shared __slots__ nodes with the per-instance __dict__ nodes the scripts used to define.
+
+A linked list and a complete binary tree of the same values are built with each node class and
+the bytes they keep allocated are measured with tracemalloc. The values are created before the
+measurement, so only the nodes are counted.
+
+Usage (from the repository root):
+    python -m tools.node_memory                    # one million nodes
+    python -m tools.node_memory --size 5000000
+"""
+import argparse
+import gc
+import tracemalloc
+
+from structy.nodes import ListNode, TreeNode
+from tools import generators
+
+# The node classes every script defined before structy.nodes
+class DictListNode:
+    def __init__(self, val):
+        self.val = val
+        self.next = None
+
+class DictTreeNode:
+    def __init__(self, val):
+        self.val = val
+        self.left = None
+        self.right = None
+
+def retained_bytes(build):
+    """
+    Returns the bytes still allocated after build() returns, while its result is alive.
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        start_bytes = tracemalloc.get_traced_memory()[0]
+        structure = build()
+        retained = tracemalloc.get_traced_memory()[0] - start_bytes
+    finally:
+        tracemalloc.stop()
+    del structure
+    return retained
+
+def measure(size):
+    """
+    Returns one row per structure: the bytes per node with __dict__ nodes and with __slots__ nodes.
+    """
+    values = list(range(size))
+    structures = [
+        ("linked list", lambda node_class: generators.linked_list(values, node_class), DictListNode, ListNode),
+        ("binary tree", lambda node_class: generators.balanced_tree(size, values, node_class=node_class), DictTreeNode, TreeNode),
+    ]
+    rows = []
+    for name, build, dict_class, slots_class in structures:
+        dict_bytes = retained_bytes(lambda: build(dict_class))
+        slots_bytes = retained_bytes(lambda: build(slots_class))
+        rows.append({
+            "structure": name,
+            "size": size,
+            "dict_bytes_per_node": dict_bytes / size,
+            "slots_bytes_per_node": slots_bytes / size,
+            "saving": 1 - slots_bytes / dict_bytes,
+        })
+    return rows
+
+def format_table(rows):
+    header = f"{'structure':<12} {'nodes':>10} {'__dict__ B/node':>16} {'__slots__ B/node':>17} {'saving':>8} {'saved MiB':>10}"
+    lines = [header, "-" * len(header)]
+    for row in rows:
+        saved_mib = (row["dict_bytes_per_node"] - row["slots_bytes_per_node"]) * row["size"] / 2 ** 20
+        lines.append(
+            f"{row['structure']:<12} {row['size']:>10} {row['dict_bytes_per_node']:>16.1f} "
+            f"{row['slots_bytes_per_node']:>17.1f} {row['saving']:>8.0%} {saved_mib:>10.1f}"
+        )
+    return "\n".join(lines)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare the memory of __dict__ and __slots__ nodes.")
+    parser.add_argument("--size", type=int, default=1_000_000, help="number of nodes")
+    arguments = parser.parse_args(argv)
+    print(format_table(measure(arguments.size)))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,248 @@
+import math
+import string
+
+from tools import generators
+
+class Problem:
+    """
+    Describes how to feed one function family with generated inputs.
+
+    Args:
+        build: function (size, rng) -> tuple of positional arguments for the solution
+        canonical: optional function mapping a result to a comparable form, for problems where
+            several answers are correct e.g. the order of all_tree_paths
+        mutates: True when the solution changes its input in place, so every call needs a fresh input
+        scaling: how the variables of the docstring's Big-O grow with size, when not linearly
+            e.g. {"r": 0.5, "c": 0.5} for a square grid of size cells
+        max_size: largest size the solution can take, e.g. because it recurses once per element
+    """
+    def __init__(self, build, canonical=None, mutates=False, scaling=None, max_size=None):
+        self.build = build
+        self.canonical = canonical or (lambda result: result)
+        self.mutates = mutates
+        self.scaling = scaling or {}
+        self.max_size = max_size
+
+# Recursive solutions recurse once per element and Python's default recursion limit is 1000
+RECURSION_SAFE_SIZE = 800
+GRID_SCALING = {"r": 0.5, "c": 0.5}
+
+def next_prime(number):
+    """
+    Returns the smallest prime greater than or equal to number.
+    """
+    candidate = max(2, number)
+    while any(candidate % divisor == 0 for divisor in range(2, math.isqrt(candidate) + 1)):
+        candidate += 1
+    return candidate
+
+def square_side(size):
+    return max(1, math.isqrt(size))
+
+### PROBLEM FAMILIES
+# 01_arrays_and_strings
+def pair_sum_problem(size, rng):
+    # Multiples of four can never sum to 3, so 1 + 2 is the only pair
+    numbers = [4 * value for value in generators.distinct_numbers(size, low=1, seed=rng)]
+    first, second = rng.sample(range(size), 2)
+    numbers[first], numbers[second] = 1, 2
+    return (numbers, 3)
+
+def pair_product_problem(size, rng):
+    # Odd numbers never multiply to an even target, so the whole list is searched
+    return ([2 * value + 1 for value in generators.distinct_numbers(size, seed=rng)], 2)
+
+def is_prime_problem(size, rng):
+    return (next_prime(size),)
+
+def number_problem(size, rng):
+    return (size,)
+
+def numbers_problem(size, rng):
+    return (generators.number_list(size, seed=rng),)
+
+def fives_problem(size, rng):
+    return (generators.number_list(size, 4, 5, seed=rng),)
+
+def two_lists_problem(size, rng):
+    return (generators.distinct_numbers(size, seed=rng), generators.distinct_numbers(size, seed=rng))
+
+def text_problem(size, rng):
+    return ("".join(rng.choices(string.ascii_lowercase, k=size)),)
+
+def anagram_problem(size, rng):
+    text = text_problem(size, rng)[0]
+    shuffled = list(text)
+    rng.shuffle(shuffled)
+    return (text, "".join(shuffled))
+
+def run_length_problem(size, rng):
+    return (generators.run_length_string(size, seed=rng),)
+
+def compressed_problem(size, rng):
+    return (generators.compressed_string(size, max_count=9, seed=rng),)
+
+def subsequence_problem(size, rng):
+    text = text_problem(size, rng)[0]
+    return (text[::2], text)
+
+# 02_beginner_recursion
+def strings_problem(size, rng):
+    return ([text_problem(rng.randint(1, 10), rng)[0] for _ in range(size)],)
+
+def palindrome_problem(size, rng):
+    half = text_problem(size // 2, rng)[0]
+    return (half + half[::-1],)
+
+# 03_linked_lists
+def linked_list_problem(size, rng):
+    return (generators.random_linked_list(size, seed=rng),)
+
+def linked_list_index_problem(size, rng):
+    return linked_list_problem(size, rng) + (size - 1,)
+
+def linked_list_missing_problem(size, rng):
+    return linked_list_problem(size, rng) + (-1,)
+
+def univalue_list_problem(size, rng):
+    return (generators.linked_list([7] * size),)
+
+def streaky_list_problem(size, rng):
+    return (generators.streaky_linked_list(size, seed=rng),)
+
+def sorted_lists_problem(size, rng):
+    numbers = sorted(generators.distinct_numbers(2 * size, seed=rng))
+    return (generators.linked_list(numbers[0::2]), generators.linked_list(numbers[1::2]))
+
+def two_linked_lists_problem(size, rng):
+    return (generators.random_linked_list(size, seed=rng), generators.random_linked_list(size, seed=rng))
+
+def insert_node_problem(size, rng):
+    return linked_list_problem(size, rng) + ("x", size)
+
+def remove_node_problem(size, rng):
+    values = generators.number_list(size, 0, 9, seed=rng)
+    values[-1] = -1
+    return (generators.linked_list(values), -1)
+
+def values_problem(size, rng):
+    return (generators.number_list(size, seed=rng),)
+
+# 04_binary_trees
+def tree_problem(size, rng):
+    return (generators.random_tree(size, seed=rng),)
+
+def tree_target_problem(size, rng):
+    # Few distinct values so counts are above one and the target is usually present
+    values = generators.number_list(size, 0, 9, seed=rng)
+    return (generators.random_tree(size, values, seed=rng), rng.randint(0, 9))
+
+def tree_missing_target_problem(size, rng):
+    # The worst case: the target is absent so every node is visited
+    return tree_problem(size, rng) + (1_001,)
+
+def unique_tree_problem(size, rng):
+    # all_tree_paths_depth and path_finder_efficient map each value to its parent value,
+    # so they need unique values (and path_finder then has exactly one answer)
+    return (generators.random_tree(size, generators.unique_values(size, rng), seed=rng),)
+
+def unique_tree_missing_target_problem(size, rng):
+    return unique_tree_problem(size, rng) + (-1,)
+
+# 05_graphs
+def dag_reachability_problem(size, rng):
+    # The destination is an isolated node, so every variant explores everything reachable
+    graph = generators.random_forest_dag(size, seed=rng)
+    graph["isolated"] = []
+    return (graph, "n0", "isolated")
+
+def dag_problem(size, rng):
+    # Four nodes per layer keeps the longest path proportional to the size
+    return (generators.layered_dag(size, depth=max(1, size // 4), fan_out=2, seed=rng),)
+
+def prerequisites_problem(size, rng):
+    return generators.prerequisites(size, depth=max(1, size // 4), fan_out=2, seed=rng)
+
+def edges_problem(size, rng):
+    # Ask for a node of a separate component so the whole graph is searched
+    edges = generators.random_edges(size, size, seed=rng)
+    edges.append(["n0", "n1"])
+    edges.append(["island_a", "island_b"])
+    return (edges, "n0", "island_a")
+
+def component_problem(size, rng):
+    return (generators.component_graph(size, max(1, size // 100), seed=rng),)
+
+def island_problem(size, rng):
+    side = square_side(size)
+    return (generators.island_grid(side, side, land_ratio=0.4, seed=rng),)
+
+def carrot_problem(size, rng):
+    # No carrots is the worst case: the search covers every reachable cell
+    side = square_side(size)
+    grid = generators.carrot_grid(side, side, wall_ratio=0.25, carrot_ratio=0, seed=rng)
+    return (grid,) + generators.open_cell(grid, rng)
+
+def sorted_result(result):
+    return sorted(result) if result is not None else None
+
+PROBLEMS = {
+    # 01_arrays_and_strings
+    "pair_sum": Problem(pair_sum_problem, canonical=sorted_result),
+    "pair_product": Problem(pair_product_problem),
+    "is_prime": Problem(is_prime_problem),
+    "anagrams": Problem(anagram_problem),
+    "most_frequent_char": Problem(text_problem),
+    "uncompress": Problem(compressed_problem, scaling={"m": 0}),
+    "compress": Problem(run_length_problem),
+    "five_sort": Problem(fives_problem, mutates=True),
+    "intersection": Problem(two_lists_problem),
+    "is_subsequence": Problem(subsequence_problem),
+    # 02_beginner_recursion
+    "sum_numbers_recursive": Problem(numbers_problem, max_size=RECURSION_SAFE_SIZE),
+    "factorial": Problem(number_problem, max_size=RECURSION_SAFE_SIZE),
+    "sum_of_lengths": Problem(strings_problem, max_size=RECURSION_SAFE_SIZE),
+    "palindrome": Problem(palindrome_problem, max_size=2 * RECURSION_SAFE_SIZE),
+    "reverse_string": Problem(text_problem, max_size=RECURSION_SAFE_SIZE),
+    "fibonacci": Problem(number_problem),
+    # 03_linked_lists
+    "linked_list_values": Problem(linked_list_problem),
+    "sum_list": Problem(linked_list_problem),
+    "get_node_value": Problem(linked_list_index_problem),
+    "linked_list_find": Problem(linked_list_missing_problem),
+    "reverse_list": Problem(linked_list_problem, mutates=True),
+    "merge_lists": Problem(sorted_lists_problem, mutates=True),
+    "zipper_lists": Problem(two_linked_lists_problem, mutates=True),
+    "is_univalue_list": Problem(univalue_list_problem),
+    "longest_streak": Problem(streaky_list_problem),
+    "insert_node": Problem(insert_node_problem, mutates=True),
+    "remove_node": Problem(remove_node_problem, mutates=True),
+    "create_linked_list": Problem(values_problem),
+    "add_lists": Problem(two_linked_lists_problem),
+    # 04_binary_trees
+    "depth_first_values": Problem(tree_problem),
+    "breadth_first_values": Problem(tree_problem),
+    "tree_sum": Problem(tree_problem),
+    "tree_min_value": Problem(tree_problem),
+    "max_path_sum": Problem(tree_problem),
+    "how_high": Problem(tree_problem),
+    "bottom_right_value": Problem(tree_problem),
+    "all_tree_paths": Problem(unique_tree_problem, canonical=sorted_result),
+    "leaf_list": Problem(tree_problem),
+    "level_averages": Problem(tree_problem),
+    "tree_levels": Problem(tree_problem),
+    "tree_includes": Problem(tree_missing_target_problem),
+    "tree_value_count": Problem(tree_target_problem),
+    "path_finder": Problem(unique_tree_missing_target_problem),
+    # 05_graphs
+    "has_path": Problem(dag_reachability_problem),
+    "undirected_path": Problem(edges_problem),
+    "shortest_path": Problem(edges_problem),
+    "connected_components_count": Problem(component_problem),
+    "largest_component": Problem(component_problem),
+    "island_count": Problem(island_problem, scaling=GRID_SCALING),
+    "minimum_island": Problem(island_problem, scaling=GRID_SCALING),
+    "closest_carrot": Problem(carrot_problem, scaling=GRID_SCALING),
+    "longest_path": Problem(dag_problem),
+    "semesters_required": Problem(prerequisites_problem),
+}
@@ -0,0 +1,140 @@
+"""
+Races every implementation of the same problem against each other.
+
+Scripts that define the same solution function (tree_levels in _queue, _stack and _recursive,
+has_path in _bfs, _dfs and _dfs_recursive, ...) are fed identical generated inputs at growing
+sizes. Each variant is timed with test_runner.run_benchmark, its peak memory is measured with
+test_runner.measure_memory, and its result is checked against the other variants.
+
+Usage (from the repository root):
+    python -m tools.race_variants                      # every function with two or more variants
+    python -m tools.race_variants has_path tree_levels --sizes 1000 10000 100000
+    python -m tools.race_variants --list
+    python -m tools.race_variants has_path --save         # also store the records, see tools/results.py
+"""
+import argparse
+import math
+import random
+
+from tools.discovery import REPO_ROOT, find_variants, load_function, load_module, variant_name
+from tools.problems import PROBLEMS
+from tools.results import save_records
+
+DEFAULT_SIZES = [100, 1_000, 10_000]
+
+def load_test_runner():
+    return load_module(REPO_ROOT / "05_graphs" / "test_runner.py")
+
+def results_agree(first, second):
+    """
+    Compares two results, allowing for floating point differences from a different summation order.
+    """
+    if isinstance(first, float) or isinstance(second, float):
+        return isinstance(first, (int, float)) and isinstance(second, (int, float)) and math.isclose(first, second)
+    if isinstance(first, (list, tuple)) and isinstance(second, (list, tuple)):
+        return len(first) == len(second) and all(results_agree(a, b) for a, b in zip(first, second))
+    return first == second
+
+def race(function_name, paths, sizes, seed=0, samples=10, min_sample_time=0.005):
+    """
+    Runs every variant of one function over the same inputs.
+
+    Args:
+        function_name: the solution function shared by the scripts
+        paths: the scripts implementing it
+        sizes: input sizes to generate
+        seed: seed for the input generator, so every run sees the same inputs
+        samples: number of timed samples per variant and size
+        min_sample_time: minimum duration of one sample in seconds
+
+    Returns:
+        list[dict]: one record per variant and size with the timings, peak memory, number of
+            objects retained by the result and agreement
+    """
+    test_runner = load_test_runner()
+    problem = PROBLEMS[function_name]
+    records = []
+
+    for size in sizes:
+        # A fresh generator per size keeps every size reproducible on its own
+        args = problem.build(size, random.Random(f"{function_name}:{seed}:{size}"))
+        reference = None
+
+        for path in paths:
+            record = {"function": function_name, "variant": variant_name(path), "size": size}
+            function = load_function(path, function_name)
+            try:
+                result = problem.canonical(function(*args))
+                stats = test_runner.run_benchmark(
+                    lambda: function(*args), warmup=1, samples=samples, min_sample_time=min_sample_time
+                )
+                record.update(stats)
+                record["throughput"] = size / (stats["median"] / 1_000_000) if stats["median"] else math.inf
+                memory = test_runner.measure_memory(lambda: function(*args))
+                record["peak_bytes"] = memory["peak_bytes"]
+                record["retained_objects"] = sum(memory["objects"].values())
+            except (RecursionError, MemoryError) as error:
+                record["error"] = type(error).__name__
+                records.append(record)
+                continue
+
+            if reference is None:
+                reference = result
+                record["agrees"] = True
+            else:
+                record["agrees"] = results_agree(reference, result)
+            records.append(record)
+
+    return records
+
+def format_table(records):
+    """
+    Formats race records as a plain text table, fastest variant first within each size.
+    """
+    header = f"{'function':<20} {'size':>9} {'variant':<28} {'median us':>12} {'p95 us':>12} {'items/s':>12} {'peak KiB':>10} {'objects':>8}  agrees"
+    lines = [header, "-" * len(header)]
+    ordered = sorted(records, key=lambda r: (r["function"], r["size"], "error" in r, r.get("median", 0)))
+
+    for record in ordered:
+        prefix = f"{record['function']:<20} {record['size']:>9} {record['variant']:<28}"
+        if "error" in record:
+            lines.append(f"{prefix} {record['error']:>12}")
+            continue
+        agrees = "yes" if record["agrees"] else "NO"
+        lines.append(
+            f"{prefix} {record['median']:>12.2f} {record['p95']:>12.2f} {record['throughput']:>12.3g} "
+            f"{record['peak_bytes'] / 1024:>10.1f} {record['retained_objects']:>8}  {agrees}"
+        )
+    return "\n".join(lines)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Race every implementation of the same problem.")
+    parser.add_argument("functions", nargs="*", help="function names to race (default: all with variants)")
+    parser.add_argument("--sizes", nargs="+", type=int, default=DEFAULT_SIZES, help="input sizes to generate")
+    parser.add_argument("--seed", type=int, default=0, help="seed for the input generators")
+    parser.add_argument("--samples", type=int, default=10, help="timed samples per variant and size")
+    parser.add_argument("--list", action="store_true", help="list the functions with variants and exit")
+    parser.add_argument("--save", nargs="?", const="json", choices=["json", "csv"], help="store the records in .benchmarks/")
+    arguments = parser.parse_args(argv)
+
+    variants = find_variants(arguments.functions)
+    if arguments.list:
+        for function_name, paths in variants.items():
+            print(f"{function_name}: {', '.join(variant_name(path) for path in paths)}")
+        return
+
+    records = []
+    for function_name, paths in variants.items():
+        if function_name not in PROBLEMS:
+            print(f"skipping {function_name}: no input builder in tools/problems.py")
+            continue
+        records.extend(race(function_name, paths, arguments.sizes, arguments.seed, arguments.samples))
+    print(format_table(records))
+
+    if arguments.save:
+        for record in records:
+            record["status"] = record.get("error") or ("agrees" if record["agrees"] else "disagrees")
+        print(f"saved to {save_records(records, 'race_variants', arguments.save)}")
+
+if __name__ == "__main__":
+    main()
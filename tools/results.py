@@ -0,0 +1,266 @@
+"""
+Stores benchmark results as machine-readable records and flags regressions between runs.
+
+race_variants and run_all save their records here with --save. Every record is a flat
+dictionary (function, variant, test, size, timings in microseconds, memory, status) stamped with
+the git revision and time of the run, written as JSON or CSV to .benchmarks/ (ignored by git).
+run_all without --benchmark times each test once: that time is stored as single_call, not as a
+median, and is never compared.
+
+A run is only compared with the baseline records of the same tool and function, so a run_all
+run is never checked against a race_variants baseline.
+
+Usage (from the repository root):
+    python -m tools.race_variants has_path --sizes 1000 10000 --save
+    python -m tools.results baseline                 # keep the latest run as the baseline
+    ...change a solution, then race it again with --save...
+    python -m tools.results compare --threshold 0.1  # latest run against the baseline
+    python -m tools.results list
+"""
+import argparse
+import csv
+import json
+import subprocess
+from datetime import datetime, timezone
+
+from tools.discovery import REPO_ROOT
+
+RESULTS_DIRECTORY = REPO_ROOT / ".benchmarks"
+BASELINE_NAME = "baseline.json"
+
+# Column order of the CSV files, and every field a record may have
+FIELDS = [
+    "revision", "timestamp", "source", "function", "variant", "test", "size",
+    "single_call", "min", "median", "mean", "p95", "p99", "stdev", "samples", "loops",
+    "throughput", "peak_bytes", "retained_objects", "status",
+]
+INTEGER_FIELDS = {"size", "samples", "loops", "peak_bytes", "retained_objects"}
+FLOAT_FIELDS = {"single_call", "min", "median", "mean", "p95", "p99", "stdev", "throughput"}
+
+# A median this much slower than the baseline is a regression: 0.1 means 10% slower
+DEFAULT_THRESHOLD = 0.1
+
+def git_revision():
+    """
+    Returns the short hash of HEAD, with "-dirty" when the working tree has changes, or "unknown" outside git.
+    """
+    try:
+        revision = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=REPO_ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+        changes = subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=no"], cwd=REPO_ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+    return f"{revision}-dirty" if changes else revision
+
+def stamp(records, source):
+    """
+    Returns copies of the records with the revision, time and source (e.g. "race_variants") of the run.
+    """
+    revision = git_revision()
+    # Down to the microsecond, so two runs saved within a second get different files
+    timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S_%f")
+    return [{"revision": revision, "timestamp": timestamp, "source": source, **record} for record in records]
+
+def save_records(records, source, file_format="json", directory=RESULTS_DIRECTORY):
+    """
+    Stamps the records and writes them to a new file named after the time, source and revision.
+
+    Args:
+        records: list of record dictionaries, fields outside FIELDS are dropped
+        source: the tool that produced them
+        file_format: "json" or "csv"
+        directory: where to write the file
+
+    Returns:
+        Path: the file written
+    """
+    records = [{field: record.get(field) for field in FIELDS} for record in stamp(records, source)]
+    directory.mkdir(exist_ok=True)
+    first = records[0] if records else {"timestamp": "empty", "revision": "unknown"}
+    path = directory / f"{first['timestamp']}_{source}_{first['revision']}.{file_format}"
+    copy = 1
+    while path.exists():
+        copy += 1
+        path = directory / f"{first['timestamp']}_{source}_{first['revision']}_{copy}.{file_format}"
+
+    if file_format == "json":
+        path.write_text(json.dumps(records, indent=1) + "\n")
+    elif file_format == "csv":
+        with path.open("w", newline="") as file:
+            writer = csv.DictWriter(file, fieldnames=FIELDS)
+            writer.writeheader()
+            writer.writerows(records)
+    else:
+        raise ValueError(f"file_format must be 'json' or 'csv', got {file_format!r}")
+    return path
+
+def load_records(path):
+    """
+    Reads records written by save_records, converting the CSV columns back to numbers.
+    """
+    if path.suffix == ".json":
+        return json.loads(path.read_text())
+
+    records = []
+    with path.open(newline="") as file:
+        for row in csv.DictReader(file):
+            record = {}
+            for field, value in row.items():
+                if value == "":
+                    record[field] = None
+                elif field in INTEGER_FIELDS:
+                    record[field] = int(value)
+                elif field in FLOAT_FIELDS:
+                    record[field] = float(value)
+                else:
+                    record[field] = value
+            records.append(record)
+    return records
+
+def result_files(directory=RESULTS_DIRECTORY):
+    """
+    Returns the saved runs, oldest first (the names start with the time), without the baseline.
+    """
+    if not directory.exists():
+        return []
+    return sorted(
+        path for path in directory.iterdir()
+        if path.suffix in (".json", ".csv") and path.name != BASELINE_NAME
+    )
+
+def record_key(record):
+    return (record.get("function"), record.get("variant"), record.get("test"), record.get("size"))
+
+def run_source(records):
+    """
+    Returns the tool that saved a run ("race_variants", "run_all", ...), None for an empty run.
+    """
+    return records[0].get("source") if records else None
+
+def latest_run(runs, source=None):
+    """
+    Returns the latest of the saved runs, only among those saved by source when it is given, None when there is none.
+    """
+    for path in reversed(runs):
+        if source is None or run_source(load_records(path)) == source:
+            return path
+    return None
+
+def compare(baseline, current, threshold=DEFAULT_THRESHOLD):
+    """
+    Matches the records of two runs by function, variant, test and size and compares their medians.
+
+    Only the baseline records saved by the same tools and for the same functions as the current
+    records are compared, so racing one problem does not report every other problem as missing.
+
+    Args:
+        baseline: records of the reference run
+        current: records of the run being checked
+        threshold: relative slowdown of the median that counts as a regression
+
+    Returns:
+        list[dict]: one row per record with the key fields, both medians, the ratio current / baseline
+            and a status: regression, improved, ok, new (only in current), missing (only in baseline),
+            single call (timed once, not compared) or no timing
+    """
+    compared = {(record.get("source"), record.get("function")) for record in current}
+    baseline_by_key = {
+        record_key(record): record for record in baseline
+        if (record.get("source"), record.get("function")) in compared
+    }
+    current_by_key = {record_key(record): record for record in current}
+
+    rows = []
+    for key in sorted(baseline_by_key.keys() | current_by_key.keys(), key=lambda key: tuple(str(part) for part in key)):
+        before = baseline_by_key.get(key, {}).get("median")
+        after = current_by_key.get(key, {}).get("median")
+        row = dict(zip(("function", "variant", "test", "size"), key), baseline=before, current=after, ratio=None)
+
+        if key not in current_by_key:
+            row["status"] = "missing"
+        elif key not in baseline_by_key:
+            row["status"] = "new"
+        elif not before or not after:
+            # A run_all time of one call is too noisy to flag
+            single = baseline_by_key[key].get("single_call") is not None or current_by_key[key].get("single_call") is not None
+            row["status"] = "single call" if single else "no timing"
+        else:
+            row["ratio"] = after / before
+            if row["ratio"] > 1 + threshold:
+                row["status"] = "regression"
+            elif row["ratio"] < 1 / (1 + threshold):
+                row["status"] = "improved"
+            else:
+                row["status"] = "ok"
+        rows.append(row)
+    return rows
+
+def format_comparison(rows, show_all=False):
+    header = f"{'function':<22} {'variant':<30} {'test':<12} {'size':>9} {'baseline us':>13} {'current us':>13} {'ratio':>7}  status"
+    lines = [header, "-" * len(header)]
+    for row in rows:
+        if not show_all and row["status"] == "ok":
+            continue
+        baseline = "-" if row["baseline"] is None else f"{row['baseline']:.2f}"
+        current = "-" if row["current"] is None else f"{row['current']:.2f}"
+        ratio = "-" if row["ratio"] is None else f"{row['ratio']:.2f}"
+        size = "-" if row["size"] is None else row["size"]
+        lines.append(
+            f"{row['function'] or '-':<22} {row['variant'] or '-':<30} {row['test'] or '-':<12} {size:>9} "
+            f"{baseline:>13} {current:>13} {ratio:>7}  {row['status']}"
+        )
+    regressions = sum(row["status"] == "regression" for row in rows)
+    lines.append(f"\n{regressions} regressions in {len(rows)} records")
+    return "\n".join(lines)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="List, keep and compare saved benchmark results.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("list", help="list the saved runs")
+
+    baseline_parser = commands.add_parser("baseline", help="keep a run (default: the latest) as the baseline")
+    baseline_parser.add_argument("run", nargs="?", help="results file to keep")
+
+    compare_parser = commands.add_parser("compare", help="flag functions whose median slowed down")
+    compare_parser.add_argument("current", nargs="?", help="results file to check (default: the latest run)")
+    compare_parser.add_argument("--baseline", help=f"results file to compare against (default: {BASELINE_NAME})")
+    compare_parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="relative slowdown flagged, e.g. 0.1 for 10%%")
+    compare_parser.add_argument("--all", action="store_true", help="also list the records within the threshold")
+    arguments = parser.parse_args(argv)
+
+    runs = result_files()
+    if arguments.command == "list":
+        for path in runs:
+            print(f"{path.name}: {len(load_records(path))} records")
+        return 0
+
+    if arguments.command == "baseline":
+        if not arguments.run and not runs:
+            parser.error("no saved runs, save one with --save first")
+        run = REPO_ROOT / arguments.run if arguments.run else runs[-1]
+        (RESULTS_DIRECTORY / BASELINE_NAME).write_text(json.dumps(load_records(run), indent=1) + "\n")
+        print(f"baseline set to {run.name}")
+        return 0
+
+    baseline = REPO_ROOT / arguments.baseline if arguments.baseline else RESULTS_DIRECTORY / BASELINE_NAME
+    if not baseline.exists():
+        parser.error(f"no baseline at {baseline}, set one with 'python -m tools.results baseline'")
+    baseline_records = load_records(baseline)
+    if arguments.current:
+        current = REPO_ROOT / arguments.current
+    else:
+        # The latest run of the tool that saved the baseline
+        current = latest_run(runs, run_source(baseline_records))
+        if current is None:
+            parser.error(f"no saved {run_source(baseline_records)} runs, save one with --save first")
+
+    rows = compare(baseline_records, load_records(current), arguments.threshold)
+    print(f"{current.name} against {baseline.name}")
+    print(format_comparison(rows, arguments.all))
+    return 1 if any(row["status"] == "regression" for row in rows) else 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
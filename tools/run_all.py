@@ -0,0 +1,252 @@
+"""
+Runs every test of every solution script in one go, spread over a process pool.
+
+The tests and their expected values are found by tools.discovery.discover_tests without running
+the scripts: the test_* functions, checked against their test_runner(...) call or the "# -> value"
+comment of their last line, and the module level demos that carry an arrow comment. Each script
+is then loaded and tested in a worker process, one script per task.
+
+A test passes when its result equals the expected value, or when the expected value is written
+as text (e.g. "f -> e -> d" for a linked list) and matches str() of the result. Tests without a
+readable expected value are run and reported as unchecked.
+
+Usage (from the repository root):
+    python -m tools.run_all                         # every script, one worker per core
+    python -m tools.run_all 04_binary_trees path_finder --verbose
+    python -m tools.run_all --workers 1 --benchmark --save  # also store the timings, see tools/results.py
+"""
+import argparse
+import ast
+import contextlib
+import io
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from tools.discovery import (
+    REPO_ROOT, discover_tests, load_module, module_statements, solution_files, solution_function_name, variant_name
+)
+from tools.race_variants import load_test_runner, results_agree
+from tools.results import save_records
+
+STATUS_SYMBOLS = {"pass": "✓", "fail": "✗", "error": "✗", "unchecked": "?"}
+STATUS_LABELS = {"pass": "passed", "fail": "failed", "error": "errors", "unchecked": "unchecked"}
+
+def check_result(case, actual):
+    """
+    Returns the status of a test from its result: pass, fail or unchecked.
+    """
+    if case.has_expected:
+        return "pass" if results_agree(case.expected, actual) else "fail"
+    if case.expected_text is not None and str(actual) == case.expected_text:
+        return "pass"
+    return "unchecked"
+
+def run_case(module, case, benchmark, namespace=None):
+    """
+    Runs one test and returns its record.
+
+    Args:
+        module: the loaded script
+        case: the TestCase to run
+        benchmark: time the test with test_runner.run_benchmark instead of a single call
+        namespace: the globals a demo expression is evaluated in, defaulting to the module's
+    """
+    record = {"name": case.name, "line": case.line, "expected": case.expected_text}
+    if case.expression is None:
+        call = getattr(module, case.name)
+    else:
+        code = compile(case.expression, module.__file__, "eval")
+        namespace = module.__dict__ if namespace is None else namespace
+        call = lambda: eval(code, namespace)
+
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            start_time = time.perf_counter()
+            actual = call()
+            record["time_us"] = (time.perf_counter() - start_time) * 1_000_000
+            if benchmark:
+                record["time_us"] = load_test_runner().run_benchmark(call)["median"]
+    except Exception as error:
+        record["status"] = "error"
+        record["actual"] = f"{type(error).__name__}: {error}"
+        return record
+
+    record["status"] = check_result(case, actual)
+    record["value"] = actual
+    record["actual"] = str(actual) if record["status"] == "pass" and not case.has_expected else repr(actual)
+    return record
+
+def run_script(path, cases, benchmark=False):
+    """
+    Loads one script and runs its tests. Called in a worker process.
+
+    Returns:
+        dict: the script path relative to the repository, its test records, or the error that
+            stopped the script from loading
+    """
+    result = {
+        "path": str(path.relative_to(REPO_ROOT)),
+        "function": solution_function_name(path),
+        "variant": variant_name(path),
+        "tests": [],
+    }
+    try:
+        module = load_module(path)
+    except Exception as error:
+        result["error"] = f"{type(error).__name__}: {error}"
+        return result
+
+    records = {case.line: run_case(module, case, benchmark) for case in cases if case.expression is None}
+    records.update(run_demos(module, path, [case for case in cases if case.expression is not None], benchmark))
+    result["tests"] = [records[case.line] for case in cases]
+    for record in result["tests"]:
+        # Results may hold objects of the script (Node) that do not pickle back to the parent
+        record.pop("value", None)
+    return result
+
+def run_demos(module, path, cases, benchmark):
+    """
+    Runs the demos of the main guard in order, in a copy of the module's namespace.
+
+    The statements between the demos (e.g. `numbers = [...]` before
+    `print(pair_sum(numbers, 11999)) # -> (5998, 5999)`) are executed so the demos see the
+    same variables as when the script is run. Other expression statements, the prints and
+    test calls, are skipped.
+
+    Returns:
+        dict: line number -> record of each demo
+    """
+    if not cases:
+        return {}
+    cases_by_line = {case.line: case for case in cases}
+    namespace = dict(module.__dict__)
+    records = {}
+
+    for node in module_statements(ast.parse(path.read_text())):
+        case = cases_by_line.get(node.lineno)
+        if case is not None:
+            records[case.line] = run_case(module, case, benchmark, namespace)
+            if isinstance(node, ast.Assign) and records[case.line]["status"] != "error":
+                namespace[case.name] = records[case.line]["value"]
+        elif not isinstance(node, (ast.Expr, ast.FunctionDef, ast.ClassDef)):
+            try:
+                with contextlib.redirect_stdout(io.StringIO()):
+                    exec(compile(ast.Module(body=[node], type_ignores=[]), str(path), "exec"), namespace)
+            except Exception:
+                # A broken setup statement shows up as an error in the demos that need it
+                pass
+    return records
+
+def select_scripts(patterns):
+    """
+    Returns the solution scripts whose path relative to the repository contains any of the patterns.
+    """
+    paths = solution_files()
+    if not patterns:
+        return paths
+    return [path for path in paths if any(pattern in str(path.relative_to(REPO_ROOT)) for pattern in patterns)]
+
+def run_all(paths, workers=None, benchmark=False):
+    """
+    Runs the tests of every script in a process pool.
+
+    Args:
+        paths: the scripts to test
+        workers: number of worker processes, defaults to the number of cores
+        benchmark: time each test with test_runner.run_benchmark instead of a single call
+
+    Returns:
+        list[dict]: one result per script, in the order of paths
+    """
+    jobs = [(path, discover_tests(path)) for path in paths]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(run_script, path, cases, benchmark) for path, cases in jobs]
+        return [future.result() for future in futures]
+
+def summarise(results):
+    """
+    Returns the number of tests per status over all scripts, with scripts that failed to load as errors.
+    """
+    counts = {status: 0 for status in STATUS_SYMBOLS}
+    for result in results:
+        if "error" in result:
+            counts["error"] += 1
+        for test in result["tests"]:
+            counts[test["status"]] += 1
+    return counts
+
+def test_records(results, benchmark=False):
+    """
+    Flattens the results into one record per test in the format of tools.results.
+
+    With benchmark the time of a test is the median of run_benchmark, otherwise the time of a
+    single call, stored as single_call so it is never compared as a median.
+    """
+    timing = "median" if benchmark else "single_call"
+    return [
+        {
+            "function": result["function"],
+            "variant": result["variant"],
+            "test": test["name"],
+            timing: test.get("time_us"),
+            "status": test["status"],
+        }
+        for result in results for test in result["tests"]
+    ]
+
+def format_report(results, elapsed, verbose=False):
+    lines = []
+    for result in results:
+        if "error" in result:
+            lines.append(f"✗ {result['path']}: could not load - {result['error']}")
+            continue
+        tests = result["tests"]
+        if not tests:
+            continue
+
+        statuses = [test["status"] for test in tests]
+        symbol = "✗" if "fail" in statuses or "error" in statuses else ("?" if "unchecked" in statuses else "✓")
+        counts = ", ".join(f"{statuses.count(status)} {STATUS_LABELS[status]}" for status in STATUS_SYMBOLS if status in statuses)
+        total_us = sum(test.get("time_us", 0) for test in tests)
+        lines.append(f"{symbol} {result['path']:<60} {counts:<32} {total_us:>12.2f} microseconds")
+
+        for test in tests:
+            if not verbose and test["status"] in ("pass", "unchecked"):
+                continue
+            detail = f"Result: {test['actual']}"
+            if test["status"] == "fail":
+                detail = f"Expected {test['expected']}, got {test['actual']}"
+            elif test["status"] == "error":
+                detail = test["actual"]
+            timing = f" ({test['time_us']:.2f} microseconds)" if "time_us" in test else ""
+            lines.append(f"    {STATUS_SYMBOLS[test['status']]} {test['name']}: {test['status'].upper()} - {detail}{timing}")
+
+    counts = summarise(results)
+    lines.append("")
+    lines.append(
+        f"{counts['pass']} passed, {counts['fail']} failed, {counts['error']} errors, "
+        f"{counts['unchecked']} unchecked in {len(results)} scripts ({elapsed:.2f} s)"
+    )
+    return "\n".join(lines)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the tests of every solution script in parallel.")
+    parser.add_argument("patterns", nargs="*", help="only run scripts whose path contains one of these")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="worker processes (default: one per core)")
+    parser.add_argument("--benchmark", action="store_true", help="time every test with test_runner.run_benchmark")
+    parser.add_argument("--verbose", "-v", action="store_true", help="list every test, not only failures")
+    parser.add_argument("--save", nargs="?", const="json", choices=["json", "csv"], help="store the timings in .benchmarks/")
+    arguments = parser.parse_args(argv)
+
+    start_time = time.perf_counter()
+    results = run_all(select_scripts(arguments.patterns), arguments.workers, arguments.benchmark)
+    print(format_report(results, time.perf_counter() - start_time, arguments.verbose))
+    if arguments.save:
+        print(f"saved to {save_records(test_records(results, arguments.benchmark), 'run_all', arguments.save)}")
+
+    counts = summarise(results)
+    return 1 if counts["fail"] or counts["error"] else 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
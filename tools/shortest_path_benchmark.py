@@ -0,0 +1,106 @@
+"""
+Races the one sided breadth first search of shortest_path against the bidirectional search.
+
+Both searches run on the same prebuilt adjacency list, so the times are the searches alone
+(construct_graph is the same in both scripts). Every query is a pair of random nodes of a
+random sparse graph with the given average degree, and the explored column counts the nodes
+whose neighbours each search looked at.
+
+Usage (from the repository root):
+    python -m tools.shortest_path_benchmark                         # 10k and 100k nodes, degree 4 and 16
+    python -m tools.shortest_path_benchmark --nodes 1000000 --degrees 8 --queries 20
+"""
+import argparse
+import random
+import time
+from collections import deque
+
+from tools import generators
+from tools.discovery import REPO_ROOT, load_module
+
+DEFAULT_NODES = [10_000, 100_000]
+DEFAULT_DEGREES = [4, 16]
+
+class CountingGraph(dict):
+    """
+    An adjacency list that counts how many nodes had their neighbours looked up.
+    """
+    def __init__(self, graph):
+        super().__init__(graph)
+        self.explored = 0
+
+    def __getitem__(self, node):
+        self.explored += 1
+        return super().__getitem__(node)
+
+def one_sided_search(graph, node_A, node_B):
+    """
+    The breadth first search of 20250410_shortest_path.py over a prebuilt adjacency list.
+    """
+    visited = {node_A}
+    queue = deque([(node_A, 0)])
+    while queue:
+        node, distance = queue.popleft()
+        if node == node_B:
+            return distance
+        for neighbour in graph[node]:
+            if neighbour not in visited:
+                visited.add(neighbour)
+                queue.append((neighbour, distance + 1))
+    return -1
+
+def compare(nodes, degree, queries, seed=0):
+    """
+    Runs both searches on the same queries of one random graph.
+
+    Returns:
+        dict: total seconds and explored nodes of each search, and whether every answer agreed
+    """
+    bidirectional = load_module(REPO_ROOT / "05_graphs" / "20261018_shortest_path_bidirectional.py")
+    rng = random.Random(f"{nodes}:{degree}:{seed}")
+    edges = generators.random_edges(nodes, nodes * degree // 2, seed=rng)
+    graph = bidirectional.construct_graph(edges)
+    labels = list(graph)
+    pairs = [(rng.choice(labels), rng.choice(labels)) for _ in range(queries)]
+
+    record = {"nodes": nodes, "degree": degree, "queries": queries, "agrees": True}
+    answers = {}
+    for name, search in (("one_sided", one_sided_search), ("bidirectional", bidirectional.bidirectional_search)):
+        counting = CountingGraph(graph)
+        start_time = time.perf_counter()
+        answers[name] = [search(counting, node_A, node_B) for node_A, node_B in pairs]
+        record[f"{name}_s"] = time.perf_counter() - start_time
+        record[f"{name}_explored"] = counting.explored
+    record["agrees"] = answers["one_sided"] == answers["bidirectional"]
+    record["mean_distance"] = sum(answer for answer in answers["one_sided"] if answer > 0) / max(1, sum(answer > 0 for answer in answers["one_sided"]))
+    return record
+
+def format_table(records):
+    header = (
+        f"{'nodes':>9} {'degree':>6} {'queries':>7} {'distance':>8} {'one sided ms':>13} {'bidir ms':>9} "
+        f"{'speedup':>8} {'one sided explored':>19} {'bidir explored':>15}  agrees"
+    )
+    lines = [header, "-" * len(header)]
+    for record in records:
+        queries = record["queries"]
+        lines.append(
+            f"{record['nodes']:>9} {record['degree']:>6} {queries:>7} {record['mean_distance']:>8.1f} "
+            f"{record['one_sided_s'] * 1000 / queries:>13.2f} {record['bidirectional_s'] * 1000 / queries:>9.2f} "
+            f"{record['one_sided_s'] / record['bidirectional_s']:>7.1f}x "
+            f"{record['one_sided_explored'] // queries:>19} {record['bidirectional_explored'] // queries:>15}  "
+            f"{'yes' if record['agrees'] else 'NO'}"
+        )
+    return "\n".join(lines)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Race one sided and bidirectional shortest_path searches.")
+    parser.add_argument("--nodes", nargs="+", type=int, default=DEFAULT_NODES, help="numbers of nodes")
+    parser.add_argument("--degrees", nargs="+", type=int, default=DEFAULT_DEGREES, help="average degrees")
+    parser.add_argument("--queries", type=int, default=50, help="random node pairs per graph")
+    parser.add_argument("--seed", type=int, default=0, help="seed for the graphs and queries")
+    arguments = parser.parse_args(argv)
+    records = [compare(nodes, degree, arguments.queries, arguments.seed) for nodes in arguments.nodes for degree in arguments.degrees]
+    print(format_table(records))
+
+if __name__ == "__main__":
+    main()